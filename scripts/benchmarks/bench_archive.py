@@ -0,0 +1,101 @@
+"""Benchmark archiving soft-deleted jobs: per-row archive_job vs set-based.
+
+Usage:
+    python -m scripts.benchmarks.bench_archive --rows 100000
+    python -m scripts.benchmarks.bench_archive --database-url postgresql+asyncpg://localhost/job_intel_bench
+
+The per-row baseline is timed on ``--baseline-rows`` only (default 2000),
+since it commits once per job.
+"""
+
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from unittest.mock import AsyncMock
+
+from sqlalchemy import insert, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.db.models import Base, Job
+from src.services.freshness import FreshnessManager
+
+
+async def seed(engine, rows: int, batch: int = 5_000) -> None:
+    deleted_at = datetime.utcnow() - timedelta(days=365)
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        for start in range(0, rows, batch):
+            await conn.execute(
+                insert(Job),
+                [
+                    {
+                        "source": "bench",
+                        "external_id": f"ext-{i}",
+                        "title": f"Engineer {i}",
+                        "tags": {"skills": ["python"]},
+                        "fetched_at": deleted_at,
+                        "deleted_at": deleted_at,
+                        "is_remote": False,
+                        "is_valid": False,
+                    }
+                    for i in range(start, min(start + batch, rows))
+                ],
+            )
+
+
+async def per_row(session: AsyncSession, manager: FreshnessManager) -> int:
+    result = await session.execute(select(Job))
+    jobs = result.scalars().all()
+    for job in jobs:
+        await manager.archive_job(job)
+    return len(jobs)
+
+
+async def run(database_url: str, rows: int, baseline_rows: int, chunk: int) -> None:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    print(f"{'mode':>10} {'rows':>8} {'seconds':>8} {'rows/s':>10}")
+    if baseline_rows:
+        await seed(engine, baseline_rows)
+        async with session_factory() as session:
+            manager = FreshnessManager(session, AsyncMock())
+            started = time.perf_counter()
+            archived = await per_row(session, manager)
+            elapsed = time.perf_counter() - started
+        print(
+            f"{'per-row':>10} {archived:>8} {elapsed:>8.2f} {archived / elapsed:>10.0f}"
+        )
+
+    await seed(engine, rows)
+    async with session_factory() as session:
+        manager = FreshnessManager(session, AsyncMock())
+        started = time.perf_counter()
+        result = await manager.archive_expired(budget_seconds=3600, chunk_size=chunk)
+        elapsed = time.perf_counter() - started
+    print(
+        f"{'set-based':>10} {result['archived']:>8} {elapsed:>8.2f} "
+        f"{result['rows_per_second']:>10.0f}"
+    )
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///./bench-archive.db"
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--baseline-rows", type=int, default=2_000)
+    parser.add_argument("--chunk-size", type=int, default=5_000)
+    args = parser.parse_args()
+    asyncio.run(run(args.database_url, args.rows, args.baseline_rows, args.chunk_size))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,141 @@
+"""Benchmark WebSocket broadcast latency with many simulated connections.
+
+Usage:
+    python -m scripts.benchmarks.bench_broadcast --clients 10000
+    python -m scripts.benchmarks.bench_broadcast --clients 10000 --slow 500 --stalled 20
+
+Simulated sockets sleep for their write latency instead of doing network I/O:
+most clients take 0-2ms per message, ``--slow`` clients take 50-200ms and
+``--stalled`` clients never finish a write. Compares the sequential loop the
+manager used to run against the per-client queues, reporting how long
+``broadcast`` blocks the caller and how long until healthy clients have
+received every message.
+"""
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import time
+from typing import List
+
+from src.api.websockets.updates import ConnectionManager
+
+
+class SimulatedSocket:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.received = 0
+        self.received_at: List[float] = []
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload: str):
+        await asyncio.sleep(self.delay)
+        self.received += 1
+        self.received_at.append(time.monotonic())
+
+    async def close(self, code: int = 1000):
+        pass
+
+
+def make_sockets(args, rng: random.Random) -> List[SimulatedSocket]:
+    sockets = [SimulatedSocket(rng.uniform(0, 0.002)) for _ in range(args.clients)]
+    picked = rng.sample(sockets, args.slow + args.stalled)
+    for sock in picked[: args.slow]:
+        sock.delay = rng.uniform(0.05, 0.2)
+    for sock in picked[args.slow :]:
+        sock.delay = 3600
+    return sockets
+
+
+def percentile(values: List[float], pct: float) -> float:
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * pct))]
+
+
+async def bench_sequential(sockets, payload: str, messages: int) -> dict:
+    """The pre-queue manager: await each socket in turn"""
+    healthy = [s for s in sockets if s.delay < 3600]
+    blocked = []
+    started = time.monotonic()
+    for _ in range(messages):
+        t0 = time.monotonic()
+        for sock in healthy:  # a stalled socket would block forever
+            await sock.send_text(payload)
+        blocked.append(time.monotonic() - t0)
+    return {
+        "broadcast_ms": round(statistics.mean(blocked) * 1000, 2),
+        "all_delivered_s": round(time.monotonic() - started, 2),
+    }
+
+
+async def bench_queued(sockets, payload: str, messages: int, timeout: float) -> dict:
+    manager = ConnectionManager(send_timeout=timeout)
+    for sock in sockets:
+        await manager.connect(sock)
+    fast = [s for s in sockets if s.delay < 0.05]
+
+    blocked = []
+    started = time.monotonic()
+    for _ in range(messages):
+        t0 = time.monotonic()
+        await manager.broadcast_text(payload)
+        blocked.append(time.monotonic() - t0)
+        await asyncio.sleep(0)
+    while any(s.received < messages for s in fast):
+        await asyncio.sleep(0.01)
+    fast_done = time.monotonic() - started
+    lags = [c["lag_seconds"] for c in manager.stats()]
+
+    for sock in list(manager.active_connections):
+        manager.disconnect(sock)
+    return {
+        "broadcast_ms": round(statistics.mean(blocked) * 1000, 2),
+        "fast_delivered_s": round(fast_done, 2),
+        "fast_last_message_p99_s": round(
+            percentile([s.received_at[-1] - started for s in fast], 0.99), 3
+        ),
+        "max_lag_s": round(max(lags, default=0.0), 3),
+    }
+
+
+async def run(args) -> None:
+    payload = json.dumps(
+        {
+            "type": "jobs_changed",
+            "source": "bench",
+            "new": [{"id": i, "title": f"Engineer {i}"} for i in range(50)],
+            "updated": [],
+            "removed": [],
+        }
+    )
+    rng = random.Random(args.clients)
+
+    queued = await bench_queued(
+        make_sockets(args, rng), payload, args.messages, args.send_timeout
+    )
+    print(f"queued      {json.dumps(queued)}")
+    if not args.skip_sequential:
+        sequential = await bench_sequential(
+            make_sockets(args, rng), payload, args.messages
+        )
+        print(f"sequential  {json.dumps(sequential)} (stalled clients skipped)")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=10_000)
+    parser.add_argument("--slow", type=int, default=200)
+    parser.add_argument("--stalled", type=int, default=20)
+    parser.add_argument("--messages", type=int, default=5)
+    parser.add_argument("--send-timeout", type=float, default=2.0)
+    parser.add_argument("--skip-sequential", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Microbenchmark parsers.classify against per-keyword regex scans.
+
+Usage:
+    python -m scripts.benchmarks.bench_classify --titles 100000
+"""
+import argparse
+import random
+import re
+import time
+from typing import Iterable, List
+
+from src.core.constants import INNOVATION_KEYWORDS, SKILL_KEYWORDS, WEIRD_KEYWORDS
+from src.services.parsers import classify
+
+FILLER = [
+    "senior",
+    "engineer",
+    "developer",
+    "manager",
+    "analyst",
+    "toronto",
+    "remote",
+    "hybrid",
+    "team",
+    "lead",
+    "platform",
+    "canada",
+]
+
+
+def legacy_scan(title: str, tags: Iterable[str], keywords) -> List[str]:
+    """The original per-keyword implementation of compute_skills & co."""
+    lower = f"{title} {', '.join([str(tag) for tag in tags])}".lower()
+    found = []
+    for key, label in keywords.items():
+        if re.search(rf"\b{re.escape(key)}\b", lower):
+            found.append(label)
+    return sorted(set(found))
+
+
+def make_titles(count: int, seed: int = 7):
+    rng = random.Random(seed)
+    vocabulary = (
+        FILLER * 4
+        + list(SKILL_KEYWORDS)
+        + list(INNOVATION_KEYWORDS)
+        + list(WEIRD_KEYWORDS)
+    )
+    titles = []
+    for _ in range(count):
+        words = rng.choices(vocabulary, k=rng.randint(3, 8))
+        tags = rng.choices(vocabulary, k=rng.randint(0, 12))
+        titles.append((" ".join(words).title(), tags))
+    return titles
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument("--titles", type=int, default=100_000)
+    args = parser.parse_args()
+
+    titles = make_titles(args.titles)
+
+    started = time.perf_counter()
+    legacy = [
+        (
+            legacy_scan(t, tags, SKILL_KEYWORDS),
+            legacy_scan(t, tags, INNOVATION_KEYWORDS),
+            legacy_scan(t, tags, WEIRD_KEYWORDS),
+        )
+        for t, tags in titles
+    ]
+    legacy_elapsed = time.perf_counter() - started
+
+    started = time.perf_counter()
+    compiled = [classify(t, tags) for t, tags in titles]
+    compiled_elapsed = time.perf_counter() - started
+
+    mismatches = sum(
+        1
+        for old, new in zip(legacy, compiled)
+        if old != (new.skills, new.innovations, new.weird)
+    )
+
+    print(f"titles:     {args.titles}")
+    print(f"legacy:     {legacy_elapsed:8.3f}s")
+    print(f"classify:   {compiled_elapsed:8.3f}s")
+    print(f"speedup:    {legacy_elapsed / compiled_elapsed:8.1f}x")
+    print(f"mismatches: {mismatches}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,151 @@
+"""Benchmark HEAD link-validation throughput: shared pool vs. a client per call.
+
+Usage:
+    python -m scripts.benchmarks.bench_http_pool --checks 2000
+    python -m scripts.benchmarks.bench_http_pool --checks 5000 --hosts 20 --latency 0.01
+
+Starts ``--hosts`` local keep-alive HTTP servers in a child process (so the
+servers don't compete with the client for the event loop) and runs
+FreshnessManager.validate_jobs over ``--checks`` job URLs spread across them,
+once with the shared pooled client and once with a fresh httpx.AsyncClient
+per HEAD request (what a caller without a shared client ends up doing).
+"""
+
+import argparse
+import asyncio
+import json
+import multiprocessing
+import time
+from typing import List
+
+import httpx
+
+from src.core.http import create_http_client
+from src.db.models import Job
+from src.services.concurrency import AdaptiveConcurrencyController
+from src.services.freshness import FreshnessManager
+from src.services.resource_monitor import aggregate_statuses
+
+
+class KeepAliveServer:
+    def __init__(self, host: str, latency: float, connections):
+        self.host = host
+        self.latency = latency
+        # Shared with the benchmarking process
+        self.connections = connections
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        return f"http://{self.host}:{self._server.sockets[0].getsockname()[1]}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, self.host, 0)
+
+    async def _handle(self, reader, writer):
+        with self.connections.get_lock():
+            self.connections.value += 1
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                while (await reader.readline()) not in (b"\r\n", b"\n", b""):
+                    pass
+                if self.latency:
+                    await asyncio.sleep(self.latency)
+                writer.write(b"HTTP/1.1 200 OK\r\nContent-Length: 0\r\n\r\n")
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+def serve(hosts: int, latency: float, connections, urls) -> None:
+    async def main():
+        # One loopback address per host, so per-host limits apply per server
+        servers = [
+            KeepAliveServer(f"127.0.0.{i + 1}", latency, connections)
+            for i in range(hosts)
+        ]
+        for server in servers:
+            await server.start()
+        urls.send([server.url for server in servers])
+        await asyncio.Event().wait()
+
+    asyncio.run(main())
+
+
+class SteadyMonitor:
+    """Always NORMAL, so adaptive limits stay at --concurrency"""
+
+    view = aggregate_statuses("bench", [])
+
+    def get_cluster_view(self):
+        return self.view
+
+
+class PerCallClient:
+    """Opens and closes a client (and so a connection) for every request"""
+
+    async def head(self, url: str) -> httpx.Response:
+        async with httpx.AsyncClient(timeout=10.0, follow_redirects=True) as client:
+            return await client.head(url)
+
+
+async def bench(label: str, http, jobs: List[Job], connections, args) -> dict:
+    connections.value = 0
+    manager = FreshnessManager(
+        None,
+        http,
+        concurrency=args.concurrency,
+        per_host_concurrency=args.per_host,
+        controller=AdaptiveConcurrencyController(SteadyMonitor()),
+    )
+    started = time.perf_counter()
+    verdicts = await manager.validate_jobs(jobs)
+    elapsed = time.perf_counter() - started
+    return {
+        "client": label,
+        "checks": len(verdicts),
+        "checks_per_second": round(len(verdicts) / elapsed, 1),
+        "seconds": round(elapsed, 2),
+        "connections": connections.value,
+    }
+
+
+async def run(args, urls: List[str], connections) -> None:
+    jobs = [Job(id=i, url=f"{urls[i % len(urls)]}/job/{i}") for i in range(args.checks)]
+    async with create_http_client() as pooled:
+        result = await bench("pooled", pooled, jobs, connections, args)
+        result["reuse_ratio"] = round(pooled._transport.reuse_ratio, 3)
+        print(json.dumps(result))
+    print(json.dumps(await bench("per_call", PerCallClient(), jobs, connections, args)))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--checks", type=int, default=2000)
+    parser.add_argument("--hosts", type=int, default=10)
+    parser.add_argument("--latency", type=float, default=0.005)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--per-host", type=int, default=2)
+    args = parser.parse_args()
+
+    connections = multiprocessing.Value("i", 0)
+    receiver, sender = multiprocessing.Pipe(duplex=False)
+    server = multiprocessing.Process(
+        target=serve,
+        args=(args.hosts, args.latency, connections, sender),
+        daemon=True,
+    )
+    server.start()
+    try:
+        asyncio.run(run(args, receiver.recv(), connections))
+    finally:
+        server.terminate()
+
+
+if __name__ == "__main__":
+    main()
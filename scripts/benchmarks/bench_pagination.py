@@ -0,0 +1,94 @@
+"""Benchmark GET /jobs page latency under OFFSET vs keyset pagination.
+
+Usage:
+    python -m scripts.benchmarks.bench_pagination --rows 100000 --pages 1 100 1000
+    python -m scripts.benchmarks.bench_pagination --database-url postgresql+asyncpg://localhost/job_intel_bench
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import insert
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.db.models import Base, Job
+from src.services.job_service import JobService
+
+PAGE_SIZE = 50
+
+
+async def seed(engine, rows: int, batch: int = 5_000) -> None:
+    now = datetime.utcnow()
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+        for start in range(0, rows, batch):
+            await conn.execute(
+                insert(Job),
+                [
+                    {
+                        "source": "bench",
+                        "external_id": f"ext-{i}",
+                        "title": f"Engineer {i}",
+                        "tags": {},
+                        "fetched_at": now - timedelta(seconds=i // 3),
+                        "is_remote": False,
+                        "is_valid": True,
+                    }
+                    for i in range(start, min(start + batch, rows))
+                ],
+            )
+
+
+async def cursor_for_page(service: JobService, page: int):
+    """Walk to the page's cursor once; not part of the timed request"""
+    cursor = None
+    for _ in range(page - 1):
+        _, cursor = await service.list_jobs_page(limit=PAGE_SIZE, cursor=cursor)
+    return cursor
+
+
+async def run(database_url: str, rows: int, pages: List[int], repeat: int) -> None:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    await seed(engine, rows)
+
+    print(f"{'page':>6} {'offset ms':>10} {'keyset ms':>10}")
+    async with session_factory() as session:
+        service = JobService(session)
+        for page in pages:
+            cursor = await cursor_for_page(service, page)
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                await service.list_jobs(skip=(page - 1) * PAGE_SIZE, limit=PAGE_SIZE)
+            offset_ms = (time.perf_counter() - started) / repeat * 1000
+
+            started = time.perf_counter()
+            for _ in range(repeat):
+                await service.list_jobs(cursor=cursor, limit=PAGE_SIZE)
+            keyset_ms = (time.perf_counter() - started) / repeat * 1000
+
+            print(f"{page:>6} {offset_ms:>10.2f} {keyset_ms:>10.2f}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///./bench-pagination.db"
+    )
+    parser.add_argument("--rows", type=int, default=100_000)
+    parser.add_argument("--pages", type=int, nargs="+", default=[1, 1000])
+    parser.add_argument("--repeat", type=int, default=20)
+    args = parser.parse_args()
+    asyncio.run(run(args.database_url, args.rows, args.pages, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
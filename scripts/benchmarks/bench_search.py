@@ -0,0 +1,98 @@
+"""Benchmark GET /jobs/search latency against table size.
+
+Usage:
+    python -m scripts.benchmarks.bench_search --rows 1000000
+    python -m scripts.benchmarks.bench_search --database-url postgresql+asyncpg://localhost/job_intel_bench
+
+Seeds through JobService.bulk_upsert so the search index is maintained by
+the same path as production scrapes, then times rare, medium and common terms.
+"""
+import argparse
+import asyncio
+import random
+import time
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.db.models import Base, Job
+from src.services.job_service import JobService
+
+SENIORITY = ["Junior", "Senior", "Staff", "Principal", "Lead"]
+ROLES = ["Engineer", "Developer", "Analyst", "Designer", "Scientist", "Manager"]
+DOMAINS = ["Data", "Platform", "Mobile", "Security", "Payments", "Search", "Robotics"]
+COMPANIES = [f"Company {i}" for i in range(500)]
+TOKENS = ["python", "aws", "genai", "java", "react", "kubernetes", "rust", "go"]
+QUERIES = {
+    "rare": "robotics principal scientist",
+    "medium": "security developer",
+    "common": "engineer",
+    "prefix": "platform eng",
+}
+
+
+def make_jobs(start: int, count: int, rng: random.Random) -> List[Job]:
+    now = datetime.utcnow()
+    return [
+        Job(
+            source="bench",
+            external_id=f"ext-{i}",
+            title=f"{rng.choice(SENIORITY)} {rng.choice(DOMAINS)} {rng.choice(ROLES)}",
+            company=rng.choice(COMPANIES),
+            location="Toronto, ON",
+            tags={"raw": rng.sample(TOKENS, 2)},
+            fetched_at=now - timedelta(seconds=i),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+async def seed(engine, session_factory, rows: int, batch: int = 10_000) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.drop_all)
+        await conn.run_sync(Base.metadata.create_all)
+    rng = random.Random(rows)
+    for start in range(0, rows, batch):
+        async with session_factory() as session:
+            await JobService(session).bulk_upsert(
+                make_jobs(start, min(batch, rows - start), rng)
+            )
+
+
+async def run(database_url: str, rows: int, repeat: int) -> None:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+    started = time.perf_counter()
+    await seed(engine, session_factory, rows)
+    print(f"seeded {rows} rows in {time.perf_counter() - started:.1f}s")
+
+    print(f"{'query':>8} {'q':>30} {'ms':>8}")
+    async with session_factory() as session:
+        service = JobService(session)
+        for name, q in QUERIES.items():
+            await service.search_jobs(q, limit=50)
+            started = time.perf_counter()
+            for _ in range(repeat):
+                await service.search_jobs(q, limit=50)
+            elapsed_ms = (time.perf_counter() - started) / repeat * 1000
+            print(f"{name:>8} {q:>30} {elapsed_ms:>8.2f}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///./bench-search.db"
+    )
+    parser.add_argument("--rows", type=int, default=1_000_000)
+    parser.add_argument("--repeat", type=int, default=10)
+    args = parser.parse_args()
+    asyncio.run(run(args.database_url, args.rows, args.repeat))
+
+
+if __name__ == "__main__":
+    main()
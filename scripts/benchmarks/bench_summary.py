@@ -0,0 +1,111 @@
+"""Benchmark SummaryGenerator memory and latency against table size.
+
+Usage:
+    python -m scripts.benchmarks.bench_summary --sizes 10000 100000 1000000
+    python -m scripts.benchmarks.bench_summary --database-url postgresql+asyncpg://localhost/job_intel_bench
+
+For comparison it also times the previous approach of loading every valid
+job as an ORM object (``--skip-orm-baseline`` to omit it at large sizes).
+"""
+import argparse
+import asyncio
+import random
+import time
+import tracemalloc
+from datetime import datetime, timedelta
+from typing import List
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.db.models import Base, Job
+from src.services.job_service import JobService
+from src.services.summary_generator import SummaryGenerator
+
+DEFAULT_SIZES = [10_000, 100_000, 1_000_000]
+LOCATIONS = ["Remote", "Toronto, ON", "Vancouver, BC", "Ottawa", "Canada", "Austin"]
+TOKENS = ["python", "aws", "genai", "java", "react", "futurist", "policy", "data"]
+
+
+def make_jobs(start: int, count: int, rng: random.Random) -> List[Job]:
+    now = datetime.utcnow()
+    return [
+        Job(
+            source="bench",
+            external_id=f"ext-{i}",
+            title=f"Engineer {i}",
+            company="Bench Corp",
+            location=rng.choice(LOCATIONS),
+            tags={"raw": rng.sample(TOKENS, 3)},
+            url=f"https://example.com/jobs/{i}",
+            is_remote=rng.random() < 0.3,
+            fetched_at=now - timedelta(minutes=i),
+        )
+        for i in range(start, start + count)
+    ]
+
+
+async def seed(session_factory, size: int, batch: int = 10_000) -> None:
+    rng = random.Random(size)
+    for start in range(0, size, batch):
+        async with session_factory() as session:
+            await JobService(session).bulk_upsert(
+                make_jobs(start, min(batch, size - start), rng)
+            )
+
+
+async def orm_baseline(session: AsyncSession) -> int:
+    result = await session.execute(
+        select(Job).where(Job.is_valid == True, Job.deleted_at.is_(None))
+    )
+    jobs = result.scalars().all()
+    return sum(1 for j in jobs if j.is_remote)
+
+
+async def measure(session_factory, fn) -> tuple:
+    async with session_factory() as session:
+        tracemalloc.start()
+        started = time.perf_counter()
+        await fn(session)
+        elapsed = time.perf_counter() - started
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return elapsed, peak / (1024**2)
+
+
+async def run(database_url: str, sizes: List[int], skip_baseline: bool) -> None:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    print(f"{'rows':>9} {'mode':>10} {'seconds':>9} {'peak MiB':>9}")
+    for size in sizes:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+        await seed(session_factory, size)
+
+        modes = [("aggregate", lambda s: SummaryGenerator(s).generate())]
+        if not skip_baseline:
+            modes.append(("orm-load", orm_baseline))
+        for mode, fn in modes:
+            elapsed, peak = await measure(session_factory, fn)
+            print(f"{size:>9} {mode:>10} {elapsed:>9.3f} {peak:>9.1f}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///./bench-summary.db"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    parser.add_argument("--skip-orm-baseline", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(run(args.database_url, args.sizes, args.skip_orm_baseline))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+"""Benchmark JobService bulk upsert throughput.
+
+Usage:
+    python -m scripts.benchmarks.bench_upsert
+    python -m scripts.benchmarks.bench_upsert --database-url postgresql+asyncpg://localhost/job_intel_bench
+
+Each size is run twice against a fresh schema: the first pass inserts every
+row, the second pass updates every row through the ON CONFLICT branch.
+"""
+import argparse
+import asyncio
+import time
+from datetime import datetime
+from typing import List
+
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.db.models import Base, Job
+from src.services.job_service import JobService
+
+DEFAULT_SIZES = [1_000, 10_000, 100_000]
+
+
+def make_jobs(count: int, revision: int) -> List[Job]:
+    now = datetime.utcnow()
+    return [
+        Job(
+            source="bench",
+            external_id=f"ext-{i}",
+            title=f"Engineer {i} rev {revision}",
+            company="Bench Corp",
+            location="Toronto",
+            salary_text="$100k",
+            tags={"raw": ["python", "aws"]},
+            url=f"https://example.com/jobs/{i}",
+            fetched_at=now,
+        )
+        for i in range(count)
+    ]
+
+
+async def run(database_url: str, sizes: List[int]) -> None:
+    engine = create_async_engine(database_url)
+    session_factory = async_sessionmaker(
+        engine, class_=AsyncSession, expire_on_commit=False
+    )
+
+    print(f"{'rows':>8} {'phase':>7} {'seconds':>9} {'rows/s':>10}")
+    for size in sizes:
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.drop_all)
+            await conn.run_sync(Base.metadata.create_all)
+
+        for phase, revision in (("insert", 0), ("update", 1)):
+            jobs = make_jobs(size, revision)
+            async with session_factory() as session:
+                started = time.perf_counter()
+                result = await JobService(session).bulk_upsert(jobs)
+                elapsed = time.perf_counter() - started
+            assert result.total == size
+            print(f"{size:>8} {phase:>7} {elapsed:>9.3f} {size / elapsed:>10.0f}")
+
+    await engine.dispose()
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser()
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///./bench-upsert.db"
+    )
+    parser.add_argument("--sizes", type=int, nargs="+", default=DEFAULT_SIZES)
+    args = parser.parse_args()
+    asyncio.run(run(args.database_url, args.sizes))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,72 @@
+"""Benchmark per-task overhead: a loop per task vs. the persistent worker loop.
+
+Usage:
+    python -m scripts.benchmarks.bench_worker_loop --tasks 1000
+    python -m scripts.benchmarks.bench_worker_loop --database-url postgresql+asyncpg://localhost/job_intel_bench
+
+Each no-op task does what every real task does before its own work: opens a
+session, runs ``SELECT 1`` and takes the shared HTTP client. ``per-task``
+runs it through ``async_to_sync`` and, like a task on a throwaway loop must,
+releases the engine pool and HTTP client bound to that loop before returning;
+``persistent`` submits it to a WorkerRuntime, where both stay open.
+"""
+
+import argparse
+import time
+
+from asgiref.sync import async_to_sync
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from src.core.http import close_http_clients, get_http_client
+from src.core.runtime import WorkerRuntime
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument(
+        "--database-url", default="sqlite+aiosqlite:///./bench-worker-loop.db"
+    )
+    parser.add_argument("--tasks", type=int, default=1000)
+    args = parser.parse_args()
+
+    engine = create_async_engine(args.database_url)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+
+    async def noop_task() -> None:
+        async with session_factory() as session:
+            await session.execute(text("SELECT 1"))
+        get_http_client()
+
+    async def noop_task_on_own_loop() -> None:
+        try:
+            await noop_task()
+        finally:
+            # Connections must not outlive the loop they were opened on
+            await close_http_clients()
+            await engine.dispose()
+
+    def timed(label: str, call) -> None:
+        started = time.perf_counter()
+        for _ in range(args.tasks):
+            call()
+        elapsed = time.perf_counter() - started
+        print(
+            f"{label:>10} {args.tasks:>6} {elapsed:>8.2f}s "
+            f"{elapsed / args.tasks * 1e6:>9.0f} us/task "
+            f"{args.tasks / elapsed:>8.0f} tasks/s"
+        )
+
+    timed("per-task", async_to_sync(noop_task_on_own_loop))
+
+    runtime = WorkerRuntime()
+    runtime.start()
+    try:
+        timed("persistent", lambda: runtime.run(noop_task))
+        runtime.run(engine.dispose)
+    finally:
+        runtime.stop()
+
+
+if __name__ == "__main__":
+    main()
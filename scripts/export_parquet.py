@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Write a Parquet snapshot of jobs and archived_jobs.
+
+Usage:
+    python -m scripts.export_parquet
+    python -m scripts.export_parquet --full --output-dir /srv/job-intel/parquet
+
+Without ``--full`` only rows changed since the previous snapshot in the same
+output directory are written.
+"""
+
+import argparse
+import asyncio
+import json
+
+from src.core.config import settings
+from src.db.session import AsyncSessionLocal
+from src.services.parquet_export import ParquetSnapshotExporter
+
+
+async def run(output_dir: str, row_group_size: int, full: bool) -> dict:
+    async with AsyncSessionLocal() as session:
+        exporter = ParquetSnapshotExporter(session, output_dir, row_group_size)
+        return await exporter.export(full=full)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output-dir", default=settings.PARQUET_EXPORT_DIR)
+    parser.add_argument(
+        "--row-group-size", type=int, default=settings.PARQUET_ROW_GROUP_SIZE
+    )
+    parser.add_argument(
+        "--full", action="store_true", help="ignore the watermark, export every row"
+    )
+    args = parser.parse_args()
+    counts = asyncio.run(run(args.output_dir, args.row_group_size, args.full))
+    print(json.dumps(counts))
+
+
+if __name__ == "__main__":
+    main()
@@ -332,6 +332,22 @@ def init_db(conn: sqlite3.Connection) -> None:
         ON jobs (source, external_id);
         """
     )
+    conn.execute(
+        """
+        CREATE TABLE IF NOT EXISTS job_labels (
+            job_id INTEGER NOT NULL,
+            kind TEXT NOT NULL,
+            label TEXT NOT NULL,
+            PRIMARY KEY (job_id, kind, label)
+        );
+        """
+    )
+    conn.execute(
+        """
+        CREATE INDEX IF NOT EXISTS idx_job_labels_kind_label
+        ON job_labels (kind, label);
+        """
+    )
     conn.execute(
         """
         CREATE TABLE IF NOT EXISTS metrics (
@@ -383,6 +399,19 @@ def upsert_job(conn: sqlite3.Connection, job: Dict) -> None:
             1 if job.get("is_remote") else 0,
         ),
     )
+    job_id = conn.execute(
+        "SELECT id FROM jobs WHERE source = ? AND external_id = ?",
+        (job["source"], job["external_id"]),
+    ).fetchone()[0]
+    conn.execute("DELETE FROM job_labels WHERE job_id = ?", (job_id,))
+    conn.executemany(
+        "INSERT INTO job_labels (job_id, kind, label) VALUES (?, ?, ?)",
+        [
+            (job_id, kind, label)
+            for kind, labels in job.get("labels", {}).items()
+            for label in labels
+        ],
+    )
 
 
 def parse_title_company(text: str) -> Tuple[str, Optional[str]]:
@@ -487,6 +516,12 @@ def fetch_tavily_jobs(
             if ext_id in seen:
                 continue
             seen.add(ext_id)
+            # Classify once at ingest; generate_summary reads the stored labels
+            labels = {
+                "skills": compute_skills(title, tags),
+                "innovations": compute_innovations(title, tags),
+                "weird": compute_weird_tags(title, tags),
+            }
             job = {
                 "source": SOURCE_TAVILY,
                 "external_id": ext_id,
@@ -502,6 +537,7 @@ def fetch_tavily_jobs(
                 "published_at": result.get("published_date"),
                 "fetched_at": now,
                 "is_remote": "remote" in (title_text + " " + content).lower(),
+                "labels": labels,
             }
             jobs.append(job)
         time.sleep(0.5)
@@ -552,13 +588,26 @@ def salary_rank(
 
 def generate_summary(conn: sqlite3.Connection) -> Tuple[Dict, List[Dict], Dict, Dict]:
     cursor = conn.execute(
-        "SELECT source, title, company, location, salary_min, salary_max, salary_text, category, tags, url, published_at FROM jobs"
+        "SELECT id, source, title, company, location, salary_min, salary_max, salary_text, category, url, published_at FROM jobs"
     )
     rows = cursor.fetchall()
     total = len(rows)
     locations: Dict[str, int] = {}
-    skill_counts: Dict[str, int] = {}
-    innovation_counts: Dict[str, int] = {}
+    skill_counts = dict(
+        conn.execute(
+            "SELECT label, COUNT(*) FROM job_labels WHERE kind = 'skills' GROUP BY label"
+        ).fetchall()
+    )
+    innovation_counts = dict(
+        conn.execute(
+            "SELECT label, COUNT(*) FROM job_labels WHERE kind = 'innovations' GROUP BY label"
+        ).fetchall()
+    )
+    labels_by_job: Dict[int, Dict[str, List[str]]] = {}
+    for job_id, kind, label in conn.execute(
+        "SELECT job_id, kind, label FROM job_labels ORDER BY job_id, kind, label"
+    ):
+        labels_by_job.setdefault(job_id, {}).setdefault(kind, []).append(label)
     title_counts: Dict[str, int] = {}
     innovation_roles: List[Dict] = []
     weird_roles: List[Dict] = []
@@ -566,11 +615,12 @@ def generate_summary(conn: sqlite3.Connection) -> Tuple[Dict, List[Dict], Dict,
     roles: List[Dict] = []
 
     for row in rows:
-        title_counts[row[1].strip().lower()] = (
-            title_counts.get(row[1].strip().lower(), 0) + 1
+        title_counts[row[2].strip().lower()] = (
+            title_counts.get(row[2].strip().lower(), 0) + 1
         )
 
     for (
+        job_id,
         source,
         title,
         company,
@@ -579,18 +629,13 @@ def generate_summary(conn: sqlite3.Connection) -> Tuple[Dict, List[Dict], Dict,
         salary_max,
         salary_text,
         category,
-        tags_raw,
         url,
         published_at,
     ) in rows:
-        tags = json.loads(tags_raw) if tags_raw else []
-        skills = compute_skills(title, tags)
-        innovations = compute_innovations(title, tags)
-        weird_tags = compute_weird_tags(title, tags)
-        for skill in skills:
-            skill_counts[skill] = skill_counts.get(skill, 0) + 1
-        for innovation in innovations:
-            innovation_counts[innovation] = innovation_counts.get(innovation, 0) + 1
+        job_labels = labels_by_job.get(job_id, {})
+        skills = job_labels.get("skills", [])
+        innovations = job_labels.get("innovations", [])
+        weird_tags = job_labels.get("weird", [])
         if location:
             locations[location] = locations.get(location, 0) + 1
         salary_display = salary_text
@@ -727,6 +772,7 @@ def main() -> None:
     init_db(conn)
 
     conn.execute("DELETE FROM jobs")
+    conn.execute("DELETE FROM job_labels")
     conn.commit()
 
     queries = [q.strip() for q in (args.queries or TAVILY_QUERIES).split(";") if q]
@@ -2,13 +2,17 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
 import asyncio
+import redis.asyncio as aioredis
 import structlog
 import os
 
 from src.core.config import settings
+from src.core.http import close_http_clients
 from src.api.routes import jobs, health, admin
 from src.api.websockets import updates
+from src.services.job_events import JobEventRelay
 from src.services.resource_monitor import resource_monitor
+from src.services.response_cache import close_response_cache
 
 logger = structlog.get_logger()
 
@@ -46,12 +50,22 @@ async def startup_event():
     logger.info("application_startup")
     # Start resource monitor in background
     asyncio.create_task(resource_monitor.start_monitoring())
+    if settings.JOB_EVENTS_ENABLED:
+        # Relay job change events from workers to WebSocket clients
+        relay = JobEventRelay(
+            aioredis.from_url(settings.REDIS_URL), updates.manager.broadcast_text
+        )
+        app.state.event_relay = asyncio.create_task(relay.run())
 
 
 @app.on_event("shutdown")
 async def shutdown_event():
     logger.info("application_shutdown")
     resource_monitor.stop_monitoring()
+    await close_response_cache()
+    await close_http_clients()
+    if getattr(app.state, "event_relay", None):
+        app.state.event_relay.cancel()
 
 
 # Include Routers
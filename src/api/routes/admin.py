@@ -1,5 +1,9 @@
 from fastapi import APIRouter, Depends, HTTPException
+from sqlalchemy.ext.asyncio import AsyncSession
+from src.db.session import get_db_session
 from src.services.resource_monitor import resource_monitor, ResourceStatus
+from src.services.summary_snapshot import SummarySnapshotService
+from src.services.response_cache import ResponseCache, get_response_cache
 
 # Basic auth dependency could be added here
 router = APIRouter()
@@ -10,6 +14,25 @@ async def get_resources():
     return resource_monitor.get_current_status().to_dict()
 
 
+@router.get("/resources/cluster")
+async def get_cluster_resources():
+    """Throttle levels per node and fleet-wide, as this process sees them"""
+    return resource_monitor.get_cluster_view().to_dict()
+
+
+@router.get("/websockets")
+async def get_websockets():
+    """Open /ws/updates connections with per-client send lag"""
+    from src.api.websockets.updates import manager
+
+    clients = manager.stats()
+    return {
+        "connections": len(clients),
+        "max_lag_seconds": max((c["lag_seconds"] for c in clients), default=0.0),
+        "clients": clients,
+    }
+
+
 @router.post("/scraper/trigger/{source}")
 async def trigger_scraper(source: str):
     # This would call the celery task asynchronously
@@ -25,3 +48,18 @@ async def trigger_cleanup():
 
     task = run_cleanup.delay()
     return {"status": "triggered", "task_id": str(task.id)}
+
+
+@router.post("/summary/rebuild")
+async def rebuild_summary(
+    db: AsyncSession = Depends(get_db_session),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    snapshot = await SummarySnapshotService(db).rebuild()
+    await cache.invalidate()
+    return {
+        "status": "rebuilt",
+        "version": snapshot.version,
+        "built_at": snapshot.built_at.isoformat(),
+        "total_jobs": snapshot.counters["total"],
+    }
@@ -1,43 +1,150 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, Query
+from typing import Any, Dict, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, StreamingResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.db.session import get_db_session
 from src.services.job_service import JobService
-from src.services.summary_generator import SummaryGenerator
+from src.services.summary_snapshot import SummarySnapshotService
+from src.services.export import (
+    EXPORT_MEDIA_TYPES,
+    csv_chunks,
+    gzip_chunks,
+    ndjson_chunks,
+)
+from src.services.response_cache import (
+    CachedResponse,
+    ResponseCache,
+    get_response_cache,
+)
+from src.core.config import settings
 from src.db.models import Job
 
 router = APIRouter()
 
 
+def _json_response(payload: Any, headers: Optional[Dict[str, str]] = None):
+    body = JSONResponse(jsonable_encoder(payload)).body
+    return CachedResponse(body=body, headers=headers or {})
+
+
+def _to_response(cached: CachedResponse) -> Response:
+    return Response(
+        content=cached.body, media_type="application/json", headers=cached.headers
+    )
+
+
 @router.get("/")
 async def list_jobs(
     skip: int = 0,
-    limit: int = 50,
+    limit: int = Query(50, ge=1, le=500),
+    source: Optional[str] = None,
+    skill: Optional[str] = None,
+    cursor: Optional[str] = None,
+    db: AsyncSession = Depends(get_db_session),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    """List active jobs newest first.
+
+    Pass the ``X-Next-Cursor`` response header back as ``cursor`` to fetch
+    the next page; the header is absent on the last page. ``skip`` still
+    works for OFFSET paging but gets slower with depth.
+    """
+    params = {
+        "skip": skip,
+        "limit": limit,
+        "source": source,
+        "skill": skill,
+        "cursor": cursor,
+    }
+
+    async def load():
+        service = JobService(db)
+        try:
+            jobs, next_cursor = await service.list_jobs_page(**params)
+        except ValueError as e:
+            raise HTTPException(status_code=400, detail=str(e))
+        headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+        return _json_response([job.to_dict() for job in jobs], headers)
+
+    return _to_response(await cache.get_or_load("jobs:list", params, load))
+
+
+@router.get("/search")
+async def search_jobs(
+    q: str = Query(..., min_length=1, max_length=200),
+    skip: int = 0,
+    limit: int = Query(50, ge=1, le=500),
     source: Optional[str] = None,
+    skill: Optional[str] = None,
     db: AsyncSession = Depends(get_db_session),
 ):
+    """Full-text search over title, company, location and skills, best match first"""
     service = JobService(db)
-    # The return type should probably be a Pydantic model, but ORM object works for simple cases
-    # FastAPI automatically converts ORM to JSON if configured (orm_mode in Pydantic)
-    # But returning Job directly might fail if it's not a dict.
-    # JobService.list_jobs returns Job objects.
-    # I should define Pydantic schemas.
-    # For speed, I'll return dicts or let FastAPI handle it if I define response_model.
-    # Let's just return list of dicts for now.
-    jobs = await service.list_jobs(skip, limit, source)
+    try:
+        jobs = await service.search_jobs(
+            q, skip=skip, limit=limit, source=source, skill=skill
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     return [job.to_dict() for job in jobs]
 
 
+@router.get("/export")
+async def export_jobs(
+    format: str = Query("ndjson", pattern="^(ndjson|csv)$"),
+    gzip: bool = False,
+    source: Optional[str] = None,
+    skill: Optional[str] = None,
+    db: AsyncSession = Depends(get_db_session),
+):
+    """Stream every active job, newest first, as NDJSON or CSV.
+
+    Rows are read through a server-side cursor, so memory use does not grow
+    with the table. ``gzip=true`` compresses the stream (Content-Encoding).
+    """
+    batches = JobService(db).stream_jobs(source=source, skill=skill)
+    chunks = ndjson_chunks(batches) if format == "ndjson" else csv_chunks(batches)
+    headers = {"Content-Disposition": f'attachment; filename="jobs.{format}"'}
+    if gzip:
+        chunks = gzip_chunks(chunks)
+        headers["Content-Encoding"] = "gzip"
+    return StreamingResponse(
+        chunks, media_type=EXPORT_MEDIA_TYPES[format], headers=headers
+    )
+
+
 @router.get("/summary")
-async def get_summary(db: AsyncSession = Depends(get_db_session)):
-    generator = SummaryGenerator(db)
-    return await generator.generate()
+async def get_summary(
+    request: Request,
+    db: AsyncSession = Depends(get_db_session),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    async def load():
+        snapshot = await SummarySnapshotService(db).get()
+        headers = {
+            "ETag": SummarySnapshotService.etag(snapshot),
+            "Cache-Control": f"public, max-age={settings.SUMMARY_CACHE_MAX_AGE_SECONDS}",
+        }
+        return _json_response(snapshot.payload, headers)
+
+    cached = await cache.get_or_load("jobs:summary", {}, load)
+    if request.headers.get("if-none-match") == cached.headers["ETag"]:
+        return Response(status_code=304, headers=cached.headers)
+    return _to_response(cached)
 
 
 @router.get("/{job_id}")
-async def get_job(job_id: int, db: AsyncSession = Depends(get_db_session)):
-    job = await db.get(Job, job_id)
-    if not job:
-        raise HTTPException(status_code=404, detail="Job not found")
-    return job.to_dict()
+async def get_job(
+    job_id: int,
+    db: AsyncSession = Depends(get_db_session),
+    cache: ResponseCache = Depends(get_response_cache),
+):
+    async def load():
+        job = await db.get(Job, job_id)
+        if not job:
+            raise HTTPException(status_code=404, detail="Job not found")
+        return _json_response(job.to_dict())
+
+    return _to_response(await cache.get_or_load("jobs:get", {"id": job_id}, load))
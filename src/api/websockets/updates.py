@@ -1,38 +1,148 @@
-from typing import List
-from fastapi import APIRouter, WebSocket, WebSocketDisconnect
+import json
+import time
+from collections import deque
+from typing import Any, Deque, Dict, List, Optional, Tuple
+from fastapi import APIRouter, WebSocket
 import asyncio
 import structlog
 
+from src.core.config import settings
+from src.monitoring.metrics import (
+    WS_CONNECTIONS,
+    WS_MESSAGES_DROPPED,
+    WS_SEND_LAG_SECONDS,
+)
+
 logger = structlog.get_logger()
 
+# Sent in place of a discarded backlog; the client refetches its state
+RESYNC_MESSAGE = json.dumps({"type": "resync"})
+
+
+class ClientConnection:
+    """One socket with its own bounded outbound queue, drained by a writer task"""
+
+    def __init__(self, websocket: WebSocket, max_queue: int):
+        self.websocket = websocket
+        self.max_queue = max_queue
+        self.pending: Deque[Tuple[float, str]] = deque()
+        self.ready = asyncio.Event()
+        self.resync = False
+        self.dropped = 0
+        self.writer: Optional[asyncio.Task] = None
+
+    def enqueue(self, payload: str, now: float) -> None:
+        if len(self.pending) >= self.max_queue:
+            # Deltas this far behind are stale: swap the whole backlog for
+            # one resync instead of trickling old messages to the client
+            self.dropped += len(self.pending)
+            WS_MESSAGES_DROPPED.inc(len(self.pending))
+            self.pending.clear()
+            self.resync = True
+        self.pending.append((now, payload))
+        self.ready.set()
+
+    def lag(self, now: float) -> float:
+        """Age of the oldest message still waiting to be written"""
+        return now - self.pending[0][0] if self.pending else 0.0
+
 
 class ConnectionManager:
-    def __init__(self):
-        self.active_connections: List[WebSocket] = []
+    def __init__(
+        self,
+        send_timeout: float = settings.WS_SEND_TIMEOUT_SECONDS,
+        max_queue: int = settings.WS_SEND_QUEUE_SIZE,
+    ):
+        self.connections: Dict[WebSocket, ClientConnection] = {}
+        self.send_timeout = send_timeout
+        self.max_queue = max_queue
+
+    @property
+    def active_connections(self):
+        return self.connections.keys()
 
-    async def connect(self, websocket: WebSocket):
+    async def connect(self, websocket: WebSocket) -> ClientConnection:
         await websocket.accept()
-        self.active_connections.append(websocket)
-        logger.info("websocket_connected", count=len(self.active_connections))
+        connection = ClientConnection(websocket, self.max_queue)
+        connection.writer = asyncio.create_task(self._write(connection))
+        self.connections[websocket] = connection
+        WS_CONNECTIONS.set(len(self.connections))
+        logger.info("websocket_connected", count=len(self.connections))
+        return connection
 
     def disconnect(self, websocket: WebSocket):
-        if websocket in self.active_connections:
-            self.active_connections.remove(websocket)
-            logger.info("websocket_disconnected", count=len(self.active_connections))
-
-    async def broadcast(self, message: dict):
-        if not self.active_connections:
+        connection = self.connections.pop(websocket, None)
+        if connection is None:
             return
+        if connection.writer is not asyncio.current_task():
+            connection.writer.cancel()
+        WS_CONNECTIONS.set(len(self.connections))
+        logger.info("websocket_disconnected", count=len(self.connections))
+
+    def send(self, websocket: WebSocket, payload: str) -> bool:
+        connection = self.connections.get(websocket)
+        if connection is None:
+            return False
+        connection.enqueue(payload, time.monotonic())
+        return True
+
+    async def broadcast(self, message: dict) -> int:
+        return await self.broadcast_text(json.dumps(message))
+
+    async def broadcast_text(self, payload: str) -> int:
+        """Queue one encoded message for every client without waiting on sockets.
 
-        disconnected = []
-        for connection in self.active_connections:
+        Returns the number of clients it was queued for; each client's writer
+        task delivers it at that client's pace.
+        """
+        now = time.monotonic()
+        for connection in self.connections.values():
+            connection.enqueue(payload, now)
+        return len(self.connections)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        """Per-connection queue depth, lag and dropped message count"""
+        now = time.monotonic()
+        return [
+            {
+                "client": (
+                    f"{conn.websocket.client.host}:{conn.websocket.client.port}"
+                    if getattr(conn.websocket, "client", None)
+                    else None
+                ),
+                "queued": len(conn.pending),
+                "lag_seconds": round(conn.lag(now), 3),
+                "dropped": conn.dropped,
+            }
+            for conn in self.connections.values()
+        ]
+
+    async def _write(self, connection: ClientConnection) -> None:
+        websocket = connection.websocket
+        try:
+            while True:
+                await connection.ready.wait()
+                while connection.resync or connection.pending:
+                    if connection.resync:
+                        connection.resync = False
+                        enqueued_at, payload = time.monotonic(), RESYNC_MESSAGE
+                    else:
+                        enqueued_at, payload = connection.pending.popleft()
+                    await asyncio.wait_for(
+                        websocket.send_text(payload), self.send_timeout
+                    )
+                    WS_SEND_LAG_SECONDS.observe(time.monotonic() - enqueued_at)
+                connection.ready.clear()
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            # Stalled or gone: drop it and close so a live client reconnects
+            logger.warning("websocket_client_dropped", error=repr(e))
+            self.disconnect(websocket)
             try:
-                await connection.send_json(message)
+                await asyncio.wait_for(websocket.close(code=1013), self.send_timeout)
             except Exception:
-                disconnected.append(connection)
-
-        for conn in disconnected:
-            self.disconnect(conn)
+                pass
 
 
 manager = ConnectionManager()
@@ -44,13 +154,12 @@ async def websocket_endpoint(websocket: WebSocket):
     await manager.connect(websocket)
     try:
         while True:
-            # Keep connection alive
+            # Keep connection alive; pings share the client's send queue
             await asyncio.sleep(30)
-            await websocket.send_json(
-                {"type": "ping", "timestamp": str(asyncio.get_event_loop().time())}
-            )
-    except WebSocketDisconnect:
-        manager.disconnect(websocket)
+            ping = {"type": "ping", "timestamp": str(asyncio.get_event_loop().time())}
+            if not manager.send(websocket, json.dumps(ping)):
+                break
     except Exception as e:
         logger.error("websocket_error", error=str(e))
+    finally:
         manager.disconnect(websocket)
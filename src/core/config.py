@@ -19,13 +19,116 @@ class Settings(BaseSettings):
     # Resource Thresholds
     RESOURCE_DISK_MIN_FREE_PERCENT: float = 15.0
     RESOURCE_CPU_MAX_PERCENT: float = 85.0
+    # Background sampling period, max snapshot age before readers resample,
+    # and CPU smoothing (EMA weight of the newest reading)
+    RESOURCE_SAMPLE_INTERVAL_SECONDS: float = 5.0
+    RESOURCE_STATUS_MAX_AGE_SECONDS: float = 15.0
+    RESOURCE_CPU_EMA_ALPHA: float = 0.3
+    # Cluster-wide throttling: every process publishes its status to Redis
+    # with a TTL. Node name defaults to the hostname (Celery's default node
+    # name); the fleet is throttled once QUORUM of its nodes are
+    RESOURCE_CLUSTER_ENABLED: bool = True
+    RESOURCE_NODE_NAME: str = ""
+    RESOURCE_STATUS_TTL_SECONDS: int = 60
+    RESOURCE_FLEET_QUORUM: float = 0.5
 
     # Data Retention
     RETENTION_EXPIRED_DAYS: int = 30
     RETENTION_ARCHIVE_DAYS: int = 90
+    # Archived jobs are dropped after this many days (0 keeps them forever)
+    RETENTION_ARCHIVED_DAYS: int = 365
+    # Set-based archiver: rows per transaction, wall-clock budget per cleanup
+    ARCHIVE_CHUNK_SIZE: int = 5000
+    ARCHIVE_TIME_BUDGET_SECONDS: float = 60.0
+
+    # Shared outbound HTTP pool for scrapers and link validation
+    HTTP_HTTP2: bool = True
+    HTTP_MAX_CONNECTIONS: int = 100
+    HTTP_MAX_KEEPALIVE_CONNECTIONS: int = 40
+    HTTP_KEEPALIVE_EXPIRY_SECONDS: float = 30.0
+    HTTP_TIMEOUT_SECONDS: float = 10.0
+    HTTP_DNS_TTL_SECONDS: float = 300.0
+
+    # Celery workers run task coroutines on one long-lived event loop per
+    # process (owning the DB and HTTP pools); false uses a loop per task
+    WORKER_PERSISTENT_LOOP: bool = True
+    WORKER_SHUTDOWN_TIMEOUT_SECONDS: float = 10.0
+
+    # Link validation: concurrent HEAD checks overall and per employer host
+    VALIDATION_CONCURRENCY: int = 20
+    VALIDATION_PER_HOST_CONCURRENCY: int = 2
+    VALIDATION_BATCH_SIZE: int = 100
+
+    # Adaptive concurrency (AIMD) for scrapers and cleanup: limits shrink by
+    # these factors per sample at LIGHT/HEAVY and climb back from the minimum
+    # to the configured maximum in RECOVERY_STEPS samples at NORMAL
+    CONCURRENCY_LIGHT_FACTOR: float = 0.75
+    CONCURRENCY_HEAVY_FACTOR: float = 0.5
+    CONCURRENCY_RECOVERY_STEPS: int = 10
+
+    # Ingest
+    UPSERT_TOUCH_UNCHANGED: bool = True
+    # Streaming scrape ingest: commit every BATCH_SIZE jobs or FLUSH_SECONDS
+    # after a batch's first job; QUEUE_SIZE bounds jobs fetched but unwritten
+    SCRAPE_BATCH_SIZE: int = 200
+    SCRAPE_FLUSH_SECONDS: float = 5.0
+    SCRAPE_QUEUE_SIZE: int = 1000
+    # Per-query watermarks: queries ask for max_results scaled by their
+    # yield score (share of unseen ids, moving average), never fewer than
+    # MIN_RESULTS; after SKIP_AFTER_EMPTY_RUNS runs with nothing new a query
+    # is skipped for BACKOFF_HOURS, doubling per further empty run up to
+    # MAX_BACKOFF_HOURS. SEEN_IDS caps the ids remembered per query.
+    SCRAPE_QUERY_WATERMARKS_ENABLED: bool = True
+    SCRAPE_QUERY_MIN_RESULTS: int = 5
+    SCRAPE_QUERY_YIELD_ALPHA: float = 0.5
+    SCRAPE_QUERY_SKIP_AFTER_EMPTY_RUNS: int = 2
+    SCRAPE_QUERY_BACKOFF_HOURS: float = 12.0
+    SCRAPE_QUERY_MAX_BACKOFF_HOURS: float = 96.0
+    SCRAPE_QUERY_SEEN_IDS: int = 1000
+
+    # Full-text search: rank only the newest N matches per query; 0 ranks
+    # every match. A cap keeps common-term latency flat but can miss an
+    # older, better match
+    SEARCH_CANDIDATE_LIMIT: int = 0
+
+    # Summary snapshot: beat rebuilds it at this interval (reads never do),
+    # HTTP max-age for clients
+    SUMMARY_SNAPSHOT_MAX_AGE_SECONDS: int = 3600
+    SUMMARY_CACHE_MAX_AGE_SECONDS: int = 60
+
+    # Export: rows fetched per server-side cursor round trip
+    EXPORT_BATCH_SIZE: int = 1000
+    # Parquet snapshots: dataset root and rows per row group
+    PARQUET_EXPORT_DIR: str = "./data/parquet"
+    PARQUET_ROW_GROUP_SIZE: int = 50000
+    # Incremental snapshots re-export rows changed within this long before
+    # the previous run, covering writes that committed after it started
+    PARQUET_WATERMARK_LAG_SECONDS: float = 600.0
+
+    # Response cache for read endpoints (Redis at REDIS_URL). Entries are
+    # invalidated when scrape/cleanup commit, so the TTL only bounds staleness
+    # from writes made outside those tasks
+    RESPONSE_CACHE_ENABLED: bool = True
+    RESPONSE_CACHE_TTL_SECONDS: int = 300
+    # Max wait for a concurrent request rebuilding the same entry
+    RESPONSE_CACHE_LOCK_SECONDS: float = 5.0
+
+    # Job change events: Redis pub/sub feed relayed to /ws/updates clients
+    JOB_EVENTS_ENABLED: bool = True
+    # Jobs per published message; larger runs are split
+    JOB_EVENTS_MAX_JOBS: int = 500
+    # A WebSocket client that can't take a message within this is dropped
+    WS_SEND_TIMEOUT_SECONDS: float = 2.0
+    # Messages buffered per client; on overflow the backlog is replaced by
+    # a single resync message
+    WS_SEND_QUEUE_SIZE: int = 100
 
     # Scraper Settings
     TAVILY_MAX_RESULTS: int = 25
+    # Per-source ScraperConfig options by source name, e.g.
+    # {"tavily": {"max_results": 20, "rate_limit_rpm": 30}}; "enabled": false
+    # keeps a scraper plugin from being loaded at all
+    SCRAPERS: Dict[str, Dict[str, Any]] = {}
     TAVILY_SEARCH_DEPTH: str = "basic"
 
     model_config = SettingsConfigDict(
@@ -0,0 +1,198 @@
+"""Process-wide pooled HTTP client for scrapers and link validation.
+
+One ``httpx.AsyncClient`` per event loop, so every caller in a process
+shares keep-alive connections (HTTP/2 where the server negotiates it) under
+the HTTP_* pool limits. Host names are resolved once per HTTP_DNS_TTL_SECONDS
+instead of on every new connection. The transport records how often a
+request reuses a pooled connection and how long it waits for a pool slot.
+
+Clients are bound to the loop that created them; ``close_http_clients``
+closes the current loop's client and ``shutdown_http_clients`` closes all of
+them from synchronous shutdown hooks.
+"""
+
+import asyncio
+import socket
+import threading
+import time
+import weakref
+from typing import Dict, List, Tuple
+
+import httpcore
+import httpx
+import structlog
+
+from src.core.config import settings
+from src.monitoring.metrics import (
+    HTTP_CONNECTION_REUSE_RATIO,
+    HTTP_CONNECTIONS_OPENED,
+    HTTP_POOL_WAIT_SECONDS,
+    HTTP_REQUESTS,
+)
+
+logger = structlog.get_logger()
+
+
+class DNSCache:
+    """TTL cache of getaddrinfo results, shared by every pooled transport"""
+
+    def __init__(self, ttl_seconds: float = settings.HTTP_DNS_TTL_SECONDS):
+        self.ttl_seconds = ttl_seconds
+        self._entries: Dict[Tuple[str, int], Tuple[float, List[str]]] = {}
+        self._lock = threading.Lock()
+
+    async def resolve(self, host: str, port: int) -> List[str]:
+        try:
+            socket.inet_pton(socket.AF_INET6 if ":" in host else socket.AF_INET, host)
+            return [host]
+        except OSError:
+            pass
+
+        now = time.monotonic()
+        with self._lock:
+            entry = self._entries.get((host, port))
+        if entry is not None and entry[0] > now:
+            return entry[1]
+
+        infos = await asyncio.get_running_loop().getaddrinfo(
+            host, port, type=socket.SOCK_STREAM
+        )
+        addresses = list(dict.fromkeys(info[4][0] for info in infos))
+        with self._lock:
+            self._entries[(host, port)] = (now + self.ttl_seconds, addresses)
+        return addresses
+
+    def evict(self, host: str, port: int) -> None:
+        with self._lock:
+            self._entries.pop((host, port), None)
+
+
+dns_cache = DNSCache()
+
+
+class CachingNetworkBackend(httpcore.AsyncNetworkBackend):
+    """Connects to cached addresses; TLS still verifies the original host"""
+
+    def __init__(self, transport: "PooledTransport", cache: DNSCache = dns_cache):
+        self.transport = transport
+        self.cache = cache
+        self.backend = httpcore.AnyIOBackend()
+
+    async def connect_tcp(
+        self, host, port, timeout=None, local_address=None, socket_options=None
+    ):
+        addresses = await self.cache.resolve(host, port)
+        for i, address in enumerate(addresses):
+            try:
+                stream = await self.backend.connect_tcp(
+                    address, port, timeout, local_address, socket_options
+                )
+            except (httpcore.ConnectError, httpcore.ConnectTimeout):
+                if i == len(addresses) - 1:
+                    # Every cached address failed; resolve again next time
+                    self.cache.evict(host, port)
+                    raise
+                continue
+            self.transport.connection_opened()
+            return stream
+
+    async def connect_unix_socket(self, path, timeout=None, socket_options=None):
+        return await self.backend.connect_unix_socket(path, timeout, socket_options)
+
+    async def sleep(self, seconds: float) -> None:
+        await self.backend.sleep(seconds)
+
+
+class PooledTransport(httpx.AsyncHTTPTransport):
+    def __init__(self, **kwargs):
+        super().__init__(**kwargs)
+        # httpx has no hook for the network backend; new connections are
+        # created through this attribute of the httpcore pool
+        self._pool._network_backend = CachingNetworkBackend(self)
+        self.requests = 0
+        self.connections_opened = 0
+
+    @property
+    def reuse_ratio(self) -> float:
+        """Share of requests served on an already open connection"""
+        if not self.requests:
+            return 0.0
+        return max(0.0, 1 - self.connections_opened / self.requests)
+
+    def connection_opened(self) -> None:
+        self.connections_opened += 1
+        HTTP_CONNECTIONS_OPENED.inc()
+
+    async def handle_async_request(self, request: httpx.Request) -> httpx.Response:
+        started = time.monotonic()
+        waited = False
+        outer_trace = request.extensions.get("trace")
+
+        async def trace(event_name: str, info: dict) -> None:
+            nonlocal waited
+            # httpcore's first event comes from the connection it was handed
+            if not waited:
+                waited = True
+                HTTP_POOL_WAIT_SECONDS.observe(time.monotonic() - started)
+            if outer_trace is not None:
+                await outer_trace(event_name, info)
+
+        request.extensions["trace"] = trace
+        self.requests += 1
+        HTTP_REQUESTS.inc()
+        try:
+            return await super().handle_async_request(request)
+        finally:
+            HTTP_CONNECTION_REUSE_RATIO.set(self.reuse_ratio)
+
+
+def create_http_client(**kwargs) -> httpx.AsyncClient:
+    """New pooled client; prefer ``get_http_client`` outside benchmarks and tests"""
+    transport = PooledTransport(
+        http2=settings.HTTP_HTTP2,
+        limits=httpx.Limits(
+            max_connections=settings.HTTP_MAX_CONNECTIONS,
+            max_keepalive_connections=settings.HTTP_MAX_KEEPALIVE_CONNECTIONS,
+            keepalive_expiry=settings.HTTP_KEEPALIVE_EXPIRY_SECONDS,
+        ),
+    )
+    kwargs.setdefault("timeout", settings.HTTP_TIMEOUT_SECONDS)
+    kwargs.setdefault("follow_redirects", True)
+    return httpx.AsyncClient(transport=transport, **kwargs)
+
+
+_clients: "weakref.WeakKeyDictionary[asyncio.AbstractEventLoop, httpx.AsyncClient]" = (
+    weakref.WeakKeyDictionary()
+)
+
+
+def get_http_client() -> httpx.AsyncClient:
+    """The shared client for the running event loop"""
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        client = _clients[loop] = create_http_client()
+    return client
+
+
+async def close_http_clients() -> None:
+    """Close the running loop's shared client"""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def shutdown_http_clients() -> None:
+    """Close every shared client from synchronous code (worker shutdown)"""
+    for loop, client in list(_clients.items()):
+        _clients.pop(loop, None)
+        if loop.is_closed():
+            # Its sockets went with the loop
+            continue
+        try:
+            if loop.is_running():
+                asyncio.run_coroutine_threadsafe(client.aclose(), loop).result(5)
+            else:
+                loop.run_until_complete(client.aclose())
+        except Exception as e:
+            logger.warning("http_client_close_failed", error=str(e))
@@ -0,0 +1,131 @@
+"""Long-lived event loop for Celery worker processes.
+
+``async_to_sync`` gives every task invocation its own loop, so the async DB
+engine and the shared HTTP client are torn down and reconnected per task
+(and pooled connections bound to a finished loop go stale). A
+``WorkerRuntime`` instead runs one loop in a background thread for the life
+of the worker process; tasks hand it their coroutine and block on the
+result, so the engine pool and the HTTP pool stay warm across tasks.
+Long-running background coroutines (the resource sampler) are ``spawn``-ed
+onto the same loop and cancelled when it stops.
+
+The worker starts the runtime from ``worker_process_init`` (or
+``worker_init`` for non-forking pools) and stops it on shutdown. Outside a
+worker, ``run_async`` falls back to ``async_to_sync``.
+"""
+
+import asyncio
+import concurrent.futures
+import threading
+from typing import Any, Awaitable, Callable, Optional, Set
+
+from asgiref.sync import async_to_sync
+import structlog
+
+from src.core.config import settings
+from src.core.http import close_http_clients
+from src.db.session import engine
+
+logger = structlog.get_logger()
+
+
+class WorkerRuntime:
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._lock = threading.Lock()
+        self._background: Set[concurrent.futures.Future] = set()
+
+    @property
+    def running(self) -> bool:
+        return self._loop is not None and self._loop.is_running()
+
+    def start(self) -> None:
+        with self._lock:
+            if self._thread is not None:
+                return
+            loop = asyncio.new_event_loop()
+            started = threading.Event()
+            thread = threading.Thread(
+                target=self._run_loop,
+                args=(loop, started),
+                name="worker-event-loop",
+                daemon=True,
+            )
+            thread.start()
+            started.wait()
+            self._loop, self._thread = loop, thread
+
+        # A forked worker inherits the parent's pooled connections; drop them
+        # without closing so the parent's sockets are left alone
+        self.run(engine.dispose, close=False)
+        logger.info("worker_runtime_started")
+
+    @staticmethod
+    def _run_loop(loop: asyncio.AbstractEventLoop, started: threading.Event):
+        asyncio.set_event_loop(loop)
+        loop.call_soon(started.set)
+        loop.run_forever()
+
+    def run(self, fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+        """Run ``fn(*args, **kwargs)`` on the runtime loop and wait for it.
+
+        If the wait is interrupted (e.g. a Celery soft time limit), the
+        coroutine is cancelled before the exception propagates.
+        """
+        if not self.running:
+            raise RuntimeError("Worker runtime is not running")
+        future = asyncio.run_coroutine_threadsafe(fn(*args, **kwargs), self._loop)
+        try:
+            return future.result()
+        except BaseException:
+            future.cancel()
+            raise
+
+    def spawn(
+        self, fn: Callable[..., Awaitable[Any]], *args, **kwargs
+    ) -> concurrent.futures.Future:
+        """Start ``fn(*args, **kwargs)`` on the runtime loop without waiting.
+
+        Still-running coroutines are cancelled by ``stop()``.
+        """
+        if not self.running:
+            raise RuntimeError("Worker runtime is not running")
+        future = asyncio.run_coroutine_threadsafe(fn(*args, **kwargs), self._loop)
+        self._background.add(future)
+        future.add_done_callback(self._background.discard)
+        return future
+
+    def stop(self, timeout: float = settings.WORKER_SHUTDOWN_TIMEOUT_SECONDS):
+        with self._lock:
+            loop, thread = self._loop, self._thread
+            self._loop = self._thread = None
+        if loop is None:
+            return
+
+        for future in list(self._background):
+            future.cancel()
+        try:
+            asyncio.run_coroutine_threadsafe(self._close_pools(), loop).result(timeout)
+        except Exception as e:
+            logger.warning("worker_runtime_close_failed", error=str(e))
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join(timeout)
+        if not thread.is_alive():
+            loop.close()
+        logger.info("worker_runtime_stopped")
+
+    @staticmethod
+    async def _close_pools() -> None:
+        await close_http_clients()
+        await engine.dispose()
+
+
+worker_runtime = WorkerRuntime()
+
+
+def run_async(fn: Callable[..., Awaitable[Any]], *args, **kwargs) -> Any:
+    """Run a task coroutine on the worker loop, or on a fresh loop outside one"""
+    if worker_runtime.running:
+        return worker_runtime.run(fn, *args, **kwargs)
+    return async_to_sync(fn)(*args, **kwargs)
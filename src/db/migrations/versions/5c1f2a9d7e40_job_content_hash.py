@@ -0,0 +1,38 @@
+"""job_content_hash
+
+Revision ID: 5c1f2a9d7e40
+Revises: 14b81e3d6496
+Create Date: 2026-10-17 09:12:41.208113
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1f2a9d7e40'
+down_revision: Union[str, Sequence[str], None] = '14b81e3d6496'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.add_column(sa.Column('content_hash', sa.String(length=40), nullable=True))
+        batch_op.add_column(sa.Column('last_seen_at', sa.DateTime(), nullable=True))
+    with op.batch_alter_table('metrics') as batch_op:
+        batch_op.add_column(sa.Column('changed_jobs', sa.Integer(), server_default='0', nullable=False))
+        batch_op.add_column(sa.Column('unchanged_jobs', sa.Integer(), server_default='0', nullable=False))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('metrics') as batch_op:
+        batch_op.drop_column('unchanged_jobs')
+        batch_op.drop_column('changed_jobs')
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_column('last_seen_at')
+        batch_op.drop_column('content_hash')
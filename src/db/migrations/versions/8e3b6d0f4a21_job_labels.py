@@ -0,0 +1,39 @@
+"""job_labels
+
+Revision ID: 8e3b6d0f4a21
+Revises: 5c1f2a9d7e40
+Create Date: 2026-10-17 10:04:17.551920
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e3b6d0f4a21'
+down_revision: Union[str, Sequence[str], None] = '5c1f2a9d7e40'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('job_labels',
+    sa.Column('job_id', sa.Integer(), nullable=False),
+    sa.Column('kind', sa.String(length=20), nullable=False),
+    sa.Column('label', sa.String(length=100), nullable=False),
+    sa.ForeignKeyConstraint(['job_id'], ['jobs.id'], ondelete='CASCADE'),
+    sa.PrimaryKeyConstraint('job_id', 'kind', 'label')
+    )
+    op.create_index('ix_job_labels_kind_label', 'job_labels', ['kind', 'label'], unique=False)
+    # Existing rows have no stored labels; clearing their fingerprints makes
+    # the next scrape rewrite them through the classifying ingest path.
+    op.execute("UPDATE jobs SET content_hash = NULL")
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_job_labels_kind_label', table_name='job_labels')
+    op.drop_table('job_labels')
@@ -0,0 +1,42 @@
+"""scrape_query_states
+
+Revision ID: a3d8f2c6b1e7
+Revises: f7c3d1a8e2b5
+Create Date: 2026-10-17 20:04:41.218630
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a3d8f2c6b1e7'
+down_revision: Union[str, Sequence[str], None] = 'f7c3d1a8e2b5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_table('scrape_query_states',
+    sa.Column('source', sa.String(length=50), nullable=False),
+    sa.Column('query', sa.String(length=500), nullable=False),
+    sa.Column('runs', sa.Integer(), nullable=False),
+    sa.Column('empty_runs', sa.Integer(), nullable=False),
+    sa.Column('yield_score', sa.Float(), nullable=False),
+    sa.Column('seen_external_ids', sa.JSON(), nullable=False),
+    sa.Column('last_run_at', sa.DateTime(), nullable=True),
+    sa.Column('last_new_at', sa.DateTime(), nullable=True),
+    sa.PrimaryKeyConstraint('source', 'query')
+    )
+    with op.batch_alter_table('metrics') as batch_op:
+        batch_op.add_column(sa.Column('requests', sa.Integer(), nullable=True))
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('metrics') as batch_op:
+        batch_op.drop_column('requests')
+    op.drop_table('scrape_query_states')
@@ -0,0 +1,27 @@
+"""jobs_keyset_index
+
+Revision ID: c2f9a7b31e58
+Revises: b7a4e1c2d9f3
+Create Date: 2026-10-17 12:02:48.716304
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c2f9a7b31e58'
+down_revision: Union[str, Sequence[str], None] = 'b7a4e1c2d9f3'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    op.create_index('ix_jobs_fetched_at_id', 'jobs', ['fetched_at', 'id'], unique=False)
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    op.drop_index('ix_jobs_fetched_at_id', table_name='jobs')
@@ -0,0 +1,48 @@
+"""job_search_index
+
+Revision ID: d4a1f6c83b92
+Revises: c2f9a7b31e58
+Create Date: 2026-10-17 14:21:05.330118
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd4a1f6c83b92'
+down_revision: Union[str, Sequence[str], None] = 'c2f9a7b31e58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.execute(
+            "CREATE INDEX ix_jobs_search ON jobs USING gin ("
+            "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(company, '')"
+            " || ' ' || coalesce(location, '') || ' ' || coalesce(tags ->> 'skills', '')))"
+        )
+    elif dialect == 'sqlite':
+        op.execute(
+            "CREATE VIRTUAL TABLE jobs_fts USING fts5("
+            "title, company, location, skills, tokenize='porter unicode61')"
+        )
+        op.execute(
+            "INSERT INTO jobs_fts (rowid, title, company, location, skills) "
+            "SELECT jobs.id, jobs.title, jobs.company, jobs.location, "
+            "(SELECT group_concat(value, ' ') FROM json_each(jobs.tags, '$.skills')) "
+            "FROM jobs"
+        )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    if dialect == 'postgresql':
+        op.drop_index('ix_jobs_search', table_name='jobs')
+    elif dialect == 'sqlite':
+        op.execute("DROP TABLE jobs_fts")
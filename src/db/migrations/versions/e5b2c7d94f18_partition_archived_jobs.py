@@ -0,0 +1,111 @@
+"""partition_archived_jobs
+
+Revision ID: e5b2c7d94f18
+Revises: d4a1f6c83b92
+Create Date: 2026-10-17 18:05:41.902217
+
+"""
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from src.db.partitions import (
+    add_months,
+    create_default_partition_sql,
+    create_partition_sql,
+    month_start,
+)
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e5b2c7d94f18'
+down_revision: Union[str, Sequence[str], None] = 'd4a1f6c83b92'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+COPIED_COLUMNS = (
+    'id, source, external_id, title, company, location, salary_min, salary_max, '
+    'salary_text, category, tags, url, published_at, fetched_at, is_remote, archived_at'
+)
+
+
+def _columns():
+    return [
+        sa.Column('id', sa.Integer(), autoincrement=False, nullable=False),
+        sa.Column('source', sa.String(length=50), nullable=False),
+        sa.Column('external_id', sa.String(length=255), nullable=False),
+        sa.Column('title', sa.String(length=255), nullable=False),
+        sa.Column('company', sa.String(length=255), nullable=True),
+        sa.Column('location', sa.String(length=255), nullable=True),
+        sa.Column('salary_min', sa.Integer(), nullable=True),
+        sa.Column('salary_max', sa.Integer(), nullable=True),
+        sa.Column('salary_text', sa.String(length=255), nullable=True),
+        sa.Column('category', sa.String(length=100), nullable=True),
+        sa.Column('tags', sa.JSON(), nullable=False),
+        sa.Column('url', sa.Text(), nullable=True),
+        sa.Column('published_at', sa.DateTime(), nullable=True),
+        sa.Column('fetched_at', sa.DateTime(), nullable=False),
+        sa.Column('is_remote', sa.Boolean(), nullable=False),
+    ]
+
+
+def _rename_previous(dialect: str) -> None:
+    op.rename_table('archived_jobs', 'archived_jobs_previous')
+    if dialect == 'postgresql':
+        op.execute('ALTER INDEX archived_jobs_pkey RENAME TO archived_jobs_previous_pkey')
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    dialect = op.get_bind().dialect.name
+    _rename_previous(dialect)
+
+    # Also adds is_valid / last_validated_at, which the model already had
+    op.create_table('archived_jobs',
+    *_columns(),
+    sa.Column('is_valid', sa.Boolean(), nullable=False),
+    sa.Column('last_validated_at', sa.DateTime(), nullable=True),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id', 'archived_at'),
+    postgresql_partition_by='RANGE (archived_at)'
+    )
+
+    if dialect == 'postgresql':
+        oldest = op.get_bind().execute(
+            sa.text('SELECT min(archived_at) FROM archived_jobs_previous')
+        ).scalar()
+        now = month_start(datetime.utcnow())
+        month = month_start(oldest) if oldest else now
+        while month <= add_months(now, 2):
+            op.execute(create_partition_sql('archived_jobs', month))
+            month = add_months(month, 1)
+        op.execute(create_default_partition_sql('archived_jobs'))
+
+    op.execute(
+        f'INSERT INTO archived_jobs ({COPIED_COLUMNS}, is_valid) '
+        f'SELECT {COPIED_COLUMNS}, false FROM archived_jobs_previous'
+    )
+    op.drop_table('archived_jobs_previous')
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    dialect = op.get_bind().dialect.name
+    _rename_previous(dialect)
+
+    op.create_table('archived_jobs',
+    *_columns(),
+    sa.Column('archived_at', sa.DateTime(), nullable=False),
+    sa.PrimaryKeyConstraint('id')
+    )
+    # The unpartitioned table is keyed by id alone; keep the latest archive
+    op.execute(
+        f'INSERT INTO archived_jobs ({COPIED_COLUMNS}) '
+        f'SELECT {COPIED_COLUMNS} FROM archived_jobs_previous AS a '
+        'WHERE a.archived_at = (SELECT max(b.archived_at) FROM archived_jobs_previous AS b '
+        'WHERE b.id = a.id)'
+    )
+    # Dropping the parent drops its partitions on Postgres
+    op.drop_table('archived_jobs_previous')
@@ -0,0 +1,36 @@
+"""job_updated_at
+
+Revision ID: f7c3d1a8e2b5
+Revises: e5b2c7d94f18
+Create Date: 2026-10-17 19:12:27.551904
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c3d1a8e2b5'
+down_revision: Union[str, Sequence[str], None] = 'e5b2c7d94f18'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Upgrade schema."""
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.add_column(sa.Column('updated_at', sa.DateTime(), nullable=True))
+        batch_op.create_index(batch_op.f('ix_jobs_updated_at'), ['updated_at'], unique=False)
+    op.execute(
+        'UPDATE jobs SET updated_at = '
+        'COALESCE(deleted_at, last_validated_at, last_seen_at, fetched_at)'
+    )
+
+
+def downgrade() -> None:
+    """Downgrade schema."""
+    with op.batch_alter_table('jobs') as batch_op:
+        batch_op.drop_index(batch_op.f('ix_jobs_updated_at'))
+        batch_op.drop_column('updated_at')
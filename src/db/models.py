@@ -10,15 +10,34 @@ from sqlalchemy import (
     Float,
     ForeignKey,
     Text,
+    Index,
+    DDL,
+    event,
+    text,
 )
 from sqlalchemy.orm import DeclarativeBase, Mapped, mapped_column, relationship
 from sqlalchemy.ext.asyncio import AsyncAttrs
 
+from src.db.partitions import create_default_partition_sql
+
 
 class Base(AsyncAttrs, DeclarativeBase):
     pass
 
 
+# Postgres search document. Queries must use this exact expression so the
+# planner matches it against the ix_jobs_search GIN index.
+JOB_SEARCH_VECTOR = (
+    "to_tsvector('english', coalesce(title, '') || ' ' || coalesce(company, '')"
+    " || ' ' || coalesce(location, '') || ' ' || coalesce(tags ->> 'skills', ''))"
+)
+
+# SQLite search index: an FTS5 table keyed by jobs.id (rowid), kept in sync
+# by the upsert and archive paths.
+JOB_SEARCH_TABLE = "jobs_fts"
+JOB_SEARCH_COLUMNS = ["title", "company", "location", "skills"]
+
+
 class Job(Base):
     __tablename__ = "jobs"
 
@@ -51,8 +70,28 @@ class Job(Base):
         DateTime, nullable=True, index=True
     )
 
+    # Fingerprint of the scraped fields; unchanged re-scrapes skip the write path
+    content_hash: Mapped[Optional[str]] = mapped_column(String(40), nullable=True)
+    last_seen_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    # Bumped by every write that changes the row; drives incremental exports
+    updated_at: Mapped[Optional[datetime]] = mapped_column(
+        DateTime,
+        default=datetime.utcnow,
+        onupdate=datetime.utcnow,
+        nullable=True,
+        index=True,
+    )
+
     __table_args__ = (
         UniqueConstraint("source", "external_id", name="uq_source_external_id"),
+        # Keyset pagination order for GET /jobs
+        Index("ix_jobs_fetched_at_id", "fetched_at", "id"),
+        # Full-text search on Postgres; SQLite uses the jobs_fts table below
+        Index(
+            "ix_jobs_search",
+            text(JOB_SEARCH_VECTOR),
+            postgresql_using="gin",
+        ).ddl_if(dialect="postgresql"),
     )
 
     def to_dict(self) -> Dict[str, Any]:
@@ -77,10 +116,50 @@ class Job(Base):
         }
 
 
+event.listen(
+    Job.__table__,
+    "after_create",
+    DDL(
+        f"CREATE VIRTUAL TABLE IF NOT EXISTS {JOB_SEARCH_TABLE} USING fts5("
+        f"{', '.join(JOB_SEARCH_COLUMNS)}, tokenize='porter unicode61')"
+    ).execute_if(dialect="sqlite"),
+)
+event.listen(
+    Job.__table__,
+    "before_drop",
+    DDL(f"DROP TABLE IF EXISTS {JOB_SEARCH_TABLE}").execute_if(dialect="sqlite"),
+)
+
+
+class JobLabel(Base):
+    """Derived classification label (skill / innovation / weird) for a job.
+
+    Written by the ingest path so summaries can aggregate with GROUP BY
+    instead of re-classifying every row.
+    """
+
+    __tablename__ = "job_labels"
+
+    job_id: Mapped[int] = mapped_column(
+        Integer, ForeignKey("jobs.id", ondelete="CASCADE"), primary_key=True
+    )
+    kind: Mapped[str] = mapped_column(String(20), primary_key=True)
+    label: Mapped[str] = mapped_column(String(100), primary_key=True)
+
+    __table_args__ = (Index("ix_job_labels_kind_label", "kind", "label"),)
+
+
 class ArchivedJob(Base):
+    """Jobs moved out of ``jobs`` by the archiver.
+
+    On Postgres the table is range-partitioned by month on ``archived_at``
+    (see src.db.partitions), which is why it is part of the primary key.
+    """
+
     __tablename__ = "archived_jobs"
 
-    id: Mapped[int] = mapped_column(Integer, primary_key=True)  # Keep original ID
+    # Keeps the original jobs.id
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=False)
     source: Mapped[str] = mapped_column(String(50), nullable=False)
     external_id: Mapped[str] = mapped_column(String(255), nullable=False)
     title: Mapped[str] = mapped_column(String(255), nullable=False)
@@ -104,9 +183,19 @@ class ArchivedJob(Base):
         DateTime, nullable=True
     )
     archived_at: Mapped[datetime] = mapped_column(
-        DateTime, default=datetime.utcnow, nullable=False
+        DateTime, default=datetime.utcnow, primary_key=True
     )
 
+    __table_args__ = {"postgresql_partition_by": "RANGE (archived_at)"}
+
+
+# Catch-all partition so inserts never fail for a month without a child table
+event.listen(
+    ArchivedJob.__table__,
+    "after_create",
+    DDL(create_default_partition_sql("archived_jobs")).execute_if(dialect="postgresql"),
+)
+
 
 class Metric(Base):
     __tablename__ = "metrics"
@@ -119,3 +208,54 @@ class Metric(Base):
     source: Mapped[str] = mapped_column(String(50), nullable=False)
     duration_seconds: Mapped[float] = mapped_column(Float, default=0.0)
     new_jobs: Mapped[int] = mapped_column(Integer, default=0)
+    changed_jobs: Mapped[int] = mapped_column(Integer, default=0)
+    unchanged_jobs: Mapped[int] = mapped_column(Integer, default=0)
+    # Source API requests sent; NULL for scrapers that don't count them
+    requests: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+
+    @property
+    def new_jobs_per_request(self) -> Optional[float]:
+        if not self.requests:
+            return None
+        return self.new_jobs / self.requests
+
+
+class ScrapeQueryState(Base):
+    """Watermark for one search query of a source.
+
+    Remembers the external ids the query has already returned and a yield
+    score (moving average of the share of new ids per run), so low-yield
+    queries are asked for fewer results or skipped for a while.
+    """
+
+    __tablename__ = "scrape_query_states"
+
+    source: Mapped[str] = mapped_column(String(50), primary_key=True)
+    query: Mapped[str] = mapped_column(String(500), primary_key=True)
+    runs: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    # Consecutive runs that returned no unseen ids
+    empty_runs: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    yield_score: Mapped[float] = mapped_column(Float, default=1.0, nullable=False)
+    seen_external_ids: Mapped[List[str]] = mapped_column(JSON, default=list)
+    last_run_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+    last_new_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
+
+
+class SummarySnapshot(Base):
+    """Materialized /jobs/summary payload plus the counters it is rendered from.
+
+    A single row (id=1) refreshed incrementally by scrape and cleanup tasks.
+    """
+
+    __tablename__ = "summary_snapshots"
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True)
+    version: Mapped[int] = mapped_column(Integer, default=0, nullable=False)
+    counters: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
+    payload: Mapped[Dict[str, Any]] = mapped_column(JSON, default=dict)
+    built_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
+    refreshed_at: Mapped[datetime] = mapped_column(
+        DateTime, default=datetime.utcnow, nullable=False
+    )
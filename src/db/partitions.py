@@ -0,0 +1,93 @@
+"""Monthly range partitions for Postgres.
+
+``archived_jobs`` is declared ``PARTITION BY RANGE (archived_at)`` on
+Postgres with one child table per calendar month (``archived_jobs_p202610``)
+plus a default partition. Retention drops whole months instead of deleting
+rows; only rows that landed in the default partition (out-of-range
+``archived_at``) are deleted one by one. SQLite has no partitioning, so
+callers fall back to row deletes there.
+"""
+
+import re
+from datetime import date, datetime
+from typing import List
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncSession
+
+
+def month_start(value: datetime) -> date:
+    return date(value.year, value.month, 1)
+
+
+def add_months(month: date, count: int) -> date:
+    index = month.year * 12 + month.month - 1 + count
+    return date(index // 12, index % 12 + 1, 1)
+
+
+def partition_name(table: str, month: date) -> str:
+    return f"{table}_p{month:%Y%m}"
+
+
+def create_partition_sql(table: str, month: date) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(table, month)} "
+        f"PARTITION OF {table} FOR VALUES "
+        f"FROM ('{month.isoformat()}') TO ('{add_months(month, 1).isoformat()}')"
+    )
+
+
+def create_default_partition_sql(table: str) -> str:
+    return f"CREATE TABLE IF NOT EXISTS {table}_default PARTITION OF {table} DEFAULT"
+
+
+async def ensure_partitions(
+    db: AsyncSession, table: str, now: datetime, months_ahead: int = 1
+) -> None:
+    """Create this month's partition and the next ``months_ahead`` ones.
+
+    Rows must never land in the default partition for a month that later
+    gets its own child table, so this runs before each archive pass.
+    """
+    month = month_start(now)
+    for offset in range(months_ahead + 1):
+        await db.execute(text(create_partition_sql(table, add_months(month, offset))))
+
+
+async def drop_partitions_before(
+    db: AsyncSession, table: str, cutoff: datetime
+) -> List[str]:
+    """Detach and drop monthly partitions that end on or before ``cutoff``"""
+    result = await db.execute(
+        text(
+            "SELECT child.relname FROM pg_inherits "
+            "JOIN pg_class parent ON pg_inherits.inhparent = parent.oid "
+            "JOIN pg_class child ON pg_inherits.inhrelid = child.oid "
+            "WHERE parent.relname = :table"
+        ),
+        {"table": table},
+    )
+    pattern = re.compile(rf"^{re.escape(table)}_p(\d{{4}})(\d{{2}})$")
+    dropped = []
+    for name in sorted(result.scalars().all()):
+        match = pattern.match(name)
+        if not match:
+            continue
+        month = date(int(match.group(1)), int(match.group(2)), 1)
+        if add_months(month, 1) > cutoff.date():
+            continue
+        await db.execute(text(f"ALTER TABLE {table} DETACH PARTITION {name}"))
+        await db.execute(text(f"DROP TABLE {name}"))
+        dropped.append(name)
+    return dropped
+
+
+async def prune_default_partition(
+    db: AsyncSession, table: str, column: str, cutoff: datetime
+) -> int:
+    """Delete rows older than ``cutoff`` from the default partition"""
+    result = await db.execute(
+        text(f"DELETE FROM {table}_default WHERE {column} < :cutoff"),
+        {"cutoff": cutoff},
+    )
+    return result.rowcount
@@ -1,4 +1,4 @@
-from prometheus_client import Gauge, Counter
+from prometheus_client import Gauge, Counter, Histogram
 
 # Resource Metrics
 CPU_USAGE = Gauge("job_intel_cpu_percent", "Current system CPU usage percentage")
@@ -24,3 +24,56 @@ JOB_SCRAPED_TOTAL = Counter(
 JOB_PROCESSING_SECONDS = Gauge(
     "job_intel_processing_seconds", "Time spent processing jobs", ["source"]
 )
+
+SCRAPE_QUERY_REQUESTS = Counter(
+    "job_intel_scrape_query_requests_total",
+    "Search queries sent to or skipped by a source, per query watermarks",
+    ["source", "outcome"],
+)
+
+SCRAPE_NEW_JOBS_PER_REQUEST = Gauge(
+    "job_intel_scrape_new_jobs_per_request",
+    "Jobs inserted per source API request in the latest scrape run",
+    ["source"],
+)
+
+# Shared outbound HTTP pool (scrapers and link validation)
+HTTP_REQUESTS = Counter(
+    "job_intel_http_requests_total", "Requests sent through the shared HTTP pool"
+)
+
+HTTP_CONNECTIONS_OPENED = Counter(
+    "job_intel_http_connections_opened_total",
+    "New TCP connections opened by the shared HTTP pool",
+)
+
+HTTP_CONNECTION_REUSE_RATIO = Gauge(
+    "job_intel_http_connection_reuse_ratio",
+    "Share of requests served on an already open pooled connection",
+)
+
+HTTP_POOL_WAIT_SECONDS = Histogram(
+    "job_intel_http_pool_wait_seconds",
+    "Time a request waited for a connection from the shared HTTP pool",
+    buckets=(0.001, 0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0),
+)
+
+CONCURRENCY_LIMIT = Gauge(
+    "job_intel_concurrency_limit",
+    "Current adaptive limit per worker pool (in-flight requests or batch rows)",
+    ["pool"],
+)
+
+# WebSocket fan-out
+WS_CONNECTIONS = Gauge("job_intel_ws_connections", "Open /ws/updates connections")
+
+WS_SEND_LAG_SECONDS = Histogram(
+    "job_intel_ws_send_lag_seconds",
+    "Time from broadcast to socket write, per WebSocket message",
+    buckets=(0.005, 0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 30.0),
+)
+
+WS_MESSAGES_DROPPED = Counter(
+    "job_intel_ws_messages_dropped_total",
+    "Queued WebSocket messages discarded because a client fell behind",
+)
@@ -1,9 +1,16 @@
 from abc import ABC, abstractmethod
-from typing import List, Optional
+from typing import AsyncIterator, List, Optional
 import httpx
-import hashlib
 from dataclasses import dataclass
+from src.core.http import get_http_client
 from src.db.models import Job
+from src.scrapers.rate_limit import TokenBucket
+from src.services.concurrency import (
+    AdaptiveConcurrencyController,
+    AdaptiveLimiter,
+    concurrency_controller,
+)
+from src.services.query_watermarks import QueryWatermarks
 from src.services.resource_monitor import ResourceMonitor, TaskType
 
 
@@ -13,29 +20,66 @@ class ScraperConfig:
     enabled: bool = True
     max_results: int = 50
     rate_limit_rpm: int = 60
+    max_concurrency: int = 4
 
 
 class BaseScraper(ABC):
     def __init__(
         self,
         config: ScraperConfig,
-        http_client: httpx.AsyncClient,
+        http_client: Optional[httpx.AsyncClient],
         resource_monitor: ResourceMonitor,
+        controller: Optional[AdaptiveConcurrencyController] = None,
     ):
         self.config = config
-        self.http = http_client
+        self._http = http_client
         self.resource_monitor = resource_monitor
+        if controller is None:
+            # Share the process-wide limits; only a scraper on its own
+            # monitor needs a controller of its own
+            controller = (
+                concurrency_controller
+                if resource_monitor is concurrency_controller.monitor
+                else AdaptiveConcurrencyController(resource_monitor)
+            )
+        self.controller = controller
+        self.rate_limiter = TokenBucket(
+            config.rate_limit_rpm, capacity=config.max_concurrency
+        )
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """The given client, else the process-wide pool for the running loop"""
+        return self._http or get_http_client()
 
     @abstractmethod
     async def fetch_jobs(self) -> List[Job]:
         """Fetch jobs from source"""
         pass
 
+    async def stream_jobs(
+        self, watermarks: Optional[QueryWatermarks] = None
+    ) -> AsyncIterator[Job]:
+        """Yield jobs as they are fetched.
+
+        The default waits for ``fetch_jobs``; scrapers that fetch in pages or
+        per query override this so ingest can start writing early. Query-based
+        scrapers use ``watermarks`` to size or skip each query.
+        """
+        for job in await self.fetch_jobs():
+            yield job
+
     @abstractmethod
     def get_source_name(self) -> str:
         """Get source name identifier"""
         pass
 
+    def request_limiter(self) -> AdaptiveLimiter:
+        """Bounds in-flight requests; shrinks under load up to max_concurrency"""
+        return self.controller.limiter(
+            f"scraper:{self.get_source_name()}", self.config.max_concurrency
+        )
+
     def should_run(self) -> bool:
         """Check if scraper should run based on config and resources"""
         return self.config.enabled and self.resource_monitor.can_run_task(
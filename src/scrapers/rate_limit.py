@@ -0,0 +1,47 @@
+import asyncio
+import threading
+import time
+from typing import Optional
+
+
+class TokenBucket:
+    """Async token bucket shared by every request a scraper issues.
+
+    Tokens refill continuously at ``rate_per_minute / 60`` per second up to
+    ``capacity``; ``acquire`` waits until a token is available. Scrapers are
+    cached per process and used from whichever event loop runs the task, so
+    the bucket holds no loop-bound primitives: each caller reserves its token
+    under a thread lock and then sleeps off its own deficit.
+    """
+
+    def __init__(self, rate_per_minute: int, capacity: Optional[int] = None):
+        if rate_per_minute <= 0:
+            raise ValueError("rate_per_minute must be positive")
+        self.rate = rate_per_minute / 60.0
+        self.capacity = max(1, capacity or 1)
+        self._tokens = float(self.capacity)
+        self._updated_at = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _refill(self) -> None:
+        now = time.monotonic()
+        elapsed = now - self._updated_at
+        self._tokens = min(self.capacity, self._tokens + elapsed * self.rate)
+        self._updated_at = now
+
+    async def acquire(self) -> None:
+        # Reserving before sleeping keeps waiters FIFO: a later caller always
+        # owes more than an earlier one, so a burst cannot starve anybody
+        with self._lock:
+            self._refill()
+            self._tokens -= 1
+            deficit = -self._tokens
+        if deficit <= 0:
+            return
+        try:
+            await asyncio.sleep(deficit / self.rate)
+        except asyncio.CancelledError:
+            # Hand the unused reservation back
+            with self._lock:
+                self._tokens += 1
+            raise
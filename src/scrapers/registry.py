@@ -1,14 +1,47 @@
+"""Scraper registry with lazily loaded plugins.
+
+Scrapers are registered as factories under their source name, either by
+hand (``register_factory``) or from the ``job_intel.scrapers`` entry-point
+group declared in pyproject.toml. A factory is given as ``"module:attr"``
+and is only imported the first time its source is requested, so importing
+the registry (e.g. at API startup) doesn't pull in every scraper's
+dependencies. A factory takes the source's options from
+``settings.SCRAPERS[name]`` and returns a BaseScraper.
+"""
+
 import asyncio
-from typing import Dict, List, Optional
-from src.scrapers.base import BaseScraper
+from importlib import import_module
+from importlib.metadata import entry_points
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Tuple, Union
+
 import structlog
 
+from src.core.config import settings
+from src.db.models import Job
+from src.scrapers.base import BaseScraper
+
 logger = structlog.get_logger()
 
+ENTRY_POINT_GROUP = "job_intel.scrapers"
+
+# Used when the package isn't installed, so its entry points aren't visible
+BUILTIN_SCRAPERS: Dict[str, str] = {
+    "tavily": "src.scrapers.tavily:create_scraper",
+}
+
+ScraperFactory = Callable[[Dict[str, Any]], BaseScraper]
+
+
+def _load_target(target: str) -> ScraperFactory:
+    module_name, _, attr = target.partition(":")
+    return getattr(import_module(module_name), attr)
+
 
 class ScraperRegistry:
-    def __init__(self):
+    def __init__(self, discover: bool = False):
         self._scrapers: Dict[str, BaseScraper] = {}
+        self._factories: Dict[str, Union[str, ScraperFactory]] = {}
+        self._discover = discover
 
     def register(self, scraper: BaseScraper):
         name = scraper.get_source_name()
@@ -17,35 +50,96 @@ class ScraperRegistry:
         self._scrapers[name] = scraper
         logger.info("scraper_registered", name=name)
 
+    def register_factory(self, name: str, factory: Union[str, ScraperFactory]):
+        """Register ``factory`` (a callable or ``"module:attr"``) for ``name``"""
+        self._factories[name] = factory
+
+    def discover(self) -> None:
+        """Register built-in and entry-point factories without importing them"""
+        self._discover = False
+        for name, target in BUILTIN_SCRAPERS.items():
+            self._factories.setdefault(name, target)
+        found = entry_points()
+        if hasattr(found, "select"):
+            found = found.select(group=ENTRY_POINT_GROUP)
+        else:
+            # Python 3.9: a dict of groups
+            found = found.get(ENTRY_POINT_GROUP, [])
+        for entry_point in found:
+            self._factories[entry_point.name] = entry_point.value
+
+    def names(self) -> List[str]:
+        if self._discover:
+            self.discover()
+        return sorted(set(self._scrapers) | set(self._factories))
+
     def get(self, name: str) -> Optional[BaseScraper]:
-        return self._scrapers.get(name)
+        scraper = self._scrapers.get(name)
+        if scraper is not None:
+            return scraper
+        if self._discover:
+            self.discover()
+        factory = self._factories.get(name)
+        if factory is None:
+            return None
+
+        try:
+            if isinstance(factory, str):
+                factory = _load_target(factory)
+            scraper = factory(dict(settings.SCRAPERS.get(name, {})))
+        except Exception as e:
+            logger.error("scraper_load_failed", name=name, error=str(e))
+            return None
+        self._scrapers[name] = scraper
+        logger.info("scraper_loaded", name=name)
+        return scraper
 
     def get_all_enabled(self) -> List[BaseScraper]:
-        return [s for s in self._scrapers.values() if s.config.enabled]
+        scrapers = []
+        for name in self.names():
+            options = settings.SCRAPERS.get(name, {})
+            # Disabled plugins are never imported
+            if name not in self._scrapers and not options.get("enabled", True):
+                continue
+            scraper = self.get(name)
+            if scraper is not None and scraper.config.enabled:
+                scrapers.append(scraper)
+        return scrapers
+
+    async def run_all(self) -> AsyncIterator[Tuple[str, List[Job]]]:
+        """Run all enabled scrapers concurrently.
 
-    async def run_all(self) -> List[object]:
-        """Run all enabled scrapers concurrently"""
-        tasks = []
+        Yields ``(source, jobs)`` as each scraper finishes; failed scrapers
+        are logged and skipped.
+        """
+        tasks = {}
         for scraper in self.get_all_enabled():
+            name = scraper.get_source_name()
             if scraper.should_run():
-                tasks.append(scraper.fetch_jobs())
+                tasks[asyncio.ensure_future(scraper.fetch_jobs())] = name
             else:
-                logger.info("scraper_skipped", name=scraper.get_source_name())
-
-        if not tasks:
-            return []
-
-        results = await asyncio.gather(*tasks, return_exceptions=True)
-
-        all_jobs = []
-        for res in results:
-            if isinstance(res, Exception):
-                logger.error("scraper_run_failed", error=str(res))
-            elif isinstance(res, list):
-                all_jobs.extend(res)
+                logger.info("scraper_skipped", name=name)
 
-        return all_jobs
+        pending = set(tasks)
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    name = tasks[task]
+                    if task.exception() is not None:
+                        logger.error(
+                            "scraper_run_failed",
+                            name=name,
+                            error=str(task.exception()),
+                        )
+                        continue
+                    yield name, task.result()
+        finally:
+            for task in pending:
+                task.cancel()
 
 
-# Global registry instance
-scraper_registry = ScraperRegistry()
+# Global registry instance; plugins are discovered on first lookup
+scraper_registry = ScraperRegistry(discover=True)
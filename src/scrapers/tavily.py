@@ -1,8 +1,7 @@
-import json
 import asyncio
 import datetime
 import structlog
-from typing import List, Dict, Optional
+from typing import Any, AsyncIterator, List, Dict, Optional
 import httpx
 
 from src.core.config import settings
@@ -20,11 +19,13 @@ from src.services.parsers import (
     parse_title_company,
     build_external_id,
     tokenize,
-    infer_location,
 )
 
 
 from src.scrapers.base import BaseScraper, ScraperConfig
+from src.services.concurrency import AdaptiveLimiter
+from src.services.query_watermarks import QueryWatermarks
+from src.services.resource_monitor import resource_monitor
 
 logger = structlog.get_logger()
 
@@ -33,7 +34,7 @@ class TavilyScraper(BaseScraper):
     def __init__(
         self,
         config: ScraperConfig,
-        http_client: httpx.AsyncClient,
+        http_client: Optional[httpx.AsyncClient],
         resource_monitor,
         api_key: str,
     ):
@@ -46,23 +47,66 @@ class TavilyScraper(BaseScraper):
         return SOURCE_TAVILY
 
     async def fetch_jobs(self) -> List[Job]:
+        return [job async for job in self.stream_jobs()]
+
+    async def stream_jobs(
+        self, watermarks: Optional[QueryWatermarks] = None
+    ) -> AsyncIterator[Job]:
         if not self.api_key:
             logger.error("tavily_api_key_missing")
-            return []
+            return
 
-        jobs: List[Job] = []
         seen: set[str] = set()
+        limits = {query: self.config.max_results for query in self.queries}
+        if watermarks is not None:
+            await watermarks.load(self.queries)
+            limits = {
+                query: watermarks.limit_for(query, self.config.max_results)
+                for query in self.queries
+            }
+
+        # Queries fan out concurrently; the adaptive limiter bounds in-flight
+        # requests and the shared token bucket enforces config.rate_limit_rpm.
+        # Each query's jobs are yielded as soon as it completes.
+        limiter = self.request_limiter()
+        tasks = [
+            asyncio.create_task(
+                self._fetch_query(query, limiter, max_results, watermarks)
+            )
+            for query, max_results in limits.items()
+            if max_results
+        ]
+
+        try:
+            for finished in asyncio.as_completed(tasks):
+                for job in await finished:
+                    if job.external_id not in seen:
+                        seen.add(job.external_id)
+                        yield job
+        finally:
+            for task in tasks:
+                task.cancel()
 
-        for query in self.queries:
+    async def _fetch_query(
+        self,
+        query: str,
+        limiter: AdaptiveLimiter,
+        max_results: int,
+        watermarks: Optional[QueryWatermarks] = None,
+    ) -> List[Job]:
+        async with limiter:
             if not self.should_run():
-                logger.warning("scraper_stopped_throttling", source=SOURCE_TAVILY)
-                break
+                logger.warning(
+                    "scraper_stopped_throttling", source=SOURCE_TAVILY, query=query
+                )
+                return []
 
             try:
+                await self.rate_limiter.acquire()
                 payload = {
                     "api_key": self.api_key,
                     "query": query,
-                    "max_results": self.config.max_results,
+                    "max_results": max_results,
                     "search_depth": settings.TAVILY_SEARCH_DEPTH,
                     "include_answer": False,
                     "include_raw_content": False,
@@ -73,19 +117,18 @@ class TavilyScraper(BaseScraper):
                 )
                 response.raise_for_status()
                 data = response.json()
-
-                for result in data.get("results", []):
-                    job = self._process_result(result, query)
-                    if job and job.external_id not in seen:
-                        seen.add(job.external_id)
-                        jobs.append(job)
-
-                # Respect rate limits
-                await asyncio.sleep(0.5)
-
             except Exception as e:
                 logger.error("tavily_fetch_error", query=query, error=str(e))
-
+                return []
+
+        jobs = []
+        for result in data.get("results", []):
+            job = self._process_result(result, query)
+            if job:
+                jobs.append(job)
+        if watermarks is not None:
+            # Failed requests return above and leave the watermark alone
+            watermarks.record(query, [job.external_id for job in jobs])
         return jobs
 
     def _process_result(self, result: Dict, query: str) -> Optional[Job]:
@@ -163,3 +206,12 @@ class TavilyScraper(BaseScraper):
         if "canada" in lowered:
             return "Canada"
         return "Canada"
+
+
+def create_scraper(options: Dict[str, Any]) -> TavilyScraper:
+    """Plugin factory (see src.scrapers.registry); uses the shared HTTP pool"""
+    options.setdefault("max_results", settings.TAVILY_MAX_RESULTS)
+    config = ScraperConfig(name=SOURCE_TAVILY, **options)
+    return TavilyScraper(
+        config, None, resource_monitor, api_key=settings.TAVILY_API_KEY
+    )
@@ -0,0 +1,149 @@
+"""Adaptive concurrency for background work, driven by ResourceMonitor.
+
+Scrapers' in-flight request limits and cleanup batch sizes are AIMD limits:
+every new resource sample at NORMAL adds a fixed step (a tenth of the
+maximum by default), LIGHT and HEAVY multiply the limit by a backoff
+factor, and PAUSE drops it to the minimum. Limits move once per sample,
+not once per read, so a busy pool does not collapse to its minimum between
+two samples. API request handling never goes through a limit here.
+"""
+
+import asyncio
+import threading
+from typing import Callable, Dict, Optional
+
+from src.core.config import settings
+from src.monitoring.metrics import CONCURRENCY_LIMIT
+from src.services.resource_monitor import (
+    ClusterResourceView,
+    ResourceMonitor,
+    ThrottleLevel,
+    resource_monitor,
+)
+
+
+class AdaptiveLimit:
+    def __init__(
+        self,
+        name: str,
+        maximum: int,
+        minimum: int = 1,
+        recovery_steps: Optional[int] = None,
+    ):
+        self.name = name
+        self.minimum = max(1, minimum)
+        self.maximum = max(self.minimum, maximum)
+        self.current = float(self.maximum)
+        # Settings are read per call so runtime overrides take effect
+        if recovery_steps is None:
+            recovery_steps = settings.CONCURRENCY_RECOVERY_STEPS
+        self.recovery_steps = recovery_steps
+        self.step = max(1.0, self.maximum / recovery_steps)
+        CONCURRENCY_LIMIT.labels(pool=name).set(self.value)
+
+    @property
+    def value(self) -> int:
+        return int(self.current)
+
+    def rebound(self, maximum: int) -> None:
+        """Change the maximum, keeping the current backoff proportionally"""
+        maximum = max(self.minimum, maximum)
+        if maximum == self.maximum:
+            return
+        self.current = max(self.minimum, self.current * maximum / self.maximum)
+        self.maximum = maximum
+        self.step = max(1.0, maximum / self.recovery_steps)
+        CONCURRENCY_LIMIT.labels(pool=self.name).set(self.value)
+
+    def update(
+        self,
+        level: ThrottleLevel,
+        light_factor: Optional[float] = None,
+        heavy_factor: Optional[float] = None,
+    ) -> int:
+        if light_factor is None:
+            light_factor = settings.CONCURRENCY_LIGHT_FACTOR
+        if heavy_factor is None:
+            heavy_factor = settings.CONCURRENCY_HEAVY_FACTOR
+        if level == ThrottleLevel.NORMAL:
+            self.current = min(self.maximum, self.current + self.step)
+        elif level == ThrottleLevel.PAUSE:
+            self.current = self.minimum
+        else:
+            factor = light_factor if level == ThrottleLevel.LIGHT else heavy_factor
+            self.current = max(self.minimum, self.current * factor)
+        CONCURRENCY_LIMIT.labels(pool=self.name).set(self.value)
+        return self.value
+
+
+class AdaptiveLimiter:
+    """Async semaphore whose size is re-read on every acquire.
+
+    A shrunk limit takes effect as in-flight work finishes; nothing already
+    running is interrupted.
+    """
+
+    def __init__(self, size: Callable[[], int]):
+        self._size = size
+        self._in_flight = 0
+        self._changed = asyncio.Condition()
+
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+
+    async def __aenter__(self):
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._in_flight < self._size())
+            self._in_flight += 1
+        return self
+
+    async def __aexit__(self, *exc_info):
+        async with self._changed:
+            self._in_flight -= 1
+            self._changed.notify_all()
+
+
+class AdaptiveConcurrencyController:
+    """Named AIMD limits that follow the monitor's effective throttle level"""
+
+    def __init__(self, monitor: ResourceMonitor = resource_monitor):
+        self.monitor = monitor
+        self._limits: Dict[str, AdaptiveLimit] = {}
+        self._seen: Optional[ClusterResourceView] = None
+        self._lock = threading.Lock()
+
+    def limit(self, name: str, maximum: int, minimum: int = 1) -> AdaptiveLimit:
+        with self._lock:
+            limit = self._limits.get(name)
+            if limit is None:
+                limit = self._limits[name] = AdaptiveLimit(name, maximum, minimum)
+            else:
+                limit.rebound(maximum)
+            return limit
+
+    def value(self, name: str, maximum: int, minimum: int = 1) -> int:
+        """Current size of ``name``, first applying any new resource sample"""
+        limit = self.limit(name, maximum, minimum)
+        self.adjust()
+        return limit.value
+
+    def limiter(self, name: str, maximum: int, minimum: int = 1) -> AdaptiveLimiter:
+        self.limit(name, maximum, minimum)
+        return AdaptiveLimiter(lambda: self.value(name, maximum, minimum))
+
+    def adjust(self) -> None:
+        view = self.monitor.get_cluster_view()
+        with self._lock:
+            if view is self._seen:
+                return
+            self._seen = view
+            for limit in self._limits.values():
+                limit.update(view.effective_level)
+
+    def snapshot(self) -> Dict[str, int]:
+        return {name: limit.value for name, limit in self._limits.items()}
+
+
+# Global instance for pools that use the process-wide resource monitor
+concurrency_controller = AdaptiveConcurrencyController()
@@ -0,0 +1,63 @@
+"""Serializers for the streaming job export (NDJSON / CSV, optional gzip).
+
+Each function consumes and yields async iterators so an export never holds
+more than one cursor batch in memory.
+"""
+
+import csv
+import io
+import json
+import zlib
+from datetime import datetime
+from typing import AsyncIterator, List
+
+from sqlalchemy import Row
+
+from src.services.job_service import EXPORT_COLUMNS
+
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+
+def _default(value):
+    if isinstance(value, datetime):
+        return value.isoformat()
+    raise TypeError(f"Unserializable export value: {value!r}")
+
+
+_encoder = json.JSONEncoder(default=_default)
+_TAGS_INDEX = EXPORT_COLUMNS.index("tags")
+
+
+async def ndjson_chunks(batches: AsyncIterator[List[Row]]) -> AsyncIterator[bytes]:
+    async for batch in batches:
+        lines = [
+            _encoder.encode(dict(zip(EXPORT_COLUMNS, row, strict=True)))
+            for row in batch
+        ]
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+
+async def csv_chunks(batches: AsyncIterator[List[Row]]) -> AsyncIterator[bytes]:
+    buffer = io.StringIO()
+    writer = csv.writer(buffer)
+    writer.writerow(EXPORT_COLUMNS)
+    async for batch in batches:
+        for row in batch:
+            row = list(row)
+            row[_TAGS_INDEX] = json.dumps(row[_TAGS_INDEX])
+            writer.writerow(row)
+        yield buffer.getvalue().encode("utf-8")
+        buffer.seek(0)
+        buffer.truncate()
+    # Header only, for an empty export
+    if buffer.tell():
+        yield buffer.getvalue().encode("utf-8")
+
+
+async def gzip_chunks(chunks: AsyncIterator[bytes]) -> AsyncIterator[bytes]:
+    compressor = zlib.compressobj(6, zlib.DEFLATED, zlib.MAX_WBITS | 16)
+    async for chunk in chunks:
+        compressed = compressor.compress(chunk)
+        if compressed:
+            yield compressed
+    yield compressor.flush()
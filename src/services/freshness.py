@@ -1,13 +1,30 @@
+import asyncio
+import time
 import httpx
+from collections import defaultdict
 from datetime import datetime, timedelta
-from typing import List, Optional, Dict
-from sqlalchemy import select, delete
+from typing import Any, Iterable, List, Optional, Dict
+from urllib.parse import urlsplit
+from sqlalchemy import select, delete, update, insert, literal, func, or_
 from sqlalchemy.ext.asyncio import AsyncSession
 import structlog
 
 from src.core.config import settings
-from src.db.models import Job, ArchivedJob
+from src.core.http import get_http_client
+from src.db.models import Job, ArchivedJob, JobLabel
+from src.db.partitions import (
+    drop_partitions_before,
+    ensure_partitions,
+    prune_default_partition,
+)
+from src.services.concurrency import (
+    AdaptiveConcurrencyController,
+    concurrency_controller,
+)
+from src.services.job_events import JobChanges
+from src.services.job_service import job_search
 from src.services.resource_monitor import resource_monitor, ThrottleLevel
+from src.services.summary_snapshot import SummaryDelta
 
 logger = structlog.get_logger()
 
@@ -17,9 +34,11 @@ class RetentionPolicy:
         self,
         expired_days: int = settings.RETENTION_EXPIRED_DAYS,
         archive_days: int = settings.RETENTION_ARCHIVE_DAYS,
+        archived_retention_days: int = settings.RETENTION_ARCHIVED_DAYS,
     ):
         self.expired_days = expired_days
         self.archive_days = archive_days
+        self.archived_retention_days = archived_retention_days
 
 
 class FreshnessManager:
@@ -28,42 +47,130 @@ class FreshnessManager:
         db: AsyncSession,
         http_client: Optional[httpx.AsyncClient] = None,
         policy: Optional[RetentionPolicy] = None,
+        concurrency: int = settings.VALIDATION_CONCURRENCY,
+        per_host_concurrency: int = settings.VALIDATION_PER_HOST_CONCURRENCY,
+        controller: Optional[AdaptiveConcurrencyController] = None,
     ):
         self.db = db
-        self.http = http_client or httpx.AsyncClient(
-            timeout=10.0, follow_redirects=True
-        )
+        self._http = http_client
         self.policy = policy or RetentionPolicy()
+        self.concurrency = concurrency
+        self.per_host_concurrency = per_host_concurrency
+        # concurrency and batch sizes are maxima; the controller shrinks
+        # them while the node is under load
+        self.controller = controller or concurrency_controller
+
+    @property
+    def http(self) -> httpx.AsyncClient:
+        """The given client, else the process-wide pool for the running loop"""
+        return self._http or get_http_client()
 
     async def check_job_validity(self, job: Job) -> bool:
         """Check if job URL is still valid (not 404/410/403)"""
         if not job.url:
             return True  # Assume valid if no URL
 
+        is_valid = await self._probe(job)
+        if is_valid is None:
+            # Don't mark invalid on transient network errors
+            return True
+
+        job.is_valid = is_valid
+        job.last_validated_at = datetime.utcnow()
+        return is_valid
+
+    async def validate_jobs(self, jobs: List[Job]) -> Dict[int, bool]:
+        """Check job URLs concurrently, bounded globally and per host.
+
+        Returns a verdict per job id; jobs without a URL or whose check hit a
+        network error are left out.
+        """
+        limiter = self.controller.limiter("validation", self.concurrency)
+        host_semaphores = defaultdict(
+            lambda: asyncio.Semaphore(self.per_host_concurrency)
+        )
+
+        async def check(job: Job):
+            # Wait for the host slot first so a busy host can't pin global slots
+            async with host_semaphores[urlsplit(job.url).hostname]:
+                async with limiter:
+                    return job.id, await self._probe(job)
+
+        results = await asyncio.gather(*(check(job) for job in jobs if job.url))
+        return {job_id: valid for job_id, valid in results if valid is not None}
+
+    async def apply_validation(
+        self, verdicts: Dict[int, bool], checked: Iterable[int] = ()
+    ) -> None:
+        """Persist a batch of verdicts: invalid jobs are soft-deleted.
+
+        ``checked`` jobs without a verdict (no URL, network error) only get
+        ``last_validated_at`` stamped, so they rotate to the back of the
+        queue instead of pinning the head of every batch.
+        """
+        now = datetime.utcnow()
+        invalid_ids = [job_id for job_id, valid in verdicts.items() if not valid]
+        valid_ids = [job_id for job_id, valid in verdicts.items() if valid]
+        skipped_ids = [job_id for job_id in checked if job_id not in verdicts]
+
+        if invalid_ids:
+            await self.db.execute(
+                update(Job)
+                .where(Job.id.in_(invalid_ids))
+                .values(is_valid=False, deleted_at=now, last_validated_at=now)
+            )
+        if valid_ids:
+            await self.db.execute(
+                update(Job)
+                .where(Job.id.in_(valid_ids))
+                .values(is_valid=True, last_validated_at=now)
+            )
+        if skipped_ids:
+            await self.db.execute(
+                update(Job).where(Job.id.in_(skipped_ids)).values(last_validated_at=now)
+            )
+        await self.db.commit()
+        logger.info(
+            "jobs_validated", valid=len(valid_ids), soft_deleted=len(invalid_ids)
+        )
+
+    async def _probe(self, job: Job) -> Optional[bool]:
         try:
             # We use HEAD to save bandwidth
             response = await self.http.head(job.url)
-            is_valid = response.status_code not in [404, 410, 403]
-
-            job.is_valid = is_valid
-            job.last_validated_at = datetime.utcnow()
-
-            return is_valid
+            return response.status_code not in [404, 410, 403]
         except Exception as e:
             logger.warning(
                 "validity_check_failed", job_id=job.id, url=job.url, error=str(e)
             )
-            # Don't mark invalid on transient network errors
-            return True
+            return None
+
+    def _is_active(self, job: Job) -> bool:
+        return job.is_valid is not False and job.deleted_at is None
 
     async def get_stale_jobs(self) -> List[Job]:
-        """Get jobs that haven't been validated recently"""
+        """Get jobs that haven't been seen by a scrape recently.
+
+        Unchanged re-scrapes only touch ``last_seen_at``, so a posting that
+        is still listed never counts as stale; rows from before that column
+        existed fall back to ``fetched_at``. Jobs validated since the cutoff
+        are skipped and the longest-unvalidated come first, so successive
+        batches walk the whole backlog.
+        """
         cutoff = datetime.utcnow() - timedelta(days=self.policy.expired_days)
 
+        batch_size = self.controller.value(
+            "validation_batch", settings.VALIDATION_BATCH_SIZE, minimum=10
+        )
         query = (
             select(Job)
-            .where(Job.fetched_at < cutoff, Job.deleted_at.is_(None))
-            .limit(100)
+            .where(
+                func.coalesce(Job.last_seen_at, Job.fetched_at) < cutoff,
+                Job.deleted_at.is_(None),
+                or_(Job.last_validated_at.is_(None), Job.last_validated_at < cutoff),
+            )
+            .order_by(Job.last_validated_at.asc().nulls_first(), Job.id)
+            .limit(batch_size)
         )  # Process in batches
 
         result = await self.db.execute(query)
@@ -89,14 +196,135 @@ class FreshnessManager:
         # Explicitly set ID if we want to preserve it, assuming no conflict
         archived.id = job.id
 
+        await self._ensure_archive_partitions()
         self.db.add(archived)
+        await self._delete_derived([job.id])
         await self.db.delete(job)
         await self.db.commit()
         logger.info("job_archived", job_id=job.id)
 
-    async def run_cleanup_cycle(self) -> Dict[str, int]:
-        """Run full cleanup cycle: validate -> soft-delete -> archive"""
-        stats = {"validated": 0, "soft_deleted": 0, "archived": 0}
+    async def archive_expired(
+        self,
+        budget_seconds: float = settings.ARCHIVE_TIME_BUDGET_SECONDS,
+        chunk_size: Optional[int] = None,
+    ) -> Dict[str, float]:
+        """Move soft-deleted jobs past the archive cutoff to archived_jobs.
+
+        Each chunk is one transaction: INSERT INTO archived_jobs SELECT ...,
+        then DELETE of the jobs and their derived rows. Loops until the
+        backlog is drained or ``budget_seconds`` has elapsed. Without an
+        explicit ``chunk_size`` each chunk takes the controller's current
+        size, up to ARCHIVE_CHUNK_SIZE.
+        """
+        cutoff = datetime.utcnow() - timedelta(days=self.policy.archive_days)
+        columns = [
+            c.name for c in ArchivedJob.__table__.columns if c.name != "archived_at"
+        ]
+        archived = 0
+        started = time.monotonic()
+        await self._ensure_archive_partitions()
+
+        while time.monotonic() - started < budget_seconds:
+            size = chunk_size or self.controller.value(
+                "archive_chunk", settings.ARCHIVE_CHUNK_SIZE, minimum=100
+            )
+            result = await self.db.execute(
+                select(Job.id)
+                .where(Job.deleted_at < cutoff)
+                .order_by(Job.id)
+                .limit(size)
+            )
+            job_ids = list(result.scalars().all())
+            if not job_ids:
+                break
+
+            source = select(
+                *[Job.__table__.c[name] for name in columns],
+                literal(datetime.utcnow()).label("archived_at"),
+            ).where(Job.id.in_(job_ids))
+            await self.db.execute(
+                insert(ArchivedJob.__table__).from_select(
+                    columns + ["archived_at"], source
+                )
+            )
+            await self._delete_derived(job_ids)
+            await self.db.execute(delete(Job.__table__).where(Job.id.in_(job_ids)))
+            await self.db.commit()
+            archived += len(job_ids)
+
+            if len(job_ids) < size:
+                break
+
+        elapsed = time.monotonic() - started
+        rate = round(archived / elapsed, 1) if elapsed > 0 else 0.0
+        logger.info("jobs_archived", archived=archived, seconds=elapsed, rate=rate)
+        return {"archived": archived, "rows_per_second": rate}
+
+    async def prune_archive(self) -> Dict[str, int]:
+        """Drop archived jobs older than the archived-retention window.
+
+        On Postgres whole monthly partitions are detached and dropped, so a
+        month is removed once all of it is past the cutoff, and expired rows
+        in the default partition are deleted; SQLite falls back to deleting
+        rows. A retention of 0 days keeps archived jobs forever.
+        """
+        result = {"partitions_dropped": 0, "rows_deleted": 0}
+        if self.policy.archived_retention_days <= 0:
+            return result
+
+        cutoff = datetime.utcnow() - timedelta(days=self.policy.archived_retention_days)
+        if self._dialect() == "postgresql":
+            dropped = await drop_partitions_before(
+                self.db, ArchivedJob.__tablename__, cutoff
+            )
+            result["partitions_dropped"] = len(dropped)
+            result["rows_deleted"] = await prune_default_partition(
+                self.db, ArchivedJob.__tablename__, "archived_at", cutoff
+            )
+        else:
+            deleted = await self.db.execute(
+                delete(ArchivedJob).where(ArchivedJob.archived_at < cutoff)
+            )
+            result["rows_deleted"] = deleted.rowcount
+        await self.db.commit()
+        logger.info("archive_pruned", cutoff=cutoff, **result)
+        return result
+
+    async def _ensure_archive_partitions(self) -> None:
+        if self._dialect() == "postgresql":
+            await ensure_partitions(
+                self.db, ArchivedJob.__tablename__, datetime.utcnow()
+            )
+
+    def _dialect(self) -> str:
+        return self.db.get_bind().dialect.name
+
+    async def _delete_derived(self, job_ids: List[int]) -> None:
+        """Drop label and search-index rows for jobs about to be deleted"""
+        await self.db.execute(delete(JobLabel).where(JobLabel.job_id.in_(job_ids)))
+        if self._dialect() == "sqlite":
+            await self.db.execute(
+                delete(job_search).where(job_search.c.rowid.in_(job_ids))
+            )
+
+    async def run_cleanup_cycle(
+        self,
+        delta: Optional[SummaryDelta] = None,
+        changes: Optional[JobChanges] = None,
+    ) -> Dict[str, Any]:
+        """Run full cleanup cycle: validate -> soft-delete -> archive -> prune.
+
+        Jobs that leave (or re-enter) the active set are recorded in ``delta``;
+        soft-deleted job ids are recorded in ``changes``.
+        """
+        stats = {
+            "validated": 0,
+            "soft_deleted": 0,
+            "archived": 0,
+            "archive_rows_per_second": 0.0,
+            "archive_partitions_dropped": 0,
+            "archive_rows_pruned": 0,
+        }
 
         # Check resource status first
         status = resource_monitor.get_current_status()
@@ -106,23 +334,35 @@ class FreshnessManager:
 
         # 1. Soft delete expired/invalid jobs
         stale_jobs = await self.get_stale_jobs()
-        for job in stale_jobs:
-            is_valid = await self.check_job_validity(job)
-            stats["validated"] += 1
+        was_active = {job.id: self._is_active(job) for job in stale_jobs}
+        verdicts = await self.validate_jobs(stale_jobs)
+        await self.apply_validation(verdicts, [job.id for job in stale_jobs])
+        stats["validated"] = len(stale_jobs)
+        stats["soft_deleted"] = sum(1 for valid in verdicts.values() if not valid)
+        if changes is not None:
+            for job_id, valid in verdicts.items():
+                if not valid:
+                    changes.remove(job_id)
 
-            if not is_valid:
-                await self.soft_delete_job(job)
-                stats["soft_deleted"] += 1
+        if delta is not None:
+            for job in stale_jobs:
+                # Stale jobs are selected with deleted_at IS NULL, so the
+                # verdict alone decides whether the job is active afterwards
+                if job.id not in verdicts or was_active[job.id] == verdicts[job.id]:
+                    continue
+                if was_active[job.id]:
+                    delta.remove(job.is_remote, job.location, job.tags)
+                else:
+                    delta.add(job.is_remote, job.location, job.tags)
 
         # 2. Archive old soft-deleted jobs
-        archive_cutoff = datetime.utcnow() - timedelta(days=self.policy.archive_days)
-        query = select(Job).where(Job.deleted_at < archive_cutoff).limit(100)
-
-        result = await self.db.execute(query)
-        to_archive = result.scalars().all()
+        archive = await self.archive_expired()
+        stats["archived"] = archive["archived"]
+        stats["archive_rows_per_second"] = archive["rows_per_second"]
 
-        for job in to_archive:
-            await self.archive_job(job)
-            stats["archived"] += 1
+        # 3. Enforce retention on the archive itself
+        pruned = await self.prune_archive()
+        stats["archive_partitions_dropped"] = pruned["partitions_dropped"]
+        stats["archive_rows_pruned"] = pruned["rows_deleted"]
 
         return stats
@@ -0,0 +1,131 @@
+"""Streaming scrape ingest.
+
+A scraper's ``stream_jobs()`` feeds a bounded queue; a writer drains it and
+upserts every ``batch_size`` jobs or ``flush_seconds`` after the first job
+of a batch, whichever comes first. Fetching and writing overlap, memory is
+bounded by the queue plus one batch, and every committed batch survives a
+crash later in the run. Each batch also applies its summary delta,
+invalidates the response cache and publishes its job changes, exactly as a
+whole scrape used to.
+
+Only jobs ride on the batch commits. Per-run state such as query
+watermarks belongs to the caller, which persists it on its own session
+once ``run()`` returns; a failed run raises before that, so no query is
+marked as scraped while its jobs were cut off.
+"""
+
+import asyncio
+from typing import AsyncIterator, List
+
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from src.core.config import settings
+from src.db.models import Job
+from src.services.job_events import JobChanges, publish_job_changes
+from src.services.job_service import JobService, UpsertResult
+from src.services.response_cache import invalidate_response_cache
+from src.services.summary_snapshot import SummaryDelta, SummarySnapshotService
+
+logger = structlog.get_logger()
+
+_DONE = object()
+
+
+class ScrapeIngestor:
+    def __init__(
+        self,
+        db: AsyncSession,
+        source: str,
+        batch_size: int = settings.SCRAPE_BATCH_SIZE,
+        flush_seconds: float = settings.SCRAPE_FLUSH_SECONDS,
+        queue_size: int = settings.SCRAPE_QUEUE_SIZE,
+    ):
+        self.db = db
+        self.source = source
+        self.batch_size = max(1, batch_size)
+        self.flush_seconds = flush_seconds
+        self.queue_size = queue_size
+        self.batches = 0
+
+    async def run(self, jobs: AsyncIterator[Job]) -> UpsertResult:
+        """Drain ``jobs`` into the database; returns the totals over all batches.
+
+        If the stream fails, jobs already received are still written before
+        the error is re-raised.
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=self.queue_size)
+        producer = asyncio.create_task(self._produce(jobs, queue))
+        total = UpsertResult()
+        batch: List[Job] = []
+        loop = asyncio.get_running_loop()
+        deadline = 0.0
+
+        try:
+            while True:
+                timeout = max(0.0, deadline - loop.time()) if batch else None
+                try:
+                    job = await asyncio.wait_for(queue.get(), timeout)
+                except asyncio.TimeoutError:
+                    await self._flush(batch, total)
+                    continue
+                if job is _DONE:
+                    break
+                if not batch:
+                    deadline = loop.time() + self.flush_seconds
+                batch.append(job)
+                if len(batch) >= self.batch_size:
+                    await self._flush(batch, total)
+            await self._flush(batch, total)
+            # Surfaces a scraper error once everything it produced is stored
+            await producer
+        finally:
+            producer.cancel()
+            await asyncio.gather(producer, return_exceptions=True)
+            # Lets the scraper's generator clean up (e.g. cancel its requests)
+            aclose = getattr(jobs, "aclose", None)
+            if aclose is not None:
+                await aclose()
+
+        logger.info(
+            "scrape_ingested",
+            source=self.source,
+            batches=self.batches,
+            inserted=total.inserted,
+            updated=total.updated,
+            unchanged=total.unchanged,
+        )
+        return total
+
+    async def _produce(self, jobs: AsyncIterator[Job], queue: asyncio.Queue) -> None:
+        try:
+            async for job in jobs:
+                await queue.put(job)
+        except asyncio.CancelledError:
+            # The writer is gone; nobody waits for the end marker
+            raise
+        except Exception:
+            await queue.put(_DONE)
+            raise
+        await queue.put(_DONE)
+
+    async def _flush(self, batch: List[Job], total: UpsertResult) -> None:
+        if not batch:
+            return
+        delta = SummaryDelta()
+        changes = JobChanges()
+        result = await JobService(self.db).bulk_upsert(
+            batch, delta=delta, changes=changes
+        )
+        await SummarySnapshotService(self.db).apply_delta(delta)
+        if result.inserted or result.updated:
+            # Unchanged re-scrapes only touch last_seen_at, which no
+            # cached response or client event exposes
+            await invalidate_response_cache()
+            await publish_job_changes(changes, source=self.source)
+
+        total.inserted += result.inserted
+        total.updated += result.updated
+        total.unchanged += result.unchanged
+        self.batches += 1
+        batch.clear()
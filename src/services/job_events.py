@@ -0,0 +1,146 @@
+"""Job change events pushed from workers to WebSocket clients.
+
+Scrape and cleanup tasks collect a JobChanges while they write and publish
+it on the ``job-intel:events`` Redis channel after committing. Each API
+process runs a JobEventRelay that subscribes to the channel and hands every
+payload, still JSON-encoded, to the WebSocket connection manager.
+
+Event format::
+
+    {"type": "jobs_changed", "source": "tavily",
+     "new": [{"id": 1, "title": ...}], "updated": [...], "removed": [7, 9]}
+"""
+
+import asyncio
+import json
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+import structlog
+
+from src.core.config import settings
+
+logger = structlog.get_logger()
+
+CHANNEL = "job-intel:events"
+
+# Job fields carried in events; enough to render a row in the roles table
+EVENT_FIELDS = [
+    "id",
+    "source",
+    "title",
+    "company",
+    "location",
+    "url",
+    "salary_text",
+    "is_remote",
+]
+
+
+@dataclass
+class JobChanges:
+    """Jobs inserted, rewritten or retired by one task run"""
+
+    new: List[Dict[str, Any]] = field(default_factory=list)
+    updated: List[Dict[str, Any]] = field(default_factory=list)
+    removed: List[int] = field(default_factory=list)
+
+    def add(self, job_id: int, row: Dict[str, Any], inserted: bool) -> None:
+        entry = {name: row.get(name) for name in EVENT_FIELDS}
+        entry["id"] = job_id
+        (self.new if inserted else self.updated).append(entry)
+
+    def remove(self, job_id: int) -> None:
+        self.removed.append(job_id)
+
+    def events(
+        self, source: Optional[str], max_jobs: int = settings.JOB_EVENTS_MAX_JOBS
+    ) -> Iterator[Dict[str, Any]]:
+        """Split into messages of at most ``max_jobs`` entries each"""
+        items = (
+            [("new", job) for job in self.new]
+            + [("updated", job) for job in self.updated]
+            + [("removed", job_id) for job_id in self.removed]
+        )
+        for start in range(0, len(items), max_jobs):
+            event = {
+                "type": "jobs_changed",
+                "source": source,
+                "new": [],
+                "updated": [],
+                "removed": [],
+            }
+            for kind, item in items[start : start + max_jobs]:
+                event[kind].append(item)
+            yield event
+
+    def __bool__(self) -> bool:
+        return bool(self.new or self.updated or self.removed)
+
+
+async def publish_job_changes(changes: JobChanges, source: Optional[str] = None) -> int:
+    """Publish from a worker; uses a short-lived client on the current loop.
+
+    Returns the number of messages published. Failures are logged only:
+    clients resync on their next full fetch.
+    """
+    if not changes or not settings.JOB_EVENTS_ENABLED:
+        return 0
+    redis = aioredis.from_url(settings.REDIS_URL)
+    published = 0
+    try:
+        for event in changes.events(source, settings.JOB_EVENTS_MAX_JOBS):
+            await redis.publish(CHANNEL, json.dumps(event, default=str))
+            published += 1
+    except RedisError as e:
+        logger.warning("job_events_publish_failed", error=str(e))
+    finally:
+        await redis.aclose()
+    logger.info(
+        "job_events_published",
+        messages=published,
+        new=len(changes.new),
+        updated=len(changes.updated),
+        removed=len(changes.removed),
+    )
+    return published
+
+
+class JobEventRelay:
+    """Forwards raw event payloads from Redis pub/sub to ``on_event``.
+
+    Reconnects after ``retry_seconds`` when the subscription fails.
+    """
+
+    def __init__(
+        self,
+        redis: aioredis.Redis,
+        on_event: Callable[[str], Awaitable[Any]],
+        channel: str = CHANNEL,
+        retry_seconds: float = 5.0,
+    ):
+        self.redis = redis
+        self.on_event = on_event
+        self.channel = channel
+        self.retry_seconds = retry_seconds
+
+    async def run(self) -> None:
+        while True:
+            try:
+                async with self.redis.pubsub() as pubsub:
+                    await pubsub.subscribe(self.channel)
+                    logger.info("job_event_relay_subscribed", channel=self.channel)
+                    async for message in pubsub.listen():
+                        if message["type"] != "message":
+                            continue
+                        data = message["data"]
+                        await self.on_event(
+                            data.decode() if isinstance(data, bytes) else data
+                        )
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("job_event_relay_failed", error=str(e))
+                await asyncio.sleep(self.retry_seconds)
@@ -1,68 +1,581 @@
-from typing import List, Optional
+import base64
+import json
+import re
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy import select, update
+from sqlalchemy import (
+    Row,
+    select,
+    update,
+    delete,
+    insert,
+    exists,
+    tuple_,
+    literal_column,
+    func,
+    table,
+    column,
+)
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 import structlog
 
-from src.db.models import Job
+from src.db.models import (
+    Job,
+    JobLabel,
+    Metric,
+    JOB_SEARCH_COLUMNS,
+    JOB_SEARCH_TABLE,
+    JOB_SEARCH_VECTOR,
+)
 from src.core.config import settings
+from src.monitoring.metrics import SCRAPE_NEW_JOBS_PER_REQUEST
+from src.services.parsers import build_content_hash, derive_tags
+from src.services.job_events import JobChanges
+from src.services.summary_snapshot import SummaryDelta
 
 logger = structlog.get_logger()
 
+# Bind parameter ceilings per dialect (SQLite >= 3.32 and the Postgres wire protocol)
+MAX_BIND_PARAMS = {"sqlite": 32766, "postgresql": 32767}
+DEFAULT_MAX_BIND_PARAMS = 999
+
+# Columns written on insert; everything except the surrogate key
+UPSERT_COLUMNS = [c.name for c in Job.__table__.columns if c.name != "id"]
+
+# Columns refreshed when a (source, external_id) pair already exists.
+# is_valid / deleted_at / last_validated_at are owned by the freshness pipeline.
+UPDATE_COLUMNS = [
+    "title",
+    "company",
+    "location",
+    "salary_min",
+    "salary_max",
+    "salary_text",
+    "tags",
+    "url",
+    "is_remote",
+    "fetched_at",
+    "content_hash",
+    "last_seen_at",
+    "updated_at",
+]
+
+# Classifier label kinds persisted to job_labels (keys of Job.tags)
+LABEL_KINDS = ["skills", "innovations", "weird"]
+
+# Scraped fields that make up a job's content fingerprint
+HASHED_COLUMNS = [
+    "title",
+    "company",
+    "location",
+    "salary_min",
+    "salary_max",
+    "salary_text",
+    "category",
+    "tags",
+    "url",
+    "is_remote",
+]
+
+# SQLite FTS5 index (see models.JOB_SEARCH_TABLE); rowid is jobs.id
+job_search = table(
+    JOB_SEARCH_TABLE,
+    column("rowid"),
+    *[column(name) for name in JOB_SEARCH_COLUMNS],
+    # FTS5 exposes a hidden column named after the table for MATCH
+    column(JOB_SEARCH_TABLE),
+)
+
+# Columns written by the export endpoint, in Job.to_dict order
+EXPORT_COLUMNS = [
+    "id",
+    "source",
+    "external_id",
+    "title",
+    "company",
+    "location",
+    "salary_min",
+    "salary_max",
+    "salary_text",
+    "category",
+    "tags",
+    "url",
+    "published_at",
+    "fetched_at",
+    "is_remote",
+    "is_valid",
+    "last_validated_at",
+]
+
+# bm25 column weights for title, company, location, skills
+SEARCH_WEIGHTS = (10.0, 2.0, 1.0, 3.0)
+
+
+@dataclass
+class UpsertResult:
+    inserted: int = 0
+    updated: int = 0
+    unchanged: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.inserted + self.updated + self.unchanged
+
 
 class JobService:
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def upsert_batch(self, jobs: List[Job]) -> int:
+        result = await self.bulk_upsert(jobs)
+        return result.total
+
+    async def bulk_upsert(
+        self,
+        jobs: List[Job],
+        delta: Optional[SummaryDelta] = None,
+        changes: Optional[JobChanges] = None,
+    ) -> UpsertResult:
+        """Upsert jobs with one multi-row INSERT ... ON CONFLICT per chunk.
+
+        Rows whose content hash matches the stored one are not rewritten;
+        they only get a ``last_seen_at`` touch when UPSERT_TOUCH_UNCHANGED is set.
+        When ``delta`` is given, summary counter changes for every inserted or
+        rewritten row are collected into it; ``changes`` collects those rows
+        for the WebSocket change feed.
+        """
+        result = UpsertResult()
         if not jobs:
-            return 0
+            return result
 
-        count = 0
+        now = datetime.utcnow()
+        # A single statement may not touch the same conflict key twice,
+        # so collapse duplicates keeping the last occurrence.
+        rows_by_key: Dict[tuple, Dict[str, Any]] = {}
         for job in jobs:
-            try:
-                # Check if exists
-                query = select(Job).where(
-                    Job.source == job.source, Job.external_id == job.external_id
-                )
-                result = await self.db.execute(query)
-                existing = result.scalars().first()
-
-                if existing:
-                    # Update existing
-                    existing.title = job.title
-                    existing.company = job.company
-                    existing.location = job.location
-                    existing.salary_min = job.salary_min
-                    existing.salary_max = job.salary_max
-                    existing.salary_text = job.salary_text
-                    existing.tags = job.tags
-                    existing.url = job.url
-                    existing.is_remote = job.is_remote
-                    existing.fetched_at = job.fetched_at
-                    # Don't update is_valid or first_seen (implied)
-                else:
-                    self.db.add(job)
-
-                count += 1
-            except Exception as e:
-                logger.error(
-                    "job_upsert_failed",
-                    source=job.source,
-                    ext_id=job.external_id,
-                    error=str(e),
-                )
+            row = self._job_to_row(job, now)
+            rows_by_key[(row["source"], row["external_id"])] = row
+        rows = list(rows_by_key.values())
 
+        dialect = self.db.get_bind().dialect.name
+        chunk_size = self._chunk_size(dialect)
+
+        try:
+            for start in range(0, len(rows), chunk_size):
+                chunk = rows[start : start + chunk_size]
+                counts = await self._upsert_chunk(dialect, chunk, now, delta, changes)
+                result.inserted += counts.inserted
+                result.updated += counts.updated
+                result.unchanged += counts.unchanged
+            await self.db.commit()
+        except Exception as e:
+            await self.db.rollback()
+            logger.error("job_upsert_failed", rows=len(rows), error=str(e))
+            raise
+
+        logger.info(
+            "jobs_upserted",
+            dialect=dialect,
+            inserted=result.inserted,
+            updated=result.updated,
+            unchanged=result.unchanged,
+        )
+        return result
+
+    async def record_run(
+        self,
+        source: str,
+        result: UpsertResult,
+        duration_seconds: float,
+        requests: Optional[int] = None,
+    ) -> Metric:
+        """Persist per-run new/changed/unchanged counters and API requests"""
+        metric = Metric(
+            source=source,
+            total_jobs=result.total,
+            new_jobs=result.inserted,
+            changed_jobs=result.updated,
+            unchanged_jobs=result.unchanged,
+            duration_seconds=duration_seconds,
+            requests=requests,
+        )
+        self.db.add(metric)
         await self.db.commit()
-        return count
+        if metric.new_jobs_per_request is not None:
+            SCRAPE_NEW_JOBS_PER_REQUEST.labels(source=source).set(
+                metric.new_jobs_per_request
+            )
+        return metric
+
+    async def _upsert_chunk(
+        self,
+        dialect: str,
+        chunk: List[Dict[str, Any]],
+        now: datetime,
+        delta: Optional[SummaryDelta] = None,
+        changes: Optional[JobChanges] = None,
+    ) -> UpsertResult:
+        """Execute one upsert statement and classify the chunk's rows.
+
+        Rows that were inserted or rewritten also get their job_labels replaced.
+        """
+        table = Job.__table__
+        keys = [(row["source"], row["external_id"]) for row in chunk]
+        # RETURNING makes SQLAlchemy render the chunk as a single multi-row
+        # VALUES clause ("insertmanyvalues") instead of a cursor executemany.
+        options = {"execution_options": {"insertmanyvalues_page_size": len(chunk)}}
+
+        if dialect == "postgresql":
+            # Prior contents are only needed to subtract them from the summary
+            stored = await self._load_stored(keys, True) if delta is not None else {}
+            stmt = pg_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["source", "external_id"],
+                set_={col: stmt.excluded[col] for col in UPDATE_COLUMNS},
+                where=table.c.content_hash.is_distinct_from(stmt.excluded.content_hash),
+            ).returning(
+                table.c.id,
+                table.c.source,
+                table.c.external_id,
+                literal_column("(xmax = 0)").label("inserted"),
+            )
+            written = (await self.db.execute(stmt, chunk, **options)).all()
+            await self._replace_labels(written, chunk)
+            inserted = sum(1 for row in written if row.inserted)
+            written_keys = {(row.source, row.external_id) for row in written}
+            unchanged_keys = [key for key in keys if key not in written_keys]
+            await self._touch_unchanged(unchanged_keys, now)
+            self._collect_delta(delta, written_keys, chunk, stored)
+            self._collect_changes(
+                changes, written, chunk, {r.id for r in written if r.inserted}
+            )
+            return UpsertResult(
+                inserted=inserted,
+                updated=len(written) - inserted,
+                unchanged=len(unchanged_keys),
+            )
+
+        if dialect != "sqlite":
+            raise ValueError(f"Bulk upsert not supported for dialect {dialect}")
+
+        # SQLite has no xmax equivalent, so resolve stored hashes up front
+        stored = await self._load_stored(keys, delta is not None)
+
+        pending = []
+        unchanged_keys = []
+        for key, row in zip(keys, chunk, strict=True):
+            if key in stored and stored[key].content_hash == row["content_hash"]:
+                unchanged_keys.append(key)
+            else:
+                pending.append(row)
+
+        if pending:
+            stmt = sqlite_insert(table)
+            stmt = stmt.on_conflict_do_update(
+                index_elements=["source", "external_id"],
+                set_={col: stmt.excluded[col] for col in UPDATE_COLUMNS},
+            ).returning(table.c.id, table.c.source, table.c.external_id)
+            written = (await self.db.execute(stmt, pending, **options)).all()
+            await self._replace_labels(written, pending)
+            await self._index_search(written, pending)
+            self._collect_changes(
+                changes,
+                written,
+                pending,
+                {r.id for r in written if (r.source, r.external_id) not in stored},
+            )
+        await self._touch_unchanged(unchanged_keys, now)
+        self._collect_delta(
+            delta, [(r["source"], r["external_id"]) for r in pending], pending, stored
+        )
+
+        inserted = sum(1 for key in keys if key not in stored)
+        return UpsertResult(
+            inserted=inserted,
+            updated=len(pending) - inserted,
+            unchanged=len(unchanged_keys),
+        )
+
+    async def _load_stored(self, keys: List[tuple], with_contents: bool) -> Dict:
+        columns = [Job.source, Job.external_id, Job.content_hash]
+        if with_contents:
+            columns += [
+                Job.is_remote,
+                Job.location,
+                Job.tags,
+                Job.is_valid,
+                Job.deleted_at,
+            ]
+        existing = await self.db.execute(
+            select(*columns).where(tuple_(Job.source, Job.external_id).in_(keys))
+        )
+        return {(r.source, r.external_id): r for r in existing}
+
+    def _collect_delta(
+        self,
+        delta: Optional[SummaryDelta],
+        written_keys,
+        rows: List[Dict[str, Any]],
+        stored: Dict,
+    ) -> None:
+        if delta is None:
+            return
+        rows_by_key = {(r["source"], r["external_id"]): r for r in rows}
+        for key in written_keys:
+            row = rows_by_key[key]
+            old = stored.get(key)
+            if old is not None:
+                # is_valid / deleted_at are not overwritten by the upsert
+                active = old.is_valid and old.deleted_at is None
+                if active:
+                    delta.remove(old.is_remote, old.location, old.tags)
+            else:
+                active = row["is_valid"] and row["deleted_at"] is None
+            if active:
+                delta.add(row["is_remote"], row["location"], row["tags"])
+
+    def _collect_changes(
+        self,
+        changes: Optional[JobChanges],
+        written,
+        rows: List[Dict[str, Any]],
+        inserted_ids: set,
+    ) -> None:
+        if changes is None:
+            return
+        rows_by_key = {(r["source"], r["external_id"]): r for r in rows}
+        for row in written:
+            key = (row.source, row.external_id)
+            changes.add(row.id, rows_by_key[key], row.id in inserted_ids)
+
+    async def _replace_labels(self, written, rows: List[Dict[str, Any]]) -> None:
+        if not written:
+            return
+        tags_by_key = {(r["source"], r["external_id"]): r["tags"] for r in rows}
+        job_ids = [row.id for row in written]
+        label_rows = [
+            {"job_id": row.id, "kind": kind, "label": label}
+            for row in written
+            for kind in LABEL_KINDS
+            for label in tags_by_key[(row.source, row.external_id)].get(kind, [])
+        ]
+
+        await self.db.execute(
+            delete(JobLabel.__table__).where(JobLabel.__table__.c.job_id.in_(job_ids))
+        )
+        if label_rows:
+            await self.db.execute(insert(JobLabel.__table__), label_rows)
+
+    async def _index_search(self, written, rows: List[Dict[str, Any]]) -> None:
+        """Refresh SQLite FTS5 rows for written jobs.
+
+        Postgres needs no equivalent: its GIN expression index is maintained
+        by the server on every write.
+        """
+        if not written:
+            return
+        rows_by_key = {(r["source"], r["external_id"]): r for r in rows}
+        documents = []
+        for row in written:
+            job = rows_by_key[(row.source, row.external_id)]
+            documents.append(
+                {
+                    "rowid": row.id,
+                    "title": job["title"],
+                    "company": job["company"],
+                    "location": job["location"],
+                    "skills": " ".join(job["tags"].get("skills", [])),
+                }
+            )
+
+        job_ids = [row.id for row in written]
+        await self.db.execute(delete(job_search).where(job_search.c.rowid.in_(job_ids)))
+        await self.db.execute(insert(job_search), documents)
+
+    async def _touch_unchanged(self, keys: List[tuple], now: datetime) -> None:
+        if not keys or not settings.UPSERT_TOUCH_UNCHANGED:
+            return
+        table = Job.__table__
+        await self.db.execute(
+            update(table).where(tuple_(table.c.source, table.c.external_id).in_(keys))
+            # Pin updated_at so the column onupdate default does not bump it
+            .values(last_seen_at=now, updated_at=table.c.updated_at)
+        )
+
+    def _chunk_size(self, dialect: str) -> int:
+        limit = MAX_BIND_PARAMS.get(dialect, DEFAULT_MAX_BIND_PARAMS)
+        return max(1, limit // len(UPSERT_COLUMNS))
+
+    def _job_to_row(self, job: Job, now: datetime) -> Dict[str, Any]:
+        row = {col: getattr(job, col) for col in UPSERT_COLUMNS}
+        # Core inserts bypass ORM defaults for explicit None values
+        if row["fetched_at"] is None:
+            row["fetched_at"] = now
+        # Ingest-time classification: labels are stored once, not per summary
+        row["tags"] = derive_tags(row["title"], row["tags"])
+        if row["is_remote"] is None:
+            row["is_remote"] = False
+        if row["is_valid"] is None:
+            row["is_valid"] = True
+        row["content_hash"] = build_content_hash(
+            {col: row[col] for col in HASHED_COLUMNS}
+        )
+        row["last_seen_at"] = now
+        row["updated_at"] = now
+        return row
 
     async def list_jobs(
-        self, skip: int = 0, limit: int = 50, source: str = None
+        self,
+        skip: int = 0,
+        limit: int = 50,
+        source: str = None,
+        skill: Optional[str] = None,
+        cursor: Optional[str] = None,
     ) -> List[Job]:
-        query = select(Job).offset(skip).limit(limit)
-        if source:
-            query = query.where(Job.source == source)
+        """Active jobs, newest first, ordered by (fetched_at, id).
+
+        With a ``cursor`` the page starts strictly after the cursor's row
+        (keyset pagination); otherwise ``skip`` falls back to OFFSET.
+        """
+        query = self._filter_active(select(Job), source, skill).order_by(
+            Job.fetched_at.desc(), Job.id.desc()
+        )
+        if cursor:
+            fetched_at, job_id = decode_cursor(cursor)
+            query = query.where(
+                tuple_(Job.fetched_at, Job.id) < tuple_(fetched_at, job_id)
+            )
+        elif skip:
+            query = query.offset(skip)
+
+        result = await self.db.execute(query.limit(limit))
+        return list(result.scalars().all())
+
+    async def search_jobs(
+        self,
+        q: str,
+        skip: int = 0,
+        limit: int = 50,
+        source: Optional[str] = None,
+        skill: Optional[str] = None,
+    ) -> List[Job]:
+        """Active jobs matching every term of ``q``, best match first.
+
+        The last term is prefix-matched so partial input still hits. Uses the
+        FTS5 table on SQLite and the tsvector GIN index on Postgres. By default
+        every match is scored before the page is cut, so an older but better
+        match still ranks first; latency then grows with the number of
+        matches. SEARCH_CANDIDATE_LIMIT > 0 ranks only the newest N matches,
+        keeping latency flat for common terms at the cost of missing older,
+        better matches beyond the cap.
+        """
+        terms = search_terms(q)
+        if not terms:
+            raise ValueError("Search query has no searchable terms")
 
+        dialect = self.db.get_bind().dialect.name
+        if dialect == "sqlite":
+            match = " ".join(f'"{term}"' for term in terms) + "*"
+            # bm25 scores are negative; lower is a better match
+            score = func.bm25(literal_column(JOB_SEARCH_TABLE), *SEARCH_WEIGHTS)
+            candidates = (
+                select(Job.id, score.label("score"))
+                .join(job_search, job_search.c.rowid == Job.id)
+                .where(job_search.c[JOB_SEARCH_TABLE].match(match))
+            )
+            newest = job_search.c.rowid.desc()
+        elif dialect == "postgresql":
+            tsquery = func.to_tsquery(
+                "english", " & ".join(terms[:-1] + [f"{terms[-1]}:*"])
+            )
+            vector = literal_column(JOB_SEARCH_VECTOR)
+            score = -func.ts_rank(vector, tsquery)
+            candidates = select(Job.id, score.label("score")).where(
+                vector.op("@@")(tsquery)
+            )
+            newest = Job.id.desc()
+        else:
+            raise ValueError(f"Search not supported for dialect {dialect}")
+
+        candidates = self._filter_active(candidates, source, skill)
+        if settings.SEARCH_CANDIDATE_LIMIT > 0:
+            candidates = candidates.order_by(newest).limit(
+                settings.SEARCH_CANDIDATE_LIMIT
+            )
+        candidates = candidates.subquery()
+        query = (
+            select(Job)
+            .join(candidates, candidates.c.id == Job.id)
+            .order_by(candidates.c.score, Job.fetched_at.desc(), Job.id.desc())
+            .offset(skip)
+            .limit(limit)
+        )
         result = await self.db.execute(query)
         return list(result.scalars().all())
+
+    async def stream_jobs(
+        self,
+        source: Optional[str] = None,
+        skill: Optional[str] = None,
+        batch_size: int = settings.EXPORT_BATCH_SIZE,
+    ) -> AsyncIterator[List[Row]]:
+        """Active jobs newest first, in batches read from a server-side cursor.
+
+        Rows are plain tuples in EXPORT_COLUMNS order rather than ORM objects,
+        so memory stays bounded by ``batch_size`` regardless of table size.
+        """
+        columns = [Job.__table__.c[name] for name in EXPORT_COLUMNS]
+        query = (
+            self._filter_active(select(*columns), source, skill)
+            .order_by(Job.fetched_at.desc(), Job.id.desc())
+            .execution_options(yield_per=batch_size)
+        )
+        result = await self.db.stream(query)
+        async for batch in result.partitions():
+            yield batch
+
+    def _filter_active(self, query, source: Optional[str], skill: Optional[str]):
+        query = query.where(Job.deleted_at.is_(None), Job.is_valid.is_(True))
+        if source:
+            query = query.where(Job.source == source)
+        if skill:
+            query = query.where(
+                exists().where(
+                    JobLabel.job_id == Job.id,
+                    JobLabel.kind == "skills",
+                    JobLabel.label == skill,
+                )
+            )
+        return query
+
+    async def list_jobs_page(
+        self, limit: int = 50, **filters: Any
+    ) -> Tuple[List[Job], Optional[str]]:
+        """One page plus the cursor for the next one (None on the last page)"""
+        jobs = await self.list_jobs(limit=limit + 1, **filters)
+        if len(jobs) <= limit:
+            return jobs, None
+        jobs = jobs[:limit]
+        return jobs, encode_cursor(jobs[-1])
+
+
+def search_terms(q: str) -> List[str]:
+    """Lowercased word tokens of a search string; operators are dropped"""
+    return re.findall(r"\w+", q.lower())
+
+
+def encode_cursor(job: Job) -> str:
+    raw = json.dumps([job.fetched_at.isoformat(), job.id]).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> Tuple[datetime, int]:
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        fetched_at, job_id = json.loads(base64.urlsafe_b64decode(padded))
+        return datetime.fromisoformat(fetched_at), int(job_id)
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
@@ -0,0 +1,199 @@
+"""Columnar Parquet snapshots of the jobs corpus for offline analysis.
+
+Writes ``jobs`` and ``archived_jobs`` as Hive-partitioned datasets::
+
+    <output_dir>/jobs/source=tavily/fetch_date=2026-10-17/part-20261017T030000000000.parquet
+
+Rows are streamed from a server-side cursor and written in bounded row
+groups, so memory does not grow with the table. Each run only exports rows
+changed since the previous run's watermark (kept in ``_snapshot_state.json``)
+and adds new part files; readers keep the row with the latest
+``snapshot_at`` per ``id``.
+
+The watermark is the database clock when a table's export query starts,
+minus PARQUET_WATERMARK_LAG_SECONDS, not the newest exported change marker:
+writers stamp ``updated_at`` before they commit, so a row can become visible
+after an export with an older marker than anything that export saw. Rows
+inside the lag are exported again by the next run, which readers dedupe.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+from urllib.parse import quote
+
+import pyarrow as pa
+import pyarrow.parquet as pq
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from src.core.config import settings
+from src.db.models import ArchivedJob, Job
+from src.services.job_service import LABEL_KINDS
+
+logger = structlog.get_logger()
+
+STATE_FILE = "_snapshot_state.json"
+
+
+@dataclass(frozen=True)
+class SnapshotTable:
+    name: str
+    table: Any
+    # Per-row change marker compared against the incremental watermark
+    changed_column: str
+
+
+SNAPSHOT_TABLES = [
+    SnapshotTable("jobs", Job.__table__, "updated_at"),
+    SnapshotTable("archived_jobs", ArchivedJob.__table__, "archived_at"),
+]
+
+
+def _arrow_schema(table) -> pa.Schema:
+    types = {int: pa.int64(), bool: pa.bool_(), datetime: pa.timestamp("us")}
+    fields = []
+    for column in table.columns:
+        if column.name == "tags":
+            # Raw scraper tokens plus one list column per classifier label kind
+            fields += [
+                pa.field(name, pa.list_(pa.string())) for name in ["tags"] + LABEL_KINDS
+            ]
+            continue
+        fields.append(
+            pa.field(column.name, types.get(column.type.python_type, pa.string()))
+        )
+    fields.append(pa.field("snapshot_at", pa.timestamp("us")))
+    return pa.schema(fields)
+
+
+class ParquetSnapshotExporter:
+    def __init__(
+        self,
+        db: AsyncSession,
+        output_dir: str = settings.PARQUET_EXPORT_DIR,
+        row_group_size: int = settings.PARQUET_ROW_GROUP_SIZE,
+        watermark_lag_seconds: float = settings.PARQUET_WATERMARK_LAG_SECONDS,
+    ):
+        self.db = db
+        self.output_dir = output_dir
+        self.row_group_size = row_group_size
+        self.watermark_lag = timedelta(seconds=watermark_lag_seconds)
+
+    async def export(self, full: bool = False) -> Dict[str, int]:
+        """Export rows changed since the last run (all rows with ``full``)"""
+        state = {} if full else self._load_state()
+        snapshot_at = datetime.utcnow()
+        counts = {}
+        for spec in SNAPSHOT_TABLES:
+            since = state.get(spec.name)
+            written, watermark = await self._export_table(
+                spec, datetime.fromisoformat(since) if since else None, snapshot_at
+            )
+            counts[spec.name] = written
+            state[spec.name] = watermark.isoformat()
+        # Only advance the watermarks once every file is closed
+        self._save_state(state)
+        logger.info("parquet_snapshot_exported", output_dir=self.output_dir, **counts)
+        return counts
+
+    async def _export_table(
+        self, spec: SnapshotTable, since: Optional[datetime], snapshot_at: datetime
+    ) -> Tuple[int, datetime]:
+        table = spec.table
+        schema = _arrow_schema(table)
+        query = select(table).order_by(table.c.source, table.c.fetched_at, table.c.id)
+        if since is not None:
+            query = query.where(table.c[spec.changed_column] > since)
+
+        # Taken before the query runs: anything committed later is either
+        # newer than this or within the lag, so the next run picks it up
+        watermark = await self._db_now() - self.watermark_lag
+
+        written = 0
+        writer = None
+        partition = None
+        pending: List[Dict[str, Any]] = []
+
+        def flush():
+            if pending:
+                writer.write_table(
+                    pa.Table.from_pylist(pending, schema=schema),
+                    row_group_size=self.row_group_size,
+                )
+                pending.clear()
+
+        try:
+            result = await self.db.stream(
+                query.execution_options(yield_per=settings.EXPORT_BATCH_SIZE)
+            )
+            async for batch in result.mappings().partitions():
+                for row in batch:
+                    key = (row["source"], row["fetched_at"].date())
+                    if key != partition:
+                        if writer is not None:
+                            flush()
+                            writer.close()
+                        partition = key
+                        writer = pq.ParquetWriter(
+                            self._part_path(spec.name, key, snapshot_at), schema
+                        )
+                    pending.append(self._to_record(row, snapshot_at))
+                    if len(pending) >= self.row_group_size:
+                        flush()
+                    written += 1
+            if writer is not None:
+                flush()
+        finally:
+            if writer is not None:
+                writer.close()
+        return written, watermark
+
+    async def _db_now(self) -> datetime:
+        """Current UTC time from the database, naive like the stored columns"""
+        if self.db.get_bind().dialect.name == "postgresql":
+            now = func.timezone("utc", func.now())
+        else:
+            now = func.current_timestamp()
+        value = await self.db.scalar(select(now))
+        # SQLite returns CURRENT_TIMESTAMP as text
+        return datetime.fromisoformat(value) if isinstance(value, str) else value
+
+    def _to_record(self, row, snapshot_at: datetime) -> Dict[str, Any]:
+        record = dict(row)
+        tags = record.pop("tags") or {}
+        if not isinstance(tags, dict):
+            tags = {"raw": tags}
+        record["tags"] = [str(t) for t in tags.get("raw", [])]
+        for kind in LABEL_KINDS:
+            record[kind] = list(tags.get(kind, []))
+        record["snapshot_at"] = snapshot_at
+        return record
+
+    def _part_path(self, table: str, key, snapshot_at: datetime) -> str:
+        source, fetch_date = key
+        directory = os.path.join(
+            self.output_dir,
+            table,
+            f"source={quote(source, safe='')}",
+            f"fetch_date={fetch_date.isoformat()}",
+        )
+        os.makedirs(directory, exist_ok=True)
+        return os.path.join(directory, f"part-{snapshot_at:%Y%m%dT%H%M%S%f}.parquet")
+
+    def _load_state(self) -> Dict[str, str]:
+        path = os.path.join(self.output_dir, STATE_FILE)
+        if not os.path.exists(path):
+            return {}
+        with open(path, encoding="utf-8") as f:
+            return json.load(f)
+
+    def _save_state(self, state: Dict[str, str]) -> None:
+        os.makedirs(self.output_dir, exist_ok=True)
+        path = os.path.join(self.output_dir, STATE_FILE)
+        with open(f"{path}.tmp", "w", encoding="utf-8") as f:
+            json.dump(state, f, indent=2)
+        os.replace(f"{path}.tmp", path)
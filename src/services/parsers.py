@@ -1,6 +1,8 @@
 import re
+import json
 import hashlib
-from typing import List, Tuple, Optional, Iterable
+from dataclasses import dataclass
+from typing import Any, Dict, List, Tuple, Optional, Iterable
 
 from src.core.constants import SKILL_KEYWORDS, INNOVATION_KEYWORDS, WEIRD_KEYWORDS
 
@@ -46,31 +48,102 @@ def parse_title_company(text: str) -> Tuple[str, Optional[str]]:
     return text, None
 
 
+@dataclass(frozen=True)
+class Classification:
+    skills: List[str]
+    innovations: List[str]
+    weird: List[str]
+
+
+class KeywordMatcher:
+    """Finds every keyword of several label dictionaries in one regex scan.
+
+    Equivalent to running ``re.search(rf"\\b{key}\\b")`` per key: the scan
+    reports the longest key starting at each word boundary, and any shorter
+    keys that are prefixes of it are checked against the boundary directly.
+    """
+
+    def __init__(self, dictionaries: Dict[str, Dict[str, str]]):
+        self.categories = list(dictionaries)
+        self._labels: Dict[str, List[Tuple[str, str]]] = {}
+        for category, keywords in dictionaries.items():
+            for key, label in keywords.items():
+                self._labels.setdefault(key, []).append((category, label))
+
+        keys = sorted(self._labels, key=len, reverse=True)
+        self._prefixes: Dict[str, List[str]] = {
+            key: [other for other in keys if other != key and key.startswith(other)]
+            for key in keys
+        }
+        alternation = "|".join(re.escape(key) for key in keys)
+        self._pattern = re.compile(rf"\b(?=({alternation})\b)")
+
+    def match(self, text: str) -> Dict[str, set]:
+        found: Dict[str, set] = {category: set() for category in self.categories}
+        for m in self._pattern.finditer(text):
+            key = m.group(1)
+            start = m.start()
+            for category, label in self._labels[key]:
+                found[category].add(label)
+            for prefix in self._prefixes[key]:
+                if _is_boundary(text, start + len(prefix)):
+                    for category, label in self._labels[prefix]:
+                        found[category].add(label)
+        return found
+
+
+def _is_boundary(text: str, index: int) -> bool:
+    before = index > 0 and _is_word_char(text[index - 1])
+    after = index < len(text) and _is_word_char(text[index])
+    return before != after
+
+
+def _is_word_char(char: str) -> bool:
+    return char.isalnum() or char == "_"
+
+
+def _classification_text(title: str, tags: Iterable[str]) -> str:
+    return f"{title} {', '.join([str(tag) for tag in tags])}".lower()
+
+
+KEYWORD_MATCHER = KeywordMatcher(
+    {
+        "skills": SKILL_KEYWORDS,
+        "innovations": INNOVATION_KEYWORDS,
+        "weird": WEIRD_KEYWORDS,
+    }
+)
+
+
+def classify(title: str, tags: Iterable[str]) -> Classification:
+    found = KEYWORD_MATCHER.match(_classification_text(title, tags))
+    return Classification(
+        skills=sorted(found["skills"]),
+        innovations=sorted(found["innovations"]),
+        weird=sorted(found["weird"]),
+    )
+
+
+def derive_tags(title: str, tags: Optional[Dict[str, Any]]) -> Dict[str, Any]:
+    """Attach classifier labels to a scraped job's ``{"raw": tokens}`` tags"""
+    tags = dict(tags) if isinstance(tags, dict) else {"raw": list(tags or [])}
+    result = classify(title, tags.get("raw", []))
+    tags["skills"] = result.skills
+    tags["innovations"] = result.innovations
+    tags["weird"] = result.weird
+    return tags
+
+
 def compute_skills(title: str, tags: Iterable[str]) -> List[str]:
-    lower = f"{title} {', '.join([str(tag) for tag in tags])}".lower()
-    skills = []
-    for key, label in SKILL_KEYWORDS.items():
-        if re.search(rf"\b{re.escape(key)}\b", lower):
-            skills.append(label)
-    return sorted(set(skills))
+    return classify(title, tags).skills
 
 
 def compute_innovations(title: str, tags: Iterable[str]) -> List[str]:
-    lower = f"{title} {', '.join([str(tag) for tag in tags])}".lower()
-    innovations = []
-    for key, label in INNOVATION_KEYWORDS.items():
-        if re.search(rf"\b{re.escape(key)}\b", lower):
-            innovations.append(label)
-    return sorted(set(innovations))
+    return classify(title, tags).innovations
 
 
 def compute_weird_tags(title: str, tags: Iterable[str]) -> List[str]:
-    lower = f"{title} {', '.join([str(tag) for tag in tags])}".lower()
-    weird = []
-    for key, label in WEIRD_KEYWORDS.items():
-        if re.search(rf"\b{re.escape(key)}\b", lower):
-            weird.append(label)
-    return sorted(set(weird))
+    return classify(title, tags).weird
 
 
 def build_external_id(url: str, title: str) -> str:
@@ -78,6 +151,16 @@ def build_external_id(url: str, title: str) -> str:
     return hashlib.sha1(seed).hexdigest()
 
 
+def build_content_hash(fields: Dict[str, Any]) -> str:
+    normalized = {}
+    for key, value in fields.items():
+        if isinstance(value, str):
+            value = " ".join(value.split())
+        normalized[key] = value
+    seed = json.dumps(normalized, sort_keys=True, default=str).encode("utf-8")
+    return hashlib.sha1(seed).hexdigest()
+
+
 def tokenize(text: str) -> List[str]:
     return re.findall(r"[A-Za-z0-9\+#\.]+", text)
 
@@ -0,0 +1,134 @@
+"""Per-query watermarks for search scrapers.
+
+A search source such as Tavily returns mostly results we already store. Each
+(source, query) pair keeps the external ids it has returned before and a
+yield score: a moving average of the share of unseen ids per run. Before a
+run, ``limit_for`` scales the query's max_results by that score. A query
+with SKIP_AFTER_EMPTY_RUNS runs in a row that found nothing new is skipped
+until its backoff expires, then probed with the minimum result count. The
+API budget goes to queries that still find new jobs.
+
+Seen ids are all the results a query returned, not only rows the upsert
+inserted: a job found first by another query still counts as new for this
+one. Jobs only reachable through a skipped query are not re-scraped, so
+their ``last_seen_at`` ages and freshness validation HEAD-checks them
+rather than trusting the listing.
+
+Watermarks live on their own session, separate from the ingest session,
+and are committed once by ``save()``.
+"""
+
+import math
+from datetime import datetime, timedelta
+from typing import Dict, Iterable, Optional
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from src.core.config import settings
+from src.db.models import ScrapeQueryState
+from src.monitoring.metrics import SCRAPE_QUERY_REQUESTS
+
+logger = structlog.get_logger()
+
+
+class QueryWatermarks:
+    def __init__(self, db: AsyncSession, source: str):
+        self.db = db
+        self.source = source
+        self.states: Dict[str, ScrapeQueryState] = {}
+        self.requests = 0
+        self.skipped = 0
+        self.results = 0
+        self.new_results = 0
+
+    async def load(self, queries: Iterable[str]) -> None:
+        queries = list(queries)
+        result = await self.db.execute(
+            select(ScrapeQueryState).where(
+                ScrapeQueryState.source == self.source,
+                ScrapeQueryState.query.in_(queries),
+            )
+        )
+        self.states = {state.query: state for state in result.scalars()}
+        for query in queries:
+            if query not in self.states:
+                state = ScrapeQueryState(
+                    source=self.source,
+                    query=query,
+                    runs=0,
+                    empty_runs=0,
+                    yield_score=1.0,
+                    seen_external_ids=[],
+                )
+                self.db.add(state)
+                self.states[query] = state
+
+    def limit_for(
+        self, query: str, max_results: int, now: Optional[datetime] = None
+    ) -> int:
+        """Results to request for ``query``; 0 means skip it this run"""
+        state = self.states.get(query)
+        minimum = min(settings.SCRAPE_QUERY_MIN_RESULTS, max_results)
+        if state is None or not state.runs:
+            return max_results
+
+        extra_empty = state.empty_runs - settings.SCRAPE_QUERY_SKIP_AFTER_EMPTY_RUNS
+        if extra_empty >= 0:
+            backoff = min(
+                settings.SCRAPE_QUERY_BACKOFF_HOURS * 2**extra_empty,
+                settings.SCRAPE_QUERY_MAX_BACKOFF_HOURS,
+            )
+            now = now or datetime.utcnow()
+            if state.last_run_at and now < state.last_run_at + timedelta(hours=backoff):
+                self.skipped += 1
+                SCRAPE_QUERY_REQUESTS.labels(
+                    source=self.source, outcome="skipped"
+                ).inc()
+                return 0
+            # Backoff expired: probe cheaply
+            return minimum
+
+        return max(
+            minimum, min(max_results, math.ceil(max_results * state.yield_score))
+        )
+
+    def record(
+        self, query: str, external_ids: Iterable[str], now: Optional[datetime] = None
+    ) -> int:
+        """Update ``query``'s watermark after a request; returns unseen ids"""
+        state = self.states[query]
+        now = now or datetime.utcnow()
+        returned = list(dict.fromkeys(external_ids))
+        seen = set(state.seen_external_ids or [])
+        new_ids = [external_id for external_id in returned if external_id not in seen]
+
+        share = len(new_ids) / len(returned) if returned else 0.0
+        alpha = settings.SCRAPE_QUERY_YIELD_ALPHA
+        state.yield_score = alpha * share + (1 - alpha) * state.yield_score
+        state.runs += 1
+        state.empty_runs = 0 if new_ids else state.empty_runs + 1
+        state.last_run_at = now
+        if new_ids:
+            state.last_new_at = now
+            # Reassigned (not appended) so the JSON column is flagged dirty
+            remembered = list(state.seen_external_ids or []) + new_ids
+            state.seen_external_ids = remembered[-settings.SCRAPE_QUERY_SEEN_IDS :]
+
+        self.requests += 1
+        self.results += len(returned)
+        self.new_results += len(new_ids)
+        SCRAPE_QUERY_REQUESTS.labels(source=self.source, outcome="sent").inc()
+        return len(new_ids)
+
+    async def save(self) -> None:
+        await self.db.commit()
+        logger.info(
+            "scrape_query_watermarks",
+            source=self.source,
+            requests=self.requests,
+            skipped=self.skipped,
+            results=self.results,
+            new_results=self.new_results,
+        )
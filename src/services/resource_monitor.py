@@ -1,13 +1,24 @@
 import asyncio
+import json
+import math
+import os
+import socket
+import threading
+import time
 import psutil
+import redis
+from redis.exceptions import RedisError
+import structlog
 from enum import Enum
-from dataclasses import dataclass
-from typing import List, Callable, Optional, Awaitable
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, List, Callable, Optional, Awaitable, Tuple
 from datetime import datetime
 
 from src.core.config import settings
 from src.monitoring.metrics import CPU_USAGE, MEMORY_USAGE, DISK_FREE, THROTTLE_EVENTS
 
+logger = structlog.get_logger()
+
 
 class ThrottleLevel(int, Enum):
     NORMAL = 0
@@ -23,7 +34,7 @@ class TaskType(str, Enum):
     API = "api"
 
 
-@dataclass
+@dataclass(frozen=True)
 class ResourceStatus:
     cpu_percent: float
     memory_percent: float
@@ -31,11 +42,14 @@ class ResourceStatus:
     disk_free_gb: float
     is_healthy: bool
     throttle_level: ThrottleLevel
-    checked_at: datetime = datetime.utcnow()
+    checked_at: datetime = field(default_factory=datetime.utcnow)
+    # Unsmoothed CPU reading behind cpu_percent
+    cpu_raw_percent: Optional[float] = None
 
     def to_dict(self):
         return {
             "cpu_percent": self.cpu_percent,
+            "cpu_raw_percent": self.cpu_raw_percent,
             "memory_percent": self.memory_percent,
             "disk_free_percent": self.disk_free_percent,
             "disk_free_gb": self.disk_free_gb,
@@ -45,48 +59,319 @@ class ResourceStatus:
         }
 
 
+def throttle_level_for(cpu_percent: float, disk_free_pct: float) -> ThrottleLevel:
+    # CRITICAL: Disk < 10% OR CPU > 95%
+    if disk_free_pct < 10 or cpu_percent > 95:
+        return ThrottleLevel.PAUSE
+    # HEAVY: Disk < 15% OR CPU > 85%
+    if (
+        disk_free_pct < settings.RESOURCE_DISK_MIN_FREE_PERCENT
+        or cpu_percent > settings.RESOURCE_CPU_MAX_PERCENT
+    ):
+        return ThrottleLevel.HEAVY
+    # LIGHT: Disk < 20% OR CPU > 75%
+    if disk_free_pct < 20 or cpu_percent > 75:
+        return ThrottleLevel.LIGHT
+    return ThrottleLevel.NORMAL
+
+
+@dataclass(frozen=True)
+class NodeResources:
+    """Worst reading across the live processes of one node"""
+
+    node: str
+    throttle_level: ThrottleLevel
+    cpu_percent: float
+    disk_free_percent: float
+    processes: int
+    # Processes that consume Celery queues; 0 for API-only nodes
+    workers: int = 0
+
+    def to_dict(self):
+        return {
+            "throttle_level": self.throttle_level.value,
+            "cpu_percent": self.cpu_percent,
+            "disk_free_percent": self.disk_free_percent,
+            "processes": self.processes,
+            "workers": self.workers,
+        }
+
+
+@dataclass(frozen=True)
+class ClusterResourceView:
+    """Per-node and fleet-wide throttle levels as seen from ``node``.
+
+    The fleet level is the highest level reached by at least ``quorum`` of
+    the nodes. It only ever sheds low-priority work: a busy fleet raises a
+    node to HEAVY at most, while PAUSE stays a node's own emergency.
+    """
+
+    node: str
+    nodes: Dict[str, NodeResources]
+    fleet_level: ThrottleLevel
+    checked_at: datetime = field(default_factory=datetime.utcnow)
+
+    def level_for(self, node: str) -> ThrottleLevel:
+        own = (
+            self.nodes[node].throttle_level
+            if node in self.nodes
+            else ThrottleLevel.NORMAL
+        )
+        return max(own, min(self.fleet_level, ThrottleLevel.HEAVY))
+
+    @property
+    def effective_level(self) -> ThrottleLevel:
+        return self.level_for(self.node)
+
+    def to_dict(self):
+        return {
+            "node": self.node,
+            "effective_level": self.effective_level.value,
+            "fleet_level": self.fleet_level.value,
+            "nodes": {name: n.to_dict() for name, n in self.nodes.items()},
+            "checked_at": self.checked_at.isoformat(),
+        }
+
+
+def aggregate_statuses(
+    node: str,
+    entries: Iterable[Tuple[str, Dict[str, Any]]],
+    quorum: float = settings.RESOURCE_FLEET_QUORUM,
+) -> ClusterResourceView:
+    """Fold ``(node, ResourceStatus.to_dict())`` pairs into a cluster view"""
+    grouped: Dict[str, List[Dict[str, Any]]] = {}
+    for name, status in entries:
+        grouped.setdefault(name, []).append(status)
+
+    nodes = {
+        name: NodeResources(
+            node=name,
+            throttle_level=ThrottleLevel(max(s["throttle_level"] for s in statuses)),
+            cpu_percent=max(s["cpu_percent"] for s in statuses),
+            disk_free_percent=min(s["disk_free_percent"] for s in statuses),
+            processes=len(statuses),
+            workers=sum(1 for s in statuses if s.get("worker")),
+        )
+        for name, statuses in grouped.items()
+    }
+
+    levels = sorted((n.throttle_level for n in nodes.values()), reverse=True)
+    fleet_level = ThrottleLevel.NORMAL
+    if levels:
+        fleet_level = levels[max(0, math.ceil(quorum * len(levels)) - 1)]
+    return ClusterResourceView(node=node, nodes=nodes, fleet_level=fleet_level)
+
+
+class ClusterResourceRegistry:
+    """Shares ResourceStatus snapshots between processes through Redis.
+
+    Every process writes its latest status under its own key with a TTL and
+    lists that key in a sorted set scored by its expiry, so reading the
+    fleet is one range over the live members instead of a keyspace SCAN, and
+    a process that stops sampling drops out of the view on its own. Uses a
+    synchronous client because ``ResourceMonitor.sample`` only runs in
+    background threads.
+    """
+
+    KEY_PREFIX = "job-intel:resources"
+    INDEX_KEY = f"{KEY_PREFIX}:index"
+
+    def __init__(
+        self,
+        redis_client: redis.Redis,
+        ttl_seconds: int = settings.RESOURCE_STATUS_TTL_SECONDS,
+        quorum: float = settings.RESOURCE_FLEET_QUORUM,
+    ):
+        self.redis = redis_client
+        self.ttl_seconds = ttl_seconds
+        self.quorum = quorum
+
+    @classmethod
+    def from_url(cls, url: str) -> "ClusterResourceRegistry":
+        return cls(
+            redis.Redis.from_url(url, socket_timeout=1.0, socket_connect_timeout=1.0)
+        )
+
+    def sync(
+        self, node: str, status: ResourceStatus, worker: bool = False
+    ) -> ClusterResourceView:
+        """Publish ``status`` for this process and read back the whole fleet.
+
+        ``worker`` tags processes that consume Celery queues. Falls back to
+        a view of this node alone when Redis is unavailable.
+        """
+        local = {"worker": worker, **status.to_dict()}
+        key = f"{self.KEY_PREFIX}:{node}:{os.getpid()}"
+        now = time.time()
+        try:
+            pipe = self.redis.pipeline()
+            pipe.set(key, json.dumps({"node": node, **local}), ex=self.ttl_seconds)
+            pipe.zadd(self.INDEX_KEY, {key: now + self.ttl_seconds})
+            pipe.zremrangebyscore(self.INDEX_KEY, "-inf", now)
+            pipe.zrange(self.INDEX_KEY, 0, -1)
+            keys = pipe.execute()[-1]
+            raw = self.redis.mget(keys) if keys else []
+        except RedisError as e:
+            logger.warning("cluster_resources_unavailable", error=str(e))
+            return aggregate_statuses(node, [(node, local)], self.quorum)
+
+        entries = []
+        for value in raw:
+            # Keys can expire before their index entry is pruned
+            if value is not None:
+                status_dict = json.loads(value)
+                entries.append((status_dict["node"], status_dict))
+        return aggregate_statuses(node, entries, self.quorum)
+
+
 class ResourceMonitor:
-    def __init__(self):
-        self.check_interval = 30  # seconds
+    """Serves a cached ResourceStatus snapshot to every reader.
+
+    ``sample()`` is the only writer: it reads psutil, smooths CPU with an
+    exponential moving average (so one spike doesn't flap the throttle
+    level) and swaps in a new immutable snapshot. A background loop
+    (``start_monitoring``, run by the API and by each worker's runtime loop)
+    samples every ``check_interval`` seconds in a worker thread. Readers
+    never sample: they get the cached snapshot, and one that finds it older
+    than ``max_age`` schedules a background refresh. Only the very first
+    read in a process takes a local psutil reading inline.
+
+    With a ``cluster`` registry each sample is also published to Redis and
+    the fleet's statuses are read back, so ``can_run_task`` decides from the
+    cluster view instead of this process alone.
+    """
+
+    def __init__(
+        self,
+        check_interval: float = settings.RESOURCE_SAMPLE_INTERVAL_SECONDS,
+        max_age: float = settings.RESOURCE_STATUS_MAX_AGE_SECONDS,
+        cpu_alpha: float = settings.RESOURCE_CPU_EMA_ALPHA,
+        cluster: Optional[ClusterResourceRegistry] = None,
+        node: Optional[str] = None,
+        consumes_tasks: bool = False,
+    ):
+        self.check_interval = check_interval
+        self.max_age = max_age
+        self.cpu_alpha = cpu_alpha
+        self.cluster = cluster
+        # Processes on one host share a single entry in the fleet view
+        self.node = node or settings.RESOURCE_NODE_NAME or socket.gethostname()
+        # Set by Celery workers so the fleet view can tell them from the API
+        self.consumes_tasks = consumes_tasks
         self._callbacks: List[Callable[[ResourceStatus], Awaitable[None]]] = []
         self._current_status: Optional[ResourceStatus] = None
+        self._cluster_view: Optional[ClusterResourceView] = None
+        self._sampled_at = 0.0
+        self._cpu_ema: Optional[float] = None
+        self._sample_lock = threading.Lock()
+        self._refresh_lock = threading.Lock()
+        self._refreshing = False
         self._running = False
         self._monitor_task: Optional[asyncio.Task] = None
 
+    @property
+    def _cluster_enabled(self) -> bool:
+        return self.cluster is not None and settings.RESOURCE_CLUSTER_ENABLED
+
     def get_current_status(self) -> ResourceStatus:
-        # Get system metrics
-        cpu_percent = psutil.cpu_percent(interval=None)  # Non-blocking check
+        """The cached snapshot; a stale one is refreshed in the background"""
+        status = self._current_status
+        if status is None:
+            return self._bootstrap()
+        if time.monotonic() - self._sampled_at > self.max_age:
+            self._schedule_refresh()
+        return status
+
+    def get_cluster_view(self) -> ClusterResourceView:
+        self.get_current_status()
+        return self._cluster_view
+
+    def _bootstrap(self) -> ResourceStatus:
+        """First read in this process: local psutil only, fleet view follows"""
+        with self._sample_lock:
+            if self._current_status is None:
+                status = self._read_local()
+                self._publish(status, self._local_view(status))
+        if self._cluster_enabled:
+            self._schedule_refresh()
+        return self._current_status
+
+    def _schedule_refresh(self) -> None:
+        """Start one background sample unless one is already in flight.
+
+        Runs on its own daemon thread rather than the caller's event loop:
+        readers include short-lived ``async_to_sync`` loops that would be
+        torn down before the refresh lands.
+        """
+        with self._refresh_lock:
+            if self._refreshing:
+                return
+            self._refreshing = True
+        threading.Thread(
+            target=self._refresh_in_thread, name="resource-refresh", daemon=True
+        ).start()
+
+    def _refresh_in_thread(self) -> None:
+        try:
+            self.sample()
+        except Exception as e:
+            logger.error("resource_refresh_failed", error=str(e))
+        finally:
+            self._refreshing = False
+
+    def sample(self) -> ResourceStatus:
+        """Take a fresh reading and publish it as the current snapshot.
+
+        Blocking (psutil, and Redis with a cluster registry): call it from a
+        worker thread, e.g. through ``refresh()``.
+        """
+        with self._sample_lock:
+            status = self._read_local()
+            if self._cluster_enabled:
+                view = self.cluster.sync(self.node, status, self.consumes_tasks)
+            else:
+                view = self._local_view(status)
+            self._publish(status, view)
+            return status
+
+    def _local_view(self, status: ResourceStatus) -> ClusterResourceView:
+        local = {"worker": self.consumes_tasks, **status.to_dict()}
+        return aggregate_statuses(self.node, [(self.node, local)])
+
+    def _publish(self, status: ResourceStatus, view: ClusterResourceView) -> None:
+        self._cluster_view = view
+        self._current_status = status
+        self._sampled_at = time.monotonic()
+
+    def _read_local(self) -> ResourceStatus:
+        """psutil reading folded into the CPU average; caller holds the lock"""
+        cpu_raw = psutil.cpu_percent(interval=None)  # Non-blocking check
         memory = psutil.virtual_memory()
         disk = psutil.disk_usage("/")
 
+        if self._cpu_ema is None:
+            self._cpu_ema = cpu_raw
+        else:
+            self._cpu_ema += self.cpu_alpha * (cpu_raw - self._cpu_ema)
+        cpu_percent = round(self._cpu_ema, 1)
+
         disk_free_gb = disk.free / (1024**3)
         disk_free_pct = 100 - disk.percent
-
-        # Determine throttle level based on thresholds
-        # CRITICAL: Disk < 10% OR CPU > 95%
-        if disk_free_pct < 10 or cpu_percent > 95:
-            throttle_level = ThrottleLevel.PAUSE
-        # HEAVY: Disk < 15% OR CPU > 85%
-        elif (
-            disk_free_pct < settings.RESOURCE_DISK_MIN_FREE_PERCENT
-            or cpu_percent > settings.RESOURCE_CPU_MAX_PERCENT
-        ):
-            throttle_level = ThrottleLevel.HEAVY
-        # LIGHT: Disk < 20% OR CPU > 75%
-        elif disk_free_pct < 20 or cpu_percent > 75:
-            throttle_level = ThrottleLevel.LIGHT
-        else:
-            throttle_level = ThrottleLevel.NORMAL
+        throttle_level = throttle_level_for(cpu_percent, disk_free_pct)
 
         CPU_USAGE.set(cpu_percent)
         MEMORY_USAGE.set(memory.percent)
         DISK_FREE.set(disk_free_pct)
 
-        if throttle_level > ThrottleLevel.NORMAL:
+        previous = self._current_status
+        if throttle_level > ThrottleLevel.NORMAL and (
+            previous is None or previous.throttle_level == ThrottleLevel.NORMAL
+        ):
             THROTTLE_EVENTS.inc()
 
-        self._current_status = ResourceStatus(
+        return ResourceStatus(
             cpu_percent=cpu_percent,
+            cpu_raw_percent=cpu_raw,
             memory_percent=memory.percent,
             disk_free_percent=disk_free_pct,
             disk_free_gb=disk_free_gb,
@@ -94,30 +379,27 @@ class ResourceMonitor:
             throttle_level=throttle_level,
         )
 
-        return self._current_status
+    async def refresh(self) -> ResourceStatus:
+        """Sample in a worker thread so psutil never blocks the event loop"""
+        return await asyncio.to_thread(self.sample)
 
     def can_run_task(self, task_type: TaskType) -> bool:
-        if not self._current_status:
-            self.get_current_status()
-
-        status = self._current_status
-        if not status:  # Should not happen, but safe guard
-            return True
+        level = self.get_cluster_view().effective_level
 
         if task_type == TaskType.CRITICAL:
             return True
 
         if task_type == TaskType.API:
             # API requests only throttled in extreme cases
-            return status.throttle_level < ThrottleLevel.PAUSE
+            return level < ThrottleLevel.PAUSE
 
         if task_type == TaskType.SCRAPING:
-            return status.throttle_level <= ThrottleLevel.LIGHT
+            return level <= ThrottleLevel.LIGHT
 
         if task_type == TaskType.CLEANUP:
-            return status.throttle_level <= ThrottleLevel.HEAVY
+            return level <= ThrottleLevel.HEAVY
 
-        return status.is_healthy
+        return level == ThrottleLevel.NORMAL
 
     def register_callback(self, callback: Callable[[ResourceStatus], Awaitable[None]]):
         """Register async callback for resource updates"""
@@ -131,7 +413,7 @@ class ResourceMonitor:
         self._running = True
         while self._running:
             try:
-                status = self.get_current_status()
+                status = await self.refresh()
 
                 # Notify callbacks if system is under load
                 if status.throttle_level > ThrottleLevel.NORMAL:
@@ -140,7 +422,7 @@ class ResourceMonitor:
 
             except Exception as e:
                 # Log error but don't crash monitor
-                print(f"Error in resource monitor: {e}")
+                logger.error("resource_monitor_failed", error=str(e))
 
             await asyncio.sleep(self.check_interval)
 
@@ -149,4 +431,6 @@ class ResourceMonitor:
 
 
 # Global instance
-resource_monitor = ResourceMonitor()
+resource_monitor = ResourceMonitor(
+    cluster=ClusterResourceRegistry.from_url(settings.REDIS_URL)
+)
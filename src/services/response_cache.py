@@ -0,0 +1,180 @@
+"""Redis-backed cache for read-only API responses.
+
+Entries are keyed by route and normalized query parameters under a global
+version number. Writers (scrape and cleanup tasks) invalidate everything by
+bumping the version key after they commit, so stale entries are never read
+again and simply expire. A per-key lock makes concurrent misses single-flight:
+one request rebuilds the entry while the others wait for it.
+"""
+
+import asyncio
+import hashlib
+import json
+import time
+import uuid
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+import redis.asyncio as aioredis
+from redis.exceptions import RedisError
+import structlog
+
+from src.core.config import settings
+
+logger = structlog.get_logger()
+
+KEY_PREFIX = "job-intel:cache"
+VERSION_KEY = f"{KEY_PREFIX}:version"
+
+
+@dataclass
+class CachedResponse:
+    body: bytes
+    headers: Dict[str, str] = field(default_factory=dict)
+
+    def dumps(self) -> bytes:
+        return json.dumps(self.headers).encode() + b"\n" + self.body
+
+    @classmethod
+    def loads(cls, raw: bytes) -> "CachedResponse":
+        headers, body = raw.split(b"\n", 1)
+        return cls(body=body, headers=json.loads(headers))
+
+
+def cache_key(version: int, route: str, params: Dict[str, Any]) -> str:
+    """Key for ``route`` with ``params``; equal values give equal keys"""
+    normalized = json.dumps(params, sort_keys=True, default=str)
+    digest = hashlib.sha1(normalized.encode()).hexdigest()
+    return f"{KEY_PREFIX}:v{version}:{route}:{digest}"
+
+
+class ResponseCache:
+    """Read-through cache; with ``redis=None`` every call goes to the loader.
+
+    Redis errors are logged and fall through to the loader, so an outage
+    only costs the cache, never the request.
+    """
+
+    def __init__(
+        self,
+        redis: Optional[aioredis.Redis],
+        ttl_seconds: int = settings.RESPONSE_CACHE_TTL_SECONDS,
+        lock_seconds: float = settings.RESPONSE_CACHE_LOCK_SECONDS,
+        poll_interval: float = 0.05,
+    ):
+        self.redis = redis
+        self.ttl_seconds = ttl_seconds
+        self.lock_seconds = lock_seconds
+        self.poll_interval = poll_interval
+
+    async def get_or_load(
+        self,
+        route: str,
+        params: Dict[str, Any],
+        loader: Callable[[], Awaitable[CachedResponse]],
+    ) -> CachedResponse:
+        if self.redis is None:
+            return await loader()
+        try:
+            version = int(await self.redis.get(VERSION_KEY) or 0)
+            key = cache_key(version, route, params)
+            cached = await self.redis.get(key)
+        except RedisError as e:
+            logger.warning("response_cache_unavailable", error=str(e))
+            return await loader()
+        if cached is not None:
+            return CachedResponse.loads(cached)
+        return await self._load_single_flight(key, loader)
+
+    async def invalidate(self) -> int:
+        """Bump the version so every cached response is missed from now on"""
+        if self.redis is None:
+            return 0
+        try:
+            version = await self.redis.incr(VERSION_KEY)
+        except RedisError as e:
+            logger.warning("response_cache_invalidate_failed", error=str(e))
+            return 0
+        logger.info("response_cache_invalidated", version=version)
+        return version
+
+    async def _load_single_flight(
+        self, key: str, loader: Callable[[], Awaitable[CachedResponse]]
+    ) -> CachedResponse:
+        lock_key = f"{key}:lock"
+        token = uuid.uuid4().hex
+        lock_ms = int(self.lock_seconds * 1000)
+        try:
+            acquired = await self.redis.set(lock_key, token, nx=True, px=lock_ms)
+        except RedisError as e:
+            logger.warning("response_cache_unavailable", error=str(e))
+            return await loader()
+
+        if not acquired:
+            cached = await self._wait_for(key, lock_key)
+            if cached is not None:
+                return cached
+            # The holder failed or timed out; serve this request uncached
+            return await loader()
+
+        try:
+            response = await loader()
+            try:
+                await self.redis.set(key, response.dumps(), ex=self.ttl_seconds)
+            except RedisError as e:
+                logger.warning("response_cache_unavailable", error=str(e))
+            return response
+        finally:
+            try:
+                if await self.redis.get(lock_key) == token.encode():
+                    await self.redis.delete(lock_key)
+            except RedisError:
+                pass
+
+    async def _wait_for(self, key: str, lock_key: str) -> Optional[CachedResponse]:
+        deadline = time.monotonic() + self.lock_seconds
+        while time.monotonic() < deadline:
+            await asyncio.sleep(self.poll_interval)
+            try:
+                cached = await self.redis.get(key)
+                if cached is not None:
+                    return CachedResponse.loads(cached)
+                if not await self.redis.exists(lock_key):
+                    return None
+            except RedisError:
+                return None
+        return None
+
+
+_cache: Optional[ResponseCache] = None
+
+
+def get_response_cache() -> ResponseCache:
+    """FastAPI dependency: the process-wide cache for the API event loop"""
+    global _cache
+    if _cache is None:
+        redis = (
+            aioredis.from_url(settings.REDIS_URL)
+            if settings.RESPONSE_CACHE_ENABLED
+            else None
+        )
+        _cache = ResponseCache(redis)
+    return _cache
+
+
+async def close_response_cache() -> None:
+    global _cache
+    if _cache is not None and _cache.redis is not None:
+        await _cache.redis.aclose()
+    _cache = None
+
+
+async def invalidate_response_cache() -> None:
+    """Invalidate from a worker; uses a short-lived client on the current loop"""
+    if not settings.RESPONSE_CACHE_ENABLED:
+        return
+    redis = aioredis.from_url(settings.REDIS_URL)
+    try:
+        await ResponseCache(redis).invalidate()
+    finally:
+        await redis.aclose()
@@ -1,98 +1,134 @@
-from typing import Dict, Any, List
-from sqlalchemy import select, func, desc
+from typing import Dict, Any, List, Optional, Tuple
+from sqlalchemy import select, func, case, exists
 from sqlalchemy.ext.asyncio import AsyncSession
-from collections import Counter
-from datetime import datetime, timedelta
+from datetime import datetime
 
-from src.db.models import Job
+from src.db.models import Job, JobLabel
 from src.core.constants import CANADA_HINTS
 
 
+def region_for_location(location: Optional[str]) -> str:
+    """Python twin of region_case(); first matching hint wins"""
+    loc = (location or "").lower()
+    if "remote" in loc:
+        return "Remote"
+    for hint in CANADA_HINTS:
+        if hint in loc:
+            return hint.title()
+    return "Other"
+
+
+def region_case():
+    location = func.lower(func.coalesce(Job.location, ""))
+    return case(
+        (location.contains("remote"), "Remote"),
+        *[(location.contains(hint), hint.title()) for hint in CANADA_HINTS],
+        else_="Other",
+    )
+
+
+def _most_common(counts: Dict[str, int], limit: int) -> List[Tuple[str, int]]:
+    # Ties break alphabetically so the output is stable across refreshes
+    return sorted(counts.items(), key=lambda kv: (-kv[1], kv[0]))[:limit]
+
+
+def _ranked(counts: Dict[str, int], limit: int) -> List[Dict[str, Any]]:
+    return [{"name": k, "count": v} for k, v in _most_common(counts, limit)]
+
+
 class SummaryGenerator:
+    """Builds the market summary from database aggregates.
+
+    Every section is a single query that fetches only the columns it needs,
+    so memory stays flat regardless of table size.
+    """
+
     def __init__(self, db: AsyncSession):
         self.db = db
 
     async def generate(self) -> Dict[str, Any]:
         """Generate comprehensive job market summary"""
-        jobs = await self.get_all_jobs()
+        return await self.build(await self.collect_counters())
+
+    async def collect_counters(self) -> Dict[str, Any]:
+        """Full (non-truncated) counters that incremental refreshes patch"""
+        totals = await self.db.execute(
+            select(
+                func.count().label("total"),
+                func.sum(case((Job.is_remote.is_(True), 1), else_=0)).label("remote"),
+            ).where(*self._active())
+        )
+        total, remote = totals.one()
+
+        region = region_case().label("region")
+        regions = await self.db.execute(
+            select(region, func.count().label("count"))
+            .where(*self._active())
+            .group_by(region)
+        )
 
+        return {
+            "total": total,
+            "remote": remote or 0,
+            "regions": {row.region: row.count for row in regions},
+            "skills": await self._count_labels("skills"),
+            "innovations": await self._count_labels("innovations"),
+        }
+
+    async def build(self, counters: Dict[str, Any]) -> Dict[str, Any]:
+        """Render the summary payload from counters plus the recent-row lists"""
+        total = counters["total"]
         return {
             "metadata": {
                 "generated_at": datetime.utcnow().isoformat(),
-                "total_jobs": len(jobs),
+                "total_jobs": total,
+            },
+            "stats": {
+                "remote_percentage": round(counters["remote"] / total * 100, 1)
+                if total
+                else 0,
+                "regions": dict(_most_common(counters["regions"], 10)),
             },
-            "stats": self._calculate_stats(jobs),
-            "top_skills": self._get_top_skills(jobs),
-            "innovations": self._get_top_innovations(jobs),
-            "roles": self._get_roles_table(jobs),
-            "rare_jobs": self._get_rare_jobs(jobs),
+            "top_skills": _ranked(counters["skills"], 20),
+            "innovations": _ranked(counters["innovations"], 20),
+            "roles": await self._get_roles_table(),
+            "rare_jobs": await self._get_rare_jobs(),
         }
 
-    async def get_all_jobs(self) -> List[Job]:
-        # Limit to recent jobs for relevance?
-        # Or all active jobs. Assuming is_valid=True and deleted_at=None
-        query = select(Job).where(Job.is_valid == True, Job.deleted_at.is_(None))
-        result = await self.db.execute(query)
-        return result.scalars().all()
-
-    def _calculate_stats(self, jobs: List[Job]) -> Dict[str, Any]:
-        remote_count = sum(1 for j in jobs if j.is_remote)
-
-        # Region distribution
-        regions = Counter()
-        for job in jobs:
-            loc = (job.location or "").lower()
-            if "remote" in loc:
-                regions["Remote"] += 1
-            else:
-                found = False
-                for region in CANADA_HINTS:
-                    if region in loc:
-                        regions[region.title()] += 1
-                        found = True
-                        break
-                if not found:
-                    regions["Other"] += 1
+    def _active(self) -> list:
+        return [Job.is_valid.is_(True), Job.deleted_at.is_(None)]
 
-        return {
-            "remote_percentage": round(remote_count / len(jobs) * 100, 1)
-            if jobs
-            else 0,
-            "regions": dict(regions.most_common(10)),
-        }
+    async def _count_labels(self, kind: str) -> Dict[str, int]:
+        """Aggregate ingest-time labels with GROUP BY over job_labels"""
+        query = (
+            select(JobLabel.label, func.count().label("count"))
+            .join(Job, Job.id == JobLabel.job_id)
+            .where(JobLabel.kind == kind, *self._active())
+            .group_by(JobLabel.label)
+        )
+        result = await self.db.execute(query)
+        return {row.label: row.count for row in result}
 
-    def _get_top_skills(self, jobs: List[Job]) -> List[Dict[str, Any]]:
-        counter = Counter()
-        for job in jobs:
-            skills = job.tags.get("skills", []) if job.tags else []
-            # Assuming tags logic populates "skills" key.
-            # Wait, update_jobs.py populated 'tags' list.
-            # My parser returns a list of tokens.
-            # I need to ensure compute_skills was called during scraping or parser logic.
-            # In scraping.py I didn't call compute_skills.
-            # I should fix scraping logic to populate skills/innovations in tags dict.
-            # For now, let's assume it's there or handle it gracefully.
-            if isinstance(job.tags, dict):
-                skills = job.tags.get("skills", [])
-                if isinstance(skills, list):
-                    counter.update(skills)
-
-        return [{"name": k, "count": v} for k, v in counter.most_common(20)]
-
-    def _get_top_innovations(self, jobs: List[Job]) -> List[Dict[str, Any]]:
-        counter = Counter()
-        for job in jobs:
-            if isinstance(job.tags, dict):
-                innovations = job.tags.get("innovations", [])
-                if isinstance(innovations, list):
-                    counter.update(innovations)
-        return [{"name": k, "count": v} for k, v in counter.most_common(20)]
-
-    def _get_roles_table(self, jobs: List[Job]) -> List[Dict[str, Any]]:
-        # Recent 50 jobs
-        sorted_jobs = sorted(jobs, key=lambda j: j.fetched_at, reverse=True)[:50]
+    async def _get_roles_table(self, limit: int = 50) -> List[Dict[str, Any]]:
+        result = await self.db.execute(
+            select(
+                Job.id,
+                Job.title,
+                Job.company,
+                Job.location,
+                Job.fetched_at,
+                Job.url,
+                Job.salary_text,
+                Job.salary_min,
+                Job.salary_max,
+            )
+            .where(*self._active())
+            .order_by(Job.fetched_at.desc(), Job.id.desc())
+            .limit(limit)
+        )
         return [
             {
+                "id": j.id,
                 "title": j.title,
                 "company": j.company,
                 "location": j.location,
@@ -101,21 +137,23 @@ class SummaryGenerator:
                 "salary": j.salary_text
                 or (f"{j.salary_min}-{j.salary_max}" if j.salary_min else "N/A"),
             }
-            for j in sorted_jobs
+            for j in result
         ]
 
-    def _get_rare_jobs(self, jobs: List[Job]) -> List[Dict[str, Any]]:
-        rare = []
-        for job in jobs:
-            if isinstance(job.tags, dict):
-                weird = job.tags.get("weird", [])
-                if weird:
-                    rare.append(
-                        {
-                            "title": job.title,
-                            "company": job.company,
-                            "tags": weird,
-                            "url": job.url,
-                        }
-                    )
-        return rare[:10]
+    async def _get_rare_jobs(self, limit: int = 10) -> List[Dict[str, Any]]:
+        has_weird = exists().where(JobLabel.job_id == Job.id, JobLabel.kind == "weird")
+        result = await self.db.execute(
+            select(Job.title, Job.company, Job.url, Job.tags)
+            .where(has_weird, *self._active())
+            .order_by(Job.id)
+            .limit(limit)
+        )
+        return [
+            {
+                "title": j.title,
+                "company": j.company,
+                "tags": (j.tags or {}).get("weird", []),
+                "url": j.url,
+            }
+            for j in result
+        ]
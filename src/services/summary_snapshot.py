@@ -0,0 +1,165 @@
+from collections import Counter
+from dataclasses import dataclass, field
+from datetime import datetime
+from typing import Any, Dict, Optional
+from sqlalchemy import update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+import structlog
+
+from src.db.models import SummarySnapshot
+from src.services.summary_generator import SummaryGenerator, region_for_location
+
+logger = structlog.get_logger()
+
+SNAPSHOT_ID = 1
+# Compare-and-swap retries before a delta is left to the next full rebuild
+APPLY_DELTA_ATTEMPTS = 5
+
+
+@dataclass
+class SummaryDelta:
+    """Counter changes collected while upserting or retiring jobs"""
+
+    total: int = 0
+    remote: int = 0
+    regions: Counter = field(default_factory=Counter)
+    skills: Counter = field(default_factory=Counter)
+    innovations: Counter = field(default_factory=Counter)
+    touched: bool = False
+
+    def add(self, is_remote: bool, location: Optional[str], tags: Any, sign: int = 1):
+        tags = tags if isinstance(tags, dict) else {}
+        self.total += sign
+        self.remote += sign if is_remote else 0
+        self.regions[region_for_location(location)] += sign
+        for label in tags.get("skills", []):
+            self.skills[label] += sign
+        for label in tags.get("innovations", []):
+            self.innovations[label] += sign
+        # Roles/rare lists depend on row contents, not only on the counters
+        self.touched = True
+
+    def remove(self, is_remote: bool, location: Optional[str], tags: Any):
+        self.add(is_remote, location, tags, sign=-1)
+
+    def apply_to(self, counters: Dict[str, Any]) -> Dict[str, Any]:
+        merged = {
+            "total": max(0, counters.get("total", 0) + self.total),
+            "remote": max(0, counters.get("remote", 0) + self.remote),
+        }
+        for key in ("regions", "skills", "innovations"):
+            counts = Counter(counters.get(key, {}))
+            counts.update(getattr(self, key))
+            merged[key] = {k: v for k, v in counts.items() if v > 0}
+        return merged
+
+    def __bool__(self) -> bool:
+        return self.touched
+
+
+class SummarySnapshotService:
+    """Serves the summary from a materialized row instead of recomputing it.
+
+    Reads are a primary-key lookup and never rebuild an existing row, however
+    old; only the very first read, before any row exists, builds one inline.
+    Scrape and cleanup tasks patch the stored counters with a SummaryDelta,
+    and the ``rebuild_summary_snapshot`` beat task (or the admin endpoint)
+    rebuilds every SUMMARY_SNAPSHOT_MAX_AGE_SECONDS, which bounds any drift
+    from deltas that raced a rebuild.
+
+    Writes are an upsert (rebuild) or a compare-and-swap on ``version``
+    (deltas), so concurrent writers neither collide on the single row nor
+    lose each other's updates, on SQLite as well as Postgres.
+    """
+
+    def __init__(self, db: AsyncSession):
+        self.db = db
+
+    async def get(self) -> SummarySnapshot:
+        snapshot = await self.db.get(SummarySnapshot, SNAPSHOT_ID)
+        if snapshot is None:
+            snapshot = await self.rebuild()
+        return snapshot
+
+    async def rebuild(self) -> SummarySnapshot:
+        generator = SummaryGenerator(self.db)
+        counters = await generator.collect_counters()
+        payload = await generator.build(counters)
+
+        now = datetime.utcnow()
+        table = SummarySnapshot.__table__
+        dialect = self.db.get_bind().dialect.name
+        insert = pg_insert if dialect == "postgresql" else sqlite_insert
+        stmt = insert(table).values(
+            id=SNAPSHOT_ID,
+            version=1,
+            counters=counters,
+            payload=payload,
+            built_at=now,
+            refreshed_at=now,
+        )
+        stmt = stmt.on_conflict_do_update(
+            index_elements=[table.c.id],
+            set_={
+                "counters": stmt.excluded.counters,
+                "payload": stmt.excluded.payload,
+                "built_at": stmt.excluded.built_at,
+                "refreshed_at": stmt.excluded.refreshed_at,
+                "version": table.c.version + 1,
+            },
+        )
+        await self.db.execute(stmt)
+        await self.db.commit()
+
+        snapshot = await self._load()
+        logger.info("summary_snapshot_rebuilt", version=snapshot.version)
+        return snapshot
+
+    async def apply_delta(self, delta: SummaryDelta) -> Optional[SummarySnapshot]:
+        if not delta:
+            return None
+
+        for _ in range(APPLY_DELTA_ATTEMPTS):
+            snapshot = await self._load()
+            if snapshot is None:
+                # Nothing materialized yet; the next read performs a full build
+                return None
+
+            counters = delta.apply_to(snapshot.counters or {})
+            payload = await SummaryGenerator(self.db).build(counters)
+            result = await self.db.execute(
+                update(SummarySnapshot)
+                .where(
+                    SummarySnapshot.id == SNAPSHOT_ID,
+                    SummarySnapshot.version == snapshot.version,
+                )
+                .values(
+                    counters=counters,
+                    payload=payload,
+                    version=snapshot.version + 1,
+                    refreshed_at=datetime.utcnow(),
+                )
+                .execution_options(synchronize_session=False)
+            )
+            await self.db.commit()
+            if result.rowcount:
+                snapshot = await self._load()
+                logger.info(
+                    "summary_snapshot_refreshed",
+                    version=snapshot.version,
+                    total=delta.total,
+                )
+                return snapshot
+            # Another writer got there first; re-apply on top of its counters
+
+        logger.warning("summary_snapshot_delta_dropped", total=delta.total)
+        return None
+
+    async def _load(self) -> Optional[SummarySnapshot]:
+        return await self.db.get(SummarySnapshot, SNAPSHOT_ID, populate_existing=True)
+
+    @staticmethod
+    def etag(snapshot: SummarySnapshot) -> str:
+        return f'"{int(snapshot.built_at.timestamp())}-{snapshot.version}"'
@@ -1,10 +1,13 @@
-from asgiref.sync import async_to_sync
 from celery.utils.log import get_task_logger
 
 from workers.celery_app import celery_app
 from src.services.freshness import FreshnessManager
+from src.services.summary_snapshot import SummaryDelta, SummarySnapshotService
+from src.services.response_cache import invalidate_response_cache
+from src.services.job_events import JobChanges, publish_job_changes
 from src.services.resource_monitor import resource_monitor, TaskType
 from src.db.session import AsyncSessionLocal
+from src.core.runtime import run_async
 
 logger = get_task_logger(__name__)
 
@@ -13,7 +16,7 @@ logger = get_task_logger(__name__)
 def run_cleanup(self):
     logger.info("Starting cleanup task")
     try:
-        stats = async_to_sync(execute_cleanup)()
+        stats = run_async(execute_cleanup)
         logger.info(f"Cleanup completed: {stats}")
         return stats
     except Exception as e:
@@ -28,6 +31,26 @@ def emergency_disk_cleanup():
     pass
 
 
+@celery_app.task(bind=True)
+def rebuild_summary_snapshot(self):
+    try:
+        return run_async(execute_summary_rebuild)
+    except Exception as e:
+        logger.error(f"Summary rebuild failed: {e}")
+        raise self.retry(exc=e, countdown=600)
+
+
+async def execute_summary_rebuild():
+    if not resource_monitor.can_run_task(TaskType.CLEANUP):
+        logger.warning("Summary rebuild throttled")
+        raise Exception("Resource limits exceeded")
+
+    async with AsyncSessionLocal() as session:
+        snapshot = await SummarySnapshotService(session).rebuild()
+        await invalidate_response_cache()
+        return {"version": snapshot.version, "total_jobs": snapshot.counters["total"]}
+
+
 async def execute_cleanup():
     # Check resources - cleanup runs unless PAUSED
     monitor = resource_monitor
@@ -37,4 +60,12 @@ async def execute_cleanup():
 
     async with AsyncSessionLocal() as session:
         manager = FreshnessManager(session)
-        return await manager.run_cleanup_cycle()
+        delta = SummaryDelta()
+        changes = JobChanges()
+        stats = await manager.run_cleanup_cycle(delta=delta, changes=changes)
+        await SummarySnapshotService(session).apply_delta(delta)
+        # Validation rewrites is_valid/last_validated_at, which responses expose
+        if stats["validated"] or stats["archived"]:
+            await invalidate_response_cache()
+        await publish_job_changes(changes)
+        return stats
@@ -0,0 +1,31 @@
+from celery.utils.log import get_task_logger
+
+from workers.celery_app import celery_app
+from src.services.parquet_export import ParquetSnapshotExporter
+from src.services.resource_monitor import resource_monitor, TaskType
+from src.db.session import AsyncSessionLocal
+from src.core.runtime import run_async
+
+logger = get_task_logger(__name__)
+
+
+@celery_app.task(bind=True)
+def export_parquet_snapshot(self, full: bool = False):
+    logger.info("Starting Parquet snapshot export")
+    try:
+        counts = run_async(execute_export, full)
+        logger.info(f"Parquet snapshot exported: {counts}")
+        return counts
+    except Exception as e:
+        logger.error(f"Parquet snapshot export failed: {e}")
+        raise self.retry(exc=e, countdown=1800)
+
+
+async def execute_export(full: bool = False):
+    # Snapshots are background work, throttled like cleanup
+    if not resource_monitor.can_run_task(TaskType.CLEANUP):
+        logger.warning("Parquet export throttled")
+        raise Exception("Resource limits exceeded")
+
+    async with AsyncSessionLocal() as session:
+        return await ParquetSnapshotExporter(session).export(full=full)
@@ -1,28 +1,68 @@
+import asyncio
+from typing import Optional
+
 from celery.utils.log import get_task_logger
 
 from workers.celery_app import celery_app
+from src.core.config import settings
 from src.services.resource_monitor import resource_monitor, ThrottleLevel
 from src.tasks.cleanup import emergency_disk_cleanup
 
 logger = get_task_logger(__name__)
 
+# Last state this process asked of its worker's "low" consumer
+_low_queue_paused: Optional[bool] = None
+
+
+def steer_low_queue(worker_name: str, level: ThrottleLevel) -> None:
+    """Pause or resume ``worker_name``'s low-priority consumer for ``level``.
+
+    Only ever addresses the worker this process belongs to, and only
+    broadcasts when the decision changes.
+    """
+    global _low_queue_paused
+    paused = level >= ThrottleLevel.HEAVY
+    if paused == _low_queue_paused:
+        return
+    if paused:
+        celery_app.control.cancel_consumer("low", destination=[worker_name])
+    else:
+        celery_app.control.add_consumer("low", destination=[worker_name])
+    _low_queue_paused = paused
 
-@celery_app.task
-def check_resources():
+
+async def steer_low_queue_forever(
+    worker_name: str, interval: float = settings.RESOURCE_SAMPLE_INTERVAL_SECONDS
+):
+    """Worker-local timer that keeps this worker's low queue in step"""
+    while True:
+        level = resource_monitor.get_cluster_view().effective_level
+        try:
+            # Control commands are blocking broker round-trips
+            await asyncio.to_thread(steer_low_queue, worker_name, level)
+        except Exception as e:
+            logger.error(f"Failed to steer low queue: {e}")
+        await asyncio.sleep(interval)
+
+
+@celery_app.task(bind=True)
+def check_resources(self):
     status = resource_monitor.get_current_status()
+    view = resource_monitor.get_cluster_view()
 
     logger.info(
-        f"Resource status: CPU={status.cpu_percent}%, DiskFree={status.disk_free_percent}%, Throttle={status.throttle_level}"
+        f"Resource status: CPU={status.cpu_percent}%, "
+        f"DiskFree={status.disk_free_percent}%, "
+        f"Throttle={status.throttle_level}, Fleet={view.fleet_level}"
     )
 
-    if status.disk_free_percent < 10:
+    if any(node.disk_free_percent < 10 for node in view.nodes.values()):
         logger.warning("Low disk space! Triggering emergency cleanup")
         emergency_disk_cleanup.apply_async(queue="critical")
 
-    if status.throttle_level >= 2:
-        # Pause low-priority tasks
-        celery_app.control.cancel_consumer("low")
-    else:
-        celery_app.control.add_consumer("low")
+    # Each worker steers only itself (see steer_low_queue_forever); this
+    # also covers workers running without the persistent loop
+    if self.request.hostname:
+        steer_low_queue(self.request.hostname, view.effective_level)
 
-    return status.to_dict()
+    return {**status.to_dict(), "cluster": view.to_dict()}
@@ -1,12 +1,15 @@
-import asyncio
-from asgiref.sync import async_to_sync
+import time
 from celery.utils.log import get_task_logger
 
 from workers.celery_app import celery_app
 from src.scrapers.registry import scraper_registry
 from src.services.resource_monitor import resource_monitor, TaskType
+from src.services.ingest import ScrapeIngestor
 from src.services.job_service import JobService
+from src.services.query_watermarks import QueryWatermarks
+from src.core.config import settings
 from src.db.session import AsyncSessionLocal
+from src.core.runtime import run_async
 
 logger = get_task_logger(__name__)
 
@@ -15,9 +18,9 @@ logger = get_task_logger(__name__)
 def scrape_source(self, source_name: str):
     logger.info(f"Starting scrape task for {source_name}")
 
-    # Run async logic synchronously
+    # Runs on the worker process event loop
     try:
-        result = async_to_sync(run_scrape)(source_name)
+        result = run_async(run_scrape, source_name)
         return result
     except Exception as e:
         logger.error(f"Scrape task failed: {e}")
@@ -36,13 +39,40 @@ async def run_scrape(source_name: str):
         logger.error(f"Scraper {source_name} not found")
         return {"count": 0, "status": "not_found"}
 
-    jobs = await scraper.fetch_jobs()
+    started = time.perf_counter()
+    # Watermarks get their own session so ingest batch commits and
+    # rollbacks never carry half-updated watermark state with them
+    async with AsyncSessionLocal() as session, AsyncSessionLocal() as wm_session:
+        watermarks = None
+        if settings.SCRAPE_QUERY_WATERMARKS_ENABLED:
+            watermarks = QueryWatermarks(wm_session, source_name)
+        # Fetching and writing overlap; each batch commits on its own. A
+        # failed stream raises here, so watermarks are never saved for a
+        # run whose last query lost jobs (wm_session rolls back on close)
+        result = await ScrapeIngestor(session, source_name).run(
+            scraper.stream_jobs(watermarks=watermarks)
+        )
+        requests = None
+        if watermarks is not None:
+            # Empty runs count too: they are what backs a query off
+            await watermarks.save()
+            requests = watermarks.requests
+        if not result.total:
+            return {"count": 0, "source": source_name, "requests": requests}
 
-    if jobs:
-        async with AsyncSessionLocal() as session:
-            service = JobService(session)
-            count = await service.upsert_batch(jobs)
-            logger.info(f"Upserted {count} jobs from {source_name}")
-            return {"count": count, "source": source_name}
-
-    return {"count": 0, "source": source_name}
+        await JobService(session).record_run(
+            source_name, result, time.perf_counter() - started, requests=requests
+        )
+        logger.info(
+            f"Upserted {result.total} jobs from {source_name} "
+            f"(new={result.inserted}, changed={result.updated}, "
+            f"unchanged={result.unchanged})"
+        )
+        return {
+            "count": result.total,
+            "source": source_name,
+            "new": result.inserted,
+            "changed": result.updated,
+            "unchanged": result.unchanged,
+            "requests": requests,
+        }
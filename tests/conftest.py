@@ -1,13 +1,17 @@
+import asyncio
+import time
 import pytest
 import pytest_asyncio
 from typing import AsyncGenerator, Generator
 from fastapi.testclient import TestClient
 from httpx import AsyncClient, ASGITransport
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+from fakeredis import aioredis as fake_aioredis
 
 from src.core.config import settings
 from src.db.models import Base
 from src.db.session import get_db_session
+from src.services.response_cache import ResponseCache, get_response_cache
 from src.api.main import app
 
 # Use SQLite in-memory for testing
@@ -33,13 +37,37 @@ async def test_db_session(test_engine) -> AsyncGenerator[AsyncSession, None]:
         await session.rollback()
 
 
+@pytest.fixture(autouse=True)
+def no_redis(monkeypatch):
+    # Tasks invalidate the response cache, publish job events and share
+    # resource status over REDIS_URL; tests opt in to a fake Redis through
+    # the fake_redis fixture
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", False)
+    monkeypatch.setattr(settings, "JOB_EVENTS_ENABLED", False)
+    monkeypatch.setattr(settings, "RESOURCE_CLUSTER_ENABLED", False)
+
+
+@pytest_asyncio.fixture
+async def fake_redis():
+    redis = fake_aioredis.FakeRedis()
+    yield redis
+    await redis.aclose()
+
+
+@pytest.fixture
+def response_cache():
+    """Cache used by the ``client`` fixture; pass-through unless overridden"""
+    return ResponseCache(None)
+
+
 @pytest_asyncio.fixture
-async def client(test_db_session) -> AsyncGenerator[AsyncClient, None]:
+async def client(test_db_session, response_cache) -> AsyncGenerator[AsyncClient, None]:
     # Override get_db_session dependency
     async def override_get_db_session():
         yield test_db_session
 
     app.dependency_overrides[get_db_session] = override_get_db_session
+    app.dependency_overrides[get_response_cache] = lambda: response_cache
 
     async with AsyncClient(
         transport=ASGITransport(app=app), base_url="http://test"
@@ -47,3 +75,80 @@ async def client(test_db_session) -> AsyncGenerator[AsyncClient, None]:
         yield ac
 
     app.dependency_overrides.clear()
+
+
+class StubHTTPServer:
+    """Local HTTP/1.1 server with injectable latency and per-path status.
+
+    Records the start time of every request and the peak number of requests
+    in flight, so tests can assert on concurrency and rate limits.
+    """
+
+    def __init__(self):
+        self.latency = 0.0
+        self.status_by_path = {}
+        self.body = b'{"results": []}'
+        self.requests = []
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self._server = None
+
+    @property
+    def url(self) -> str:
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    async def start(self):
+        self._server = await asyncio.start_server(self._handle, "127.0.0.1", 0)
+
+    async def stop(self):
+        self._server.close()
+        await self._server.wait_closed()
+
+    async def _handle(self, reader, writer):
+        try:
+            while True:
+                request_line = await reader.readline()
+                if not request_line:
+                    break
+                method, path, _ = request_line.decode().split(" ", 2)
+                headers = {}
+                while True:
+                    line = await reader.readline()
+                    if line in (b"\r\n", b"\n", b""):
+                        break
+                    key, value = line.decode().split(":", 1)
+                    headers[key.strip().lower()] = value.strip()
+                length = int(headers.get("content-length", 0))
+                if length:
+                    await reader.readexactly(length)
+
+                self.requests.append((time.monotonic(), method, path))
+                self.in_flight += 1
+                self.max_in_flight = max(self.max_in_flight, self.in_flight)
+                try:
+                    await asyncio.sleep(self.latency)
+                finally:
+                    self.in_flight -= 1
+
+                status = self.status_by_path.get(path, 200)
+                body = b"" if method == "HEAD" else self.body
+                writer.write(
+                    f"HTTP/1.1 {status} Stub\r\n"
+                    f"Content-Type: application/json\r\n"
+                    f"Content-Length: {len(self.body)}\r\n\r\n".encode()
+                    + body
+                )
+                await writer.drain()
+        except (ConnectionError, asyncio.IncompleteReadError):
+            pass
+        finally:
+            writer.close()
+
+
+@pytest_asyncio.fixture
+async def stub_http_server() -> AsyncGenerator[StubHTTPServer, None]:
+    server = StubHTTPServer()
+    await server.start()
+    yield server
+    await server.stop()
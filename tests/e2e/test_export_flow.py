@@ -0,0 +1,53 @@
+import os
+import psutil
+import pytest
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
+
+from src.api.routes.jobs import export_jobs
+from src.db.models import Base
+
+EXPORT_ROWS = int(os.environ.get("EXPORT_TEST_ROWS", 1_000_000))
+# Peak RSS growth allowed while streaming, independent of EXPORT_ROWS
+RSS_CEILING_BYTES = 64 * 1024 * 1024
+
+
+async def seed_jobs(engine, rows: int) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(
+            text(
+                "WITH RECURSIVE seq(n) AS "
+                "(SELECT 1 UNION ALL SELECT n + 1 FROM seq WHERE n < :rows) "
+                "INSERT INTO jobs (source, external_id, title, company, location, "
+                "tags, url, fetched_at, is_remote, is_valid) "
+                "SELECT 'bench', 'ext-' || n, 'Engineer ' || n, 'Bench Corp', "
+                "'Toronto, ON', '{\"skills\": [\"python\"]}', "
+                "'https://example.com/jobs/' || n, "
+                "datetime('2026-01-01', '+' || n || ' seconds'), 0, 1 FROM seq"
+            ),
+            {"rows": rows},
+        )
+
+
+@pytest.mark.asyncio
+async def test_export_streams_in_constant_memory(tmp_path):
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path}/export.db")
+    await seed_jobs(engine, EXPORT_ROWS)
+    session_factory = async_sessionmaker(engine, class_=AsyncSession)
+
+    process = psutil.Process()
+    async with session_factory() as session:
+        response = await export_jobs(
+            format="ndjson", gzip=False, source=None, skill=None, db=session
+        )
+        baseline = process.memory_info().rss
+        peak = baseline
+        lines = 0
+        async for chunk in response.body_iterator:
+            lines += chunk.count(b"\n")
+            peak = max(peak, process.memory_info().rss)
+    await engine.dispose()
+
+    assert lines == EXPORT_ROWS
+    assert peak - baseline < RSS_CEILING_BYTES
@@ -6,9 +6,9 @@ from sqlalchemy import select
 
 
 @pytest.mark.asyncio
-@patch("src.scrapers.tavily.TavilyScraper.fetch_jobs")
+@patch("src.scrapers.tavily.TavilyScraper.stream_jobs")
 @patch("src.tasks.scraping.AsyncSessionLocal")
-async def test_full_scraping_flow(mock_session_cls, mock_fetch, test_db_session):
+async def test_full_scraping_flow(mock_session_cls, mock_stream, test_db_session):
     # Setup scraper registry
     from src.scrapers.registry import scraper_registry
     from src.scrapers.tavily import TavilyScraper
@@ -32,8 +32,12 @@ async def test_full_scraping_flow(mock_session_cls, mock_fetch, test_db_session)
         url="http://example.com/e2e",
         fetched_at=None,  # Will be set by scraper usually, but here we return Job objects
     )
-    # Scrapers return Job objects
-    mock_fetch.return_value = [job]
+
+    # Scrapers stream Job objects
+    async def stream():
+        yield job
+
+    mock_stream.return_value = stream()
 
     # Run scraping task
     result = await run_scrape("tavily")
@@ -0,0 +1,86 @@
+"""Load test: fan one job change event out to 5k simulated WebSocket clients"""
+
+import asyncio
+import json
+import random
+import time
+
+import fakeredis
+import pytest
+from fakeredis import aioredis as fake_aioredis
+
+from src.api.websockets.updates import ConnectionManager
+from src.services.job_events import CHANNEL, JobChanges, JobEventRelay
+
+CLIENTS = 5000
+STALLED = 50
+SEND_TIMEOUT = 0.5
+
+
+class SimulatedClient:
+    def __init__(self, delay: float):
+        self.delay = delay
+        self.received = []
+        self.closed = False
+
+    async def accept(self):
+        pass
+
+    async def send_text(self, payload):
+        await asyncio.sleep(self.delay)
+        self.received.append(payload)
+
+    async def close(self, code=1000):
+        self.closed = True
+
+
+@pytest.mark.asyncio
+async def test_broadcast_to_5k_clients_with_stalled_readers():
+    rng = random.Random(7)
+    manager = ConnectionManager(send_timeout=SEND_TIMEOUT)
+    clients = [SimulatedClient(rng.uniform(0, 0.05)) for _ in range(CLIENTS)]
+    # A few clients never drain their socket
+    for client in rng.sample(clients, STALLED):
+        client.delay = 3600
+    for client in clients:
+        await manager.connect(client)
+
+    server = fakeredis.FakeServer()
+    relayed = asyncio.Event()
+    queued = []
+
+    async def fan_out(payload):
+        queued.append(await manager.broadcast_text(payload))
+        relayed.set()
+
+    relay = JobEventRelay(fake_aioredis.FakeRedis(server=server), fan_out)
+    task = asyncio.create_task(relay.run())
+    publisher = fake_aioredis.FakeRedis(server=server)
+    live = [c for c in clients if c.delay != 3600]
+    stalled = [c for c in clients if c.delay == 3600]
+    try:
+        while not (await publisher.pubsub_numsub(CHANNEL))[0][1]:
+            await asyncio.sleep(0.01)
+
+        changes = JobChanges()
+        for i in range(100):
+            changes.add(i, {"title": f"Engineer {i}", "source": "tavily"}, True)
+        event = next(changes.events("tavily"))
+
+        started = time.monotonic()
+        await publisher.publish(CHANNEL, json.dumps(event))
+        await asyncio.wait_for(relayed.wait(), 10)
+        while not all(c.received for c in live) or not all(c.closed for c in stalled):
+            await asyncio.sleep(0.01)
+            assert time.monotonic() - started < 10
+        elapsed = time.monotonic() - started
+    finally:
+        task.cancel()
+        await publisher.aclose()
+
+    # Bounded by the per-connection timeout, not by the number of clients
+    assert elapsed < SEND_TIMEOUT * 2 + 1.0
+    assert queued == [CLIENTS]
+    assert len(manager.active_connections) == CLIENTS - STALLED
+    assert all(not c.received for c in stalled)
+    assert all(len(json.loads(c.received[0])["new"]) == 100 for c in live)
@@ -1,5 +1,10 @@
+import csv
+import io
+import json
 import pytest
 from src.db.models import Job
+from src.services.job_service import JobService
+from src.services.response_cache import ResponseCache
 from datetime import datetime
 
 
@@ -44,6 +49,45 @@ async def test_list_jobs_with_data(client, test_db_session):
     assert data[0]["title"] == "Test Job"
 
 
+@pytest.mark.asyncio
+async def test_list_jobs_cursor(client, test_db_session):
+    test_db_session.add_all(
+        [
+            Job(source="test", external_id=str(i), title=f"Job {i}", tags={})
+            for i in range(3)
+        ]
+    )
+    await test_db_session.commit()
+
+    first = await client.get("/api/v1/jobs/", params={"limit": 2})
+    assert len(first.json()) == 2
+    cursor = first.headers["x-next-cursor"]
+
+    second = await client.get("/api/v1/jobs/", params={"limit": 2, "cursor": cursor})
+    assert len(second.json()) == 1
+    assert "x-next-cursor" not in second.headers
+
+    bad = await client.get("/api/v1/jobs/", params={"cursor": "garbage"})
+    assert bad.status_code == 400
+
+
+@pytest.mark.asyncio
+async def test_search_jobs(client, test_db_session):
+    await JobService(test_db_session).bulk_upsert(
+        [
+            Job(source="test", external_id="1", title="Data Engineer"),
+            Job(source="test", external_id="2", title="Product Designer"),
+        ]
+    )
+
+    response = await client.get("/api/v1/jobs/search", params={"q": "engineer"})
+    assert response.status_code == 200
+    assert [job["title"] for job in response.json()] == ["Data Engineer"]
+
+    bad = await client.get("/api/v1/jobs/search", params={"q": "!!"})
+    assert bad.status_code == 400
+
+
 @pytest.mark.asyncio
 async def test_get_job_detail(client, test_db_session):
     job = Job(
@@ -102,8 +146,107 @@ async def test_summary(client, test_db_session):
     assert "Toronto" in data["stats"]["regions"]
 
 
+@pytest.mark.asyncio
+async def test_summary_etag(client, test_db_session):
+    response = await client.get("/api/v1/jobs/summary")
+    assert response.status_code == 200
+    etag = response.headers["etag"]
+    assert "max-age" in response.headers["cache-control"]
+
+    cached = await client.get(
+        "/api/v1/jobs/summary", headers={"If-None-Match": etag}
+    )
+    assert cached.status_code == 304
+
+    # Forced rebuild bumps the version and therefore the ETag
+    rebuilt = await client.post("/api/v1/admin/summary/rebuild")
+    assert rebuilt.status_code == 200
+    assert rebuilt.json()["version"] == 2
+
+    fresh = await client.get("/api/v1/jobs/summary", headers={"If-None-Match": etag})
+    assert fresh.status_code == 200
+    assert fresh.headers["etag"] != etag
+
+
 @pytest.mark.asyncio
 async def test_admin_resources(client):
     response = await client.get("/api/v1/admin/resources")
     assert response.status_code == 200
     assert "cpu_percent" in response.json()
+
+    response = await client.get("/api/v1/admin/resources/cluster")
+    assert response.status_code == 200
+    assert response.json()["node"] in response.json()["nodes"]
+
+
+@pytest.mark.asyncio
+async def test_export_jobs(client, test_db_session):
+    await JobService(test_db_session).bulk_upsert(
+        [
+            Job(source="a", external_id="1", title="Python Dev", tags={"raw": []}),
+            Job(source="b", external_id="2", title="Designer, UX"),
+        ]
+    )
+
+    ndjson = await client.get("/api/v1/jobs/export")
+    assert ndjson.headers["content-type"] == "application/x-ndjson"
+    rows = [json.loads(line) for line in ndjson.text.splitlines()]
+    assert {row["title"] for row in rows} == {"Python Dev", "Designer, UX"}
+    assert rows[0]["tags"]["skills"] is not None
+
+    csv_export = await client.get(
+        "/api/v1/jobs/export", params={"format": "csv", "source": "b"}
+    )
+    records = list(csv.DictReader(io.StringIO(csv_export.text)))
+    assert [r["title"] for r in records] == ["Designer, UX"]
+
+    # httpx transparently decodes Content-Encoding: gzip
+    gzipped = await client.get("/api/v1/jobs/export", params={"gzip": "true"})
+    assert gzipped.headers["content-encoding"] == "gzip"
+    assert len(gzipped.text.splitlines()) == 2
+
+    bad = await client.get("/api/v1/jobs/export", params={"format": "xml"})
+    assert bad.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_read_endpoints_cached_until_invalidated(
+    client, test_db_session, fake_redis
+):
+    from src.api.main import app
+    from src.services.response_cache import get_response_cache
+
+    cache = ResponseCache(fake_redis)
+    app.dependency_overrides[get_response_cache] = lambda: cache
+    service = JobService(test_db_session)
+    await service.bulk_upsert(
+        [Job(source="a", external_id=str(i), title=f"Job {i}") for i in range(3)]
+    )
+
+    first = await client.get("/api/v1/jobs/", params={"limit": 2})
+    assert [j["title"] for j in first.json()] == ["Job 2", "Job 1"]
+    assert "x-next-cursor" in first.headers
+    job_id = first.json()[0]["id"]
+    detail = await client.get(f"/api/v1/jobs/{job_id}")
+    summary = await client.get("/api/v1/jobs/summary")
+    assert summary.json()["metadata"]["total_jobs"] == 3
+
+    await service.bulk_upsert([Job(source="a", external_id="3", title="Job 3")])
+
+    # Writes outside the tasks are invisible until the cache is invalidated;
+    # query parameter order does not matter
+    stale = await client.get("/api/v1/jobs/?limit=2")
+    assert stale.json() == first.json()
+    assert stale.headers["x-next-cursor"] == first.headers["x-next-cursor"]
+    assert (await client.get(f"/api/v1/jobs/{job_id}")).json() == detail.json()
+    not_modified = await client.get(
+        "/api/v1/jobs/summary", headers={"If-None-Match": summary.headers["etag"]}
+    )
+    assert not_modified.status_code == 304
+
+    await cache.invalidate()
+
+    fresh = await client.get("/api/v1/jobs/", params={"limit": 2})
+    assert [j["title"] for j in fresh.json()] == ["Job 3", "Job 2"]
+    missing = await client.get("/api/v1/jobs/999999")
+    assert missing.status_code == 404
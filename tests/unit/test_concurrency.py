@@ -0,0 +1,109 @@
+import asyncio
+from unittest.mock import Mock
+
+import pytest
+
+from src.core.config import settings
+from src.monitoring.metrics import CONCURRENCY_LIMIT
+from src.services.concurrency import (
+    AdaptiveConcurrencyController,
+    AdaptiveLimit,
+    AdaptiveLimiter,
+)
+from src.services.resource_monitor import ThrottleLevel
+
+
+class FakeMonitor:
+    """Hands out a new cluster view object per sample, like ResourceMonitor"""
+
+    def __init__(self):
+        self.view = None
+        self.sample(ThrottleLevel.NORMAL)
+
+    def sample(self, level: ThrottleLevel):
+        self.view = Mock(effective_level=level)
+
+    def get_cluster_view(self):
+        return self.view
+
+
+@pytest.fixture
+def monitor():
+    return FakeMonitor()
+
+
+@pytest.fixture
+def controller(monitor):
+    return AdaptiveConcurrencyController(monitor)
+
+
+def test_limit_backs_off_multiplicatively_and_recovers_additively():
+    limit = AdaptiveLimit("test", maximum=20, recovery_steps=10)
+
+    assert limit.update(ThrottleLevel.LIGHT, light_factor=0.75) == 15
+    assert limit.update(ThrottleLevel.HEAVY, heavy_factor=0.5) == 7
+    assert limit.update(ThrottleLevel.PAUSE) == 1
+    assert [limit.update(ThrottleLevel.NORMAL) for _ in range(3)] == [3, 5, 7]
+    for _ in range(10):
+        limit.update(ThrottleLevel.NORMAL)
+    assert limit.value == 20
+
+
+def test_limit_reads_settings_at_call_time(monkeypatch):
+    monkeypatch.setattr(settings, "CONCURRENCY_RECOVERY_STEPS", 2)
+    monkeypatch.setattr(settings, "CONCURRENCY_HEAVY_FACTOR", 0.25)
+    limit = AdaptiveLimit("settings_test", maximum=20)
+
+    assert limit.update(ThrottleLevel.HEAVY) == 5
+    assert limit.update(ThrottleLevel.NORMAL) == 15
+
+
+def test_limit_is_exported_as_gauge():
+    limit = AdaptiveLimit("gauge_test", maximum=40)
+    limit.update(ThrottleLevel.HEAVY, heavy_factor=0.5)
+
+    assert CONCURRENCY_LIMIT.labels(pool="gauge_test")._value.get() == 20
+
+
+def test_controller_moves_once_per_sample(controller, monitor):
+    assert controller.value("pool", 16) == 16
+
+    monitor.sample(ThrottleLevel.HEAVY)
+    assert controller.value("pool", 16) == 8
+    # Reads between samples see the same limit
+    assert controller.value("pool", 16) == 8
+
+    monitor.sample(ThrottleLevel.NORMAL)
+    assert controller.value("pool", 16) == 9
+    assert controller.snapshot() == {"pool": 9}
+
+
+def test_new_maximum_keeps_backoff_proportional(controller, monitor):
+    monitor.sample(ThrottleLevel.HEAVY)
+    controller.value("pool", 10)
+    assert controller.value("pool", 10) == 5
+
+    assert controller.value("pool", 40) == 20
+
+
+@pytest.mark.asyncio
+async def test_limiter_follows_the_current_size():
+    size = 3
+    in_flight = peak = 0
+
+    async def work(limiter):
+        nonlocal in_flight, peak
+        async with limiter:
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+
+    limiter = AdaptiveLimiter(lambda: size)
+    await asyncio.gather(*(work(limiter) for _ in range(10)))
+    assert peak == 3
+
+    size, peak = 1, 0
+    await asyncio.gather(*(work(limiter) for _ in range(5)))
+    assert peak == 1
+    assert limiter.in_flight == 0
@@ -1,8 +1,16 @@
+import asyncio
+import time
+import httpx
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
+from collections import Counter
 from datetime import datetime, timedelta
+from sqlalchemy import select
 from src.services.freshness import FreshnessManager, RetentionPolicy
-from src.db.models import Job, ArchivedJob
+from src.db.models import Job, ArchivedJob, JobLabel
+from src.services.job_service import JobService
+from src.services.summary_snapshot import SummaryDelta
+from src.services.job_events import JobChanges
 
 
 @pytest.fixture
@@ -12,8 +20,10 @@ def mock_db():
     result = Mock()
     result.scalars.return_value.all.return_value = []
     session.execute.return_value = result
-    # db.add is synchronous
+    # db.add and db.get_bind are synchronous
     session.add = Mock()
+    session.get_bind = Mock()
+    session.get_bind.return_value.dialect.name = "sqlite"
     return session
 
 
@@ -103,8 +113,9 @@ async def test_archive_job(manager):
     assert added_obj.title == "Dev"
     assert added_obj.archived_at is not None
 
-    # Verify original job was deleted
+    # Verify original job was deleted, along with its labels and search row
     manager.db.delete.assert_awaited_once_with(job)
+    assert manager.db.execute.await_count == 2
     manager.db.commit.assert_awaited_once()
 
 
@@ -126,13 +137,15 @@ async def test_run_cleanup_cycle_full(manager):
     job2 = Job(id=2, url="http://bad.com")
 
     manager.get_stale_jobs = AsyncMock(return_value=[job1, job2])
-    manager.check_job_validity = AsyncMock(side_effect=[True, False])
-    manager.soft_delete_job = AsyncMock()
+    manager.validate_jobs = AsyncMock(return_value={1: True, 2: False})
+    manager.apply_validation = AsyncMock()
 
-    # Setup archive jobs
-    job3 = Job(id=3, deleted_at=datetime.utcnow())
-    manager.db.execute.return_value.scalars.return_value.all.return_value = [job3]
-    manager.archive_job = AsyncMock()
+    manager.archive_expired = AsyncMock(
+        return_value={"archived": 1, "rows_per_second": 250.0}
+    )
+    manager.prune_archive = AsyncMock(
+        return_value={"partitions_dropped": 2, "rows_deleted": 0}
+    )
 
     with patch("src.services.freshness.resource_monitor") as mock_monitor:
         mock_monitor.get_current_status.return_value.throttle_level = 0
@@ -142,9 +155,34 @@ async def test_run_cleanup_cycle_full(manager):
         assert stats["validated"] == 2
         assert stats["soft_deleted"] == 1
         assert stats["archived"] == 1
+        assert stats["archive_rows_per_second"] == 250.0
+        assert stats["archive_partitions_dropped"] == 2
+
+        manager.apply_validation.assert_awaited_once_with({1: True, 2: False}, [1, 2])
+        manager.archive_expired.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_run_cleanup_cycle_records_removed_jobs(manager):
+    manager.get_stale_jobs = AsyncMock(
+        return_value=[Job(id=1, url="http://ok.com"), Job(id=2, url="http://bad.com")]
+    )
+    manager.validate_jobs = AsyncMock(return_value={1: True, 2: False})
+    manager.apply_validation = AsyncMock()
+    manager.archive_expired = AsyncMock(
+        return_value={"archived": 0, "rows_per_second": 0.0}
+    )
+    manager.prune_archive = AsyncMock(
+        return_value={"partitions_dropped": 0, "rows_deleted": 0}
+    )
+    changes = JobChanges()
 
-        manager.soft_delete_job.assert_awaited_once_with(job2)
-        manager.archive_job.assert_awaited_once_with(job3)
+    with patch("src.services.freshness.resource_monitor") as mock_monitor:
+        mock_monitor.get_current_status.return_value.throttle_level = 0
+        await manager.run_cleanup_cycle(changes=changes)
+
+    assert changes.removed == [2]
+    assert not changes.new and not changes.updated
 
 
 @pytest.mark.asyncio
@@ -154,6 +192,268 @@ async def test_run_cleanup_cycle_throttled(manager):
 
         stats = await manager.run_cleanup_cycle()
 
-        assert stats == {"validated": 0, "soft_deleted": 0, "archived": 0}
+        assert stats == {
+            "validated": 0,
+            "soft_deleted": 0,
+            "archived": 0,
+            "archive_rows_per_second": 0.0,
+            "archive_partitions_dropped": 0,
+            "archive_rows_pruned": 0,
+        }
         # Should not fetch jobs
         manager.db.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_run_cleanup_cycle_records_summary_delta(manager):
+    job = Job(
+        id=1,
+        url="http://bad.com",
+        is_valid=True,
+        is_remote=True,
+        location="Remote",
+        tags={"skills": ["Python"]},
+    )
+    manager.get_stale_jobs = AsyncMock(return_value=[job])
+    manager.validate_jobs = AsyncMock(return_value={1: False})
+    manager.apply_validation = AsyncMock()
+    delta = SummaryDelta()
+
+    with patch("src.services.freshness.resource_monitor") as mock_monitor:
+        mock_monitor.get_current_status.return_value.throttle_level = 0
+        await manager.run_cleanup_cycle(delta=delta)
+
+    assert delta.total == -1
+    assert delta.remote == -1
+    assert delta.skills["Python"] == -1
+
+
+@pytest.mark.asyncio
+async def test_validate_jobs_bounds_concurrency_per_host():
+    in_flight = Counter()
+    peaks = Counter()
+
+    async def handler(request):
+        host = request.url.host
+        in_flight[host] += 1
+        in_flight["*"] += 1
+        peaks[host] = max(peaks[host], in_flight[host])
+        peaks["*"] = max(peaks["*"], in_flight["*"])
+        await asyncio.sleep(0.05)
+        in_flight[host] -= 1
+        in_flight["*"] -= 1
+        return httpx.Response(404 if request.url.path == "/gone" else 200)
+
+    jobs = [
+        Job(id=i, url=f"http://{host}.example/{'gone' if i % 3 == 0 else 'ok'}")
+        for i, host in enumerate(["a", "b", "c"] * 6)
+    ]
+    jobs.append(Job(id=100, url=None))
+    async with httpx.AsyncClient(transport=httpx.MockTransport(handler)) as http:
+        manager = FreshnessManager(
+            AsyncMock(), http, concurrency=4, per_host_concurrency=2
+        )
+        verdicts = await manager.validate_jobs(jobs)
+
+    assert len(verdicts) == 18
+    invalid = [job_id for job_id, valid in verdicts.items() if not valid]
+    assert invalid == [0, 3, 6, 9, 12, 15]
+    assert peaks["*"] == 4
+    assert max(peaks[f"{host}.example"] for host in "abc") == 2
+
+
+@pytest.mark.asyncio
+async def test_validate_jobs_against_slow_host(stub_http_server):
+    stub_http_server.latency = 0.2
+    stub_http_server.status_by_path = {"/job/3": 404}
+    jobs = [Job(id=i, url=f"{stub_http_server.url}/job/{i}") for i in range(40)]
+
+    async with httpx.AsyncClient(timeout=10.0) as http:
+        manager = FreshnessManager(
+            AsyncMock(), http, concurrency=20, per_host_concurrency=10
+        )
+        started = time.monotonic()
+        verdicts = await manager.validate_jobs(jobs)
+        elapsed = time.monotonic() - started
+
+    # Serially this is 40 * 0.2s = 8s; ten at a time it is four rounds
+    assert elapsed < 2.0
+    assert stub_http_server.max_in_flight == 10
+    assert [job_id for job_id, valid in verdicts.items() if not valid] == [3]
+
+
+@pytest.mark.asyncio
+async def test_apply_validation_bulk_updates(test_db_session):
+    jobs = [Job(source="test", external_id=str(i), title="Dev") for i in range(3)]
+    test_db_session.add_all(jobs)
+    await test_db_session.commit()
+    manager = FreshnessManager(test_db_session, AsyncMock())
+
+    await manager.apply_validation({jobs[0].id: True, jobs[1].id: False})
+
+    result = await test_db_session.execute(select(Job).order_by(Job.id))
+    stored = result.scalars().all()
+    assert stored[0].is_valid and stored[0].deleted_at is None
+    assert stored[0].last_validated_at is not None
+    assert not stored[1].is_valid and stored[1].deleted_at is not None
+    assert stored[2].last_validated_at is None
+
+
+@pytest.mark.asyncio
+async def test_stale_batches_rotate_through_backlog(test_db_session):
+    old = datetime.utcnow() - timedelta(days=200)
+    test_db_session.add_all(
+        [
+            Job(source="t", external_id=str(i), title="Dev", fetched_at=old)
+            for i in range(25)
+        ]
+    )
+    await test_db_session.commit()
+    manager = FreshnessManager(test_db_session, AsyncMock())
+    # Batches of 10
+    manager.controller = Mock(value=Mock(return_value=10))
+
+    first = await manager.get_stale_jobs()
+    # Still-valid jobs, plus one whose check failed, are all stamped
+    await manager.apply_validation(
+        {job.id: True for job in first[1:]}, [job.id for job in first]
+    )
+    second = await manager.get_stale_jobs()
+
+    assert len(first) == len(second) == 10
+    assert not {job.id for job in first} & {job.id for job in second}
+
+
+@pytest.mark.asyncio
+async def test_archive_expired_moves_backlog_in_chunks(test_db_session):
+    old = datetime.utcnow() - timedelta(days=200)
+    recent = datetime.utcnow() - timedelta(days=1)
+    service = JobService(test_db_session)
+    await service.bulk_upsert(
+        [
+            Job(source="t", external_id=str(i), title="Python Dev", tags={"raw": []})
+            for i in range(7)
+        ]
+    )
+    jobs = (await test_db_session.execute(select(Job).order_by(Job.id))).scalars()
+    jobs = list(jobs)
+    for job in jobs[:5]:
+        job.deleted_at = old
+    jobs[5].deleted_at = recent
+    await test_db_session.commit()
+    manager = FreshnessManager(test_db_session, AsyncMock())
+
+    result = await manager.archive_expired(chunk_size=2)
+
+    assert result["archived"] == 5
+    assert result["rows_per_second"] > 0
+    archived = (await test_db_session.execute(select(ArchivedJob))).scalars().all()
+    assert sorted(a.id for a in archived) == [job.id for job in jobs[:5]]
+    assert all(a.title == "Python Dev" and a.archived_at for a in archived)
+    remaining = (await test_db_session.execute(select(Job.id))).scalars().all()
+    assert sorted(remaining) == [jobs[5].id, jobs[6].id]
+    labels = (await test_db_session.execute(select(JobLabel.job_id))).scalars()
+    assert set(labels) == {jobs[5].id, jobs[6].id}
+    assert [j.id for j in await service.search_jobs("python")] == [jobs[6].id]
+
+
+@pytest.mark.asyncio
+async def test_archive_expired_stops_at_budget(test_db_session):
+    old = datetime.utcnow() - timedelta(days=200)
+    test_db_session.add_all(
+        [
+            Job(source="t", external_id=str(i), title="Dev", deleted_at=old)
+            for i in range(4)
+        ]
+    )
+    await test_db_session.commit()
+    manager = FreshnessManager(test_db_session, AsyncMock())
+
+    result = await manager.archive_expired(budget_seconds=0)
+    assert result["archived"] == 0
+
+    result = await manager.archive_expired(chunk_size=3)
+    assert result["archived"] == 4
+
+
+@pytest.mark.asyncio
+async def test_prune_archive_deletes_rows_on_sqlite(test_db_session):
+    now = datetime.utcnow()
+    test_db_session.add_all(
+        [
+            ArchivedJob(
+                id=i,
+                source="t",
+                external_id=str(i),
+                title="Dev",
+                tags={},
+                fetched_at=now,
+                archived_at=now - timedelta(days=age),
+            )
+            for i, age in enumerate([400, 10])
+        ]
+    )
+    await test_db_session.commit()
+    policy = RetentionPolicy(archived_retention_days=365)
+    manager = FreshnessManager(test_db_session, AsyncMock(), policy=policy)
+
+    result = await manager.prune_archive()
+
+    assert result == {"partitions_dropped": 0, "rows_deleted": 1}
+    remaining = (await test_db_session.execute(select(ArchivedJob.id))).scalars()
+    assert list(remaining) == [1]
+
+
+@pytest.mark.asyncio
+async def test_prune_archive_drops_partitions_on_postgres(manager):
+    manager.db.get_bind.return_value.dialect.name = "postgresql"
+
+    with (
+        patch(
+            "src.services.freshness.drop_partitions_before",
+            AsyncMock(return_value=["archived_jobs_p202401"]),
+        ) as drop,
+        patch(
+            "src.services.freshness.prune_default_partition", AsyncMock(return_value=4)
+        ) as prune_default,
+    ):
+        result = await manager.prune_archive()
+
+    # Out-of-range rows in the default partition are pruned too
+    assert result == {"partitions_dropped": 1, "rows_deleted": 4}
+    assert drop.await_args.args[1] == "archived_jobs"
+    assert prune_default.await_args.args[1:3] == ("archived_jobs", "archived_at")
+
+
+@pytest.mark.asyncio
+async def test_prune_archive_disabled(manager):
+    manager.policy = RetentionPolicy(archived_retention_days=0)
+
+    result = await manager.prune_archive()
+
+    assert result == {"partitions_dropped": 0, "rows_deleted": 0}
+    manager.db.execute.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_rescraped_unchanged_job_is_not_stale(test_db_session):
+    service = JobService(test_db_session)
+    listing = dict(source="t", title="Python Dev", url="http://x.test/1")
+    await service.bulk_upsert(
+        [
+            Job(external_id="seen", **listing),
+            Job(external_id="gone", **{**listing, "url": "http://x.test/2"}),
+        ]
+    )
+    old = datetime.utcnow() - timedelta(days=200)
+    for job in (await test_db_session.execute(select(Job))).scalars():
+        job.fetched_at = job.last_seen_at = old
+    await test_db_session.commit()
+
+    # Unchanged re-scrape after the cutoff: only last_seen_at moves
+    result = await service.bulk_upsert([Job(external_id="seen", **listing)])
+    await test_db_session.commit()
+    assert result.unchanged == 1
+
+    stale = await FreshnessManager(test_db_session, AsyncMock()).get_stale_jobs()
+    assert [job.external_id for job in stale] == ["gone"]
@@ -0,0 +1,109 @@
+import asyncio
+import socket
+
+import pytest
+
+from src.core import http as http_pool
+from src.core.config import settings
+from src.core.http import (
+    DNSCache,
+    close_http_clients,
+    create_http_client,
+    get_http_client,
+    shutdown_http_clients,
+)
+from src.monitoring.metrics import HTTP_POOL_WAIT_SECONDS
+
+
+def _histogram_sum(histogram) -> float:
+    return next(
+        s.value
+        for m in histogram.collect()
+        for s in m.samples
+        if s.name.endswith("_sum")
+    )
+
+
+@pytest.mark.asyncio
+async def test_requests_reuse_pooled_connections(stub_http_server):
+    async with create_http_client() as client:
+        for i in range(20):
+            response = await client.head(f"{stub_http_server.url}/job/{i}")
+            assert response.status_code == 200
+        transport = client._transport
+
+    assert transport.requests == 20
+    assert transport.connections_opened == 1
+    assert transport.reuse_ratio == pytest.approx(0.95)
+
+
+@pytest.mark.asyncio
+async def test_pool_wait_is_recorded_when_pool_is_full(stub_http_server, monkeypatch):
+    monkeypatch.setattr(settings, "HTTP_MAX_CONNECTIONS", 2)
+    stub_http_server.latency = 0.05
+    before = _histogram_sum(HTTP_POOL_WAIT_SECONDS)
+
+    async with create_http_client() as client:
+        await asyncio.gather(
+            *(client.head(f"{stub_http_server.url}/job/{i}") for i in range(6))
+        )
+
+    assert stub_http_server.max_in_flight == 2
+    # Four requests queue behind the first two for one or two rounds
+    assert _histogram_sum(HTTP_POOL_WAIT_SECONDS) - before >= 0.2
+
+
+@pytest.mark.asyncio
+async def test_dns_results_are_cached(stub_http_server, monkeypatch):
+    loop = asyncio.get_running_loop()
+    lookups = []
+
+    async def getaddrinfo(host, port, **kwargs):
+        lookups.append(host)
+        return [(socket.AF_INET, socket.SOCK_STREAM, 6, "", ("127.0.0.1", port))]
+
+    monkeypatch.setattr(loop, "getaddrinfo", getaddrinfo)
+    monkeypatch.setattr(http_pool, "dns_cache", DNSCache(ttl_seconds=60))
+    monkeypatch.setattr(settings, "HTTP_MAX_KEEPALIVE_CONNECTIONS", 0)
+    port = stub_http_server.url.rsplit(":", 1)[1]
+
+    async with create_http_client() as client:
+        for _ in range(3):
+            response = await client.head(f"http://jobs.example:{port}/ok")
+            assert response.status_code == 200
+        # No keep-alive: every request opened a connection, one lookup total
+        assert client._transport.connections_opened == 3
+
+    assert lookups == ["jobs.example"]
+
+
+@pytest.mark.asyncio
+async def test_dns_cache_skips_ip_literals():
+    cache = DNSCache()
+    assert await cache.resolve("127.0.0.1", 80) == ["127.0.0.1"]
+    assert await cache.resolve("::1", 80) == ["::1"]
+
+
+@pytest.mark.asyncio
+async def test_one_shared_client_per_loop():
+    client = get_http_client()
+    assert get_http_client() is client
+
+    await close_http_clients()
+    assert client.is_closed
+    assert get_http_client() is not client
+    await close_http_clients()
+
+
+def test_shutdown_closes_clients_on_idle_loops():
+    loop = asyncio.new_event_loop()
+    try:
+
+        async def open_client():
+            return get_http_client()
+
+        client = loop.run_until_complete(open_client())
+        shutdown_http_clients()
+        assert client.is_closed
+    finally:
+        loop.close()
@@ -0,0 +1,86 @@
+import asyncio
+
+import pytest
+from sqlalchemy import func, select
+
+from src.db.models import Job
+from src.services.ingest import ScrapeIngestor
+
+
+def _job(i: int) -> Job:
+    return Job(source="tavily", external_id=f"ext-{i}", title=f"Engineer {i}")
+
+
+async def _count(session) -> int:
+    return await session.scalar(select(func.count()).select_from(Job))
+
+
+async def _stream(n: int, delay: float = 0.0, fail_after: int = None):
+    for i in range(n):
+        if fail_after is not None and i == fail_after:
+            raise RuntimeError("scraper crashed")
+        if delay:
+            await asyncio.sleep(delay)
+        yield _job(i)
+
+
+@pytest.mark.asyncio
+async def test_commits_every_batch_size(test_db_session):
+    ingestor = ScrapeIngestor(test_db_session, "tavily", batch_size=10)
+
+    result = await ingestor.run(_stream(25))
+
+    assert result.inserted == 25
+    assert ingestor.batches == 3
+    assert await _count(test_db_session) == 25
+
+
+@pytest.mark.asyncio
+async def test_flushes_slow_streams_on_time(test_db_session):
+    ingestor = ScrapeIngestor(
+        test_db_session, "tavily", batch_size=1000, flush_seconds=0.05
+    )
+
+    result = await ingestor.run(_stream(6, delay=0.02))
+
+    assert result.inserted == 6
+    # Jobs 20ms apart with a 50ms window: written in several small batches
+    assert 2 <= ingestor.batches <= 4
+
+
+@pytest.mark.asyncio
+async def test_stream_failure_keeps_committed_batches(test_db_session):
+    ingestor = ScrapeIngestor(test_db_session, "tavily", batch_size=10)
+
+    with pytest.raises(RuntimeError, match="scraper crashed"):
+        await ingestor.run(_stream(100, fail_after=35))
+
+    # Everything produced before the crash is stored, not just full batches
+    assert await _count(test_db_session) == 35
+
+
+@pytest.mark.asyncio
+async def test_queue_bounds_jobs_ahead_of_the_writer(test_db_session, monkeypatch):
+    produced = 0
+    ahead = []
+
+    async def stream():
+        nonlocal produced
+        for i in range(40):
+            produced += 1
+            yield _job(i)
+
+    ingestor = ScrapeIngestor(test_db_session, "tavily", batch_size=5, queue_size=5)
+    flush = ingestor._flush
+
+    async def slow_flush(batch, total):
+        ahead.append(produced - (total.total + len(batch)))
+        await asyncio.sleep(0.01)
+        await flush(batch, total)
+
+    monkeypatch.setattr(ingestor, "_flush", slow_flush)
+    result = await ingestor.run(stream())
+
+    assert result.total == 40
+    # Queue plus the one job the producer holds while blocked on put()
+    assert max(ahead) <= 6
@@ -0,0 +1,108 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import AsyncMock, Mock, patch
+import fakeredis
+from fakeredis import aioredis as fake_aioredis
+
+from src.core.config import settings
+from src.services.job_events import (
+    CHANNEL,
+    JobChanges,
+    JobEventRelay,
+    publish_job_changes,
+)
+
+
+def make_changes(new=0, updated=0, removed=0):
+    changes = JobChanges()
+    for i in range(new):
+        changes.add(i, {"title": f"New {i}", "source": "t", "tags": {}}, True)
+    for i in range(updated):
+        changes.add(100 + i, {"title": f"Updated {i}"}, False)
+    for i in range(removed):
+        changes.remove(200 + i)
+    return changes
+
+
+def test_changes_keep_only_event_fields():
+    changes = make_changes(new=1)
+    assert changes.new == [
+        {
+            "id": 0,
+            "source": "t",
+            "title": "New 0",
+            "company": None,
+            "location": None,
+            "url": None,
+            "salary_text": None,
+            "is_remote": None,
+        }
+    ]
+    assert not JobChanges()
+
+
+def test_events_split_by_max_jobs():
+    events = list(make_changes(new=3, updated=2, removed=2).events("t", max_jobs=3))
+
+    assert len(events) == 3
+    assert [len(e["new"]) for e in events] == [3, 0, 0]
+    assert [len(e["updated"]) for e in events] == [0, 2, 0]
+    assert [e["removed"] for e in events] == [[], [200], [201]]
+    assert all(e["type"] == "jobs_changed" and e["source"] == "t" for e in events)
+
+
+@pytest.mark.asyncio
+async def test_publish_and_relay(monkeypatch):
+    monkeypatch.setattr(settings, "JOB_EVENTS_ENABLED", True)
+    monkeypatch.setattr(settings, "JOB_EVENTS_MAX_JOBS", 2)
+    server = fakeredis.FakeServer()
+    received = []
+    delivered = asyncio.Event()
+
+    async def on_event(payload):
+        received.append(json.loads(payload))
+        if len(received) == 2:
+            delivered.set()
+
+    relay = JobEventRelay(fake_aioredis.FakeRedis(server=server), on_event)
+    task = asyncio.create_task(relay.run())
+    try:
+        subscriber = fake_aioredis.FakeRedis(server=server)
+        while not (await subscriber.pubsub_numsub(CHANNEL))[0][1]:
+            await asyncio.sleep(0.01)
+
+        with patch("src.services.job_events.aioredis.from_url") as from_url:
+            from_url.return_value = fake_aioredis.FakeRedis(server=server)
+            published = await publish_job_changes(
+                make_changes(new=1, removed=1, updated=1), source="tavily"
+            )
+
+        assert published == 2
+        await asyncio.wait_for(delivered.wait(), 2)
+    finally:
+        task.cancel()
+
+    assert [len(e["new"]) + len(e["updated"]) for e in received] == [2, 0]
+    assert received[1]["removed"] == [200]
+    assert received[0]["source"] == "tavily"
+
+
+@pytest.mark.asyncio
+async def test_publish_skips_empty_and_disabled(monkeypatch):
+    with patch("src.services.job_events.aioredis.from_url") as from_url:
+        assert await publish_job_changes(make_changes(new=1)) == 0
+        monkeypatch.setattr(settings, "JOB_EVENTS_ENABLED", True)
+        assert await publish_job_changes(JobChanges()) == 0
+    from_url.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_relay_retries_after_failure():
+    redis = Mock()
+    redis.pubsub.side_effect = [ConnectionError("refused"), asyncio.CancelledError()]
+    relay = JobEventRelay(redis, AsyncMock(), retry_seconds=0)
+
+    with pytest.raises(asyncio.CancelledError):
+        await relay.run()
+    assert redis.pubsub.call_count == 2
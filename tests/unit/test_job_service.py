@@ -1,8 +1,17 @@
 import pytest
 from unittest.mock import Mock, AsyncMock
 from datetime import datetime
-from src.services.job_service import JobService
-from src.db.models import Job
+from sqlalchemy import select
+from src.services.job_service import (
+    JobService,
+    UpsertResult,
+    decode_cursor,
+    encode_cursor,
+)
+from src.core.config import settings
+from src.services.job_events import JobChanges
+from src.db.models import Job, JobLabel
+from src.monitoring.metrics import SCRAPE_NEW_JOBS_PER_REQUEST
 
 
 @pytest.fixture
@@ -25,48 +34,80 @@ async def test_upsert_batch_empty(service):
 
 
 @pytest.mark.asyncio
-async def test_upsert_batch_new(service):
+async def test_upsert_batch_new(test_db_session):
+    service = JobService(test_db_session)
     job = Job(source="test", external_id="1", title="New Job")
 
-    # Mock execute to return empty (no existing job)
-    result = Mock()
-    result.scalars.return_value.first.return_value = None
-    service.db.execute.return_value = result
+    result = await service.bulk_upsert([job])
 
-    count = await service.upsert_batch([job])
-
-    assert count == 1
-    service.db.add.assert_called_with(job)
-    service.db.commit.assert_awaited_once()
+    assert result == UpsertResult(inserted=1, updated=0)
+    saved = (await test_db_session.execute(select(Job))).scalars().one()
+    assert saved.title == "New Job"
+    assert saved.fetched_at is not None
+    assert saved.is_valid
 
 
 @pytest.mark.asyncio
-async def test_upsert_batch_existing(service):
-    job = Job(source="test", external_id="1", title="Updated Job")
+async def test_upsert_batch_existing(test_db_session):
+    service = JobService(test_db_session)
+    await service.upsert_batch([Job(source="test", external_id="1", title="Old Job")])
 
-    # Mock existing job
-    existing = Job(source="test", external_id="1", title="Old Job")
-    result = Mock()
-    result.scalars.return_value.first.return_value = existing
-    service.db.execute.return_value = result
+    result = await service.bulk_upsert(
+        [
+            Job(source="test", external_id="1", title="Updated Job"),
+            Job(source="test", external_id="2", title="Other Job"),
+        ]
+    )
+
+    assert result.inserted == 1
+    assert result.updated == 1
+    assert result.total == 2
+    rows = await test_db_session.execute(
+        select(Job.title).where(Job.external_id == "1")
+    )
+    assert rows.scalar_one() == "Updated Job"
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_deduplicates_keys(test_db_session):
+    service = JobService(test_db_session)
+    jobs = [
+        Job(source="test", external_id="1", title="First"),
+        Job(source="test", external_id="1", title="Second"),
+    ]
 
-    count = await service.upsert_batch([job])
+    count = await service.upsert_batch(jobs)
 
     assert count == 1
-    assert existing.title == "Updated Job"  # Updated in place
-    service.db.add.assert_not_called()
-    service.db.commit.assert_awaited_once()
+    rows = await test_db_session.execute(select(Job.title))
+    assert rows.scalars().all() == ["Second"]
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_chunks(test_db_session, monkeypatch):
+    service = JobService(test_db_session)
+    monkeypatch.setattr(service, "_chunk_size", lambda dialect: 2)
+    jobs = [Job(source="test", external_id=str(i), title=f"J{i}") for i in range(5)]
+
+    result = await service.bulk_upsert(jobs)
+
+    assert result.inserted == 5
+    rows = await test_db_session.execute(select(Job.id))
+    assert len(rows.all()) == 5
 
 
 @pytest.mark.asyncio
 async def test_upsert_batch_error(service):
-    job = Job(source="test", external_id="1")
+    job = Job(source="test", external_id="1", title="Broken")
+    service.db.get_bind = Mock()
+    service.db.get_bind.return_value.dialect.name = "sqlite"
     service.db.execute.side_effect = Exception("DB Error")
 
-    count = await service.upsert_batch([job])
+    with pytest.raises(Exception, match="DB Error"):
+        await service.upsert_batch([job])
 
-    assert count == 0
-    service.db.commit.assert_awaited_once()  # Commits whatever succeeded (none here)
+    service.db.rollback.assert_awaited_once()
+    service.db.commit.assert_not_awaited()
 
 
 @pytest.mark.asyncio
@@ -79,3 +120,231 @@ async def test_list_jobs(service):
 
     assert len(jobs) == 1
     service.db.execute.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_skips_unchanged(test_db_session):
+    service = JobService(test_db_session)
+    await service.bulk_upsert([Job(source="test", external_id="1", title="Same")])
+    before = (await test_db_session.execute(select(Job.fetched_at))).scalar_one()
+
+    result = await service.bulk_upsert(
+        [
+            Job(source="test", external_id="1", title="Same"),
+            Job(source="test", external_id="2", title="Fresh"),
+        ]
+    )
+
+    assert result == UpsertResult(inserted=1, updated=0, unchanged=1)
+    row = (
+        await test_db_session.execute(
+            select(Job.fetched_at, Job.last_seen_at, Job.content_hash).where(
+                Job.external_id == "1"
+            )
+        )
+    ).one()
+    assert row.fetched_at == before
+    assert row.last_seen_at > before
+    assert row.content_hash is not None
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_collects_changes(test_db_session):
+    service = JobService(test_db_session)
+    await service.bulk_upsert(
+        [
+            Job(source="test", external_id="1", title="Same"),
+            Job(source="test", external_id="2", title="Old"),
+        ]
+    )
+    changes = JobChanges()
+
+    await service.bulk_upsert(
+        [
+            Job(source="test", external_id="1", title="Same"),
+            Job(source="test", external_id="2", title="Renamed"),
+            Job(source="test", external_id="3", title="Fresh", company="Acme"),
+        ],
+        changes=changes,
+    )
+
+    ids = dict((await test_db_session.execute(select(Job.external_id, Job.id))).all())
+    assert [(j["id"], j["title"], j["company"]) for j in changes.new] == [
+        (ids["3"], "Fresh", "Acme")
+    ]
+    assert [(j["id"], j["title"]) for j in changes.updated] == [(ids["2"], "Renamed")]
+    assert changes.removed == []
+
+
+@pytest.mark.asyncio
+async def test_record_run(test_db_session):
+    service = JobService(test_db_session)
+
+    metric = await service.record_run(
+        "tavily", UpsertResult(inserted=2, updated=1, unchanged=4), 1.5
+    )
+
+    assert metric.id is not None
+    assert metric.total_jobs == 7
+    assert metric.new_jobs == 2
+    assert metric.changed_jobs == 1
+    assert metric.unchanged_jobs == 4
+    assert metric.new_jobs_per_request is None
+
+
+@pytest.mark.asyncio
+async def test_record_run_new_jobs_per_request(test_db_session):
+    metric = await JobService(test_db_session).record_run(
+        "tavily", UpsertResult(inserted=6, unchanged=30), 2.0, requests=4
+    )
+
+    assert metric.requests == 4
+    assert metric.new_jobs_per_request == 1.5
+    assert SCRAPE_NEW_JOBS_PER_REQUEST.labels(source="tavily")._value.get() == 1.5
+
+
+@pytest.mark.asyncio
+async def test_upsert_batch_persists_labels(test_db_session):
+    service = JobService(test_db_session)
+    await service.bulk_upsert(
+        [Job(source="test", external_id="1", title="Dev", tags={"raw": ["python"]})]
+    )
+    await service.bulk_upsert(
+        [Job(source="test", external_id="1", title="Dev", tags={"raw": ["kotlin"]})]
+    )
+
+    rows = await test_db_session.execute(select(JobLabel.kind, JobLabel.label))
+    assert rows.all() == [("skills", "Kotlin")]
+    job = (await test_db_session.execute(select(Job))).scalars().one()
+    assert job.tags["skills"] == ["Kotlin"]
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_skill_filter(test_db_session):
+    service = JobService(test_db_session)
+    await service.bulk_upsert(
+        [
+            Job(source="t", external_id="1", title="Python Dev", tags={}),
+            Job(source="t", external_id="2", title="Java Dev", tags={}),
+        ]
+    )
+
+    jobs = await service.list_jobs(skill="Java")
+
+    assert [j.title for j in jobs] == ["Java Dev"]
+
+
+@pytest.mark.asyncio
+async def test_list_jobs_keyset_pages(test_db_session):
+    base = datetime(2026, 1, 1)
+    test_db_session.add_all(
+        [
+            Job(
+                source="t",
+                external_id=str(i),
+                title=f"J{i}",
+                fetched_at=base.replace(hour=i % 3),
+            )
+            for i in range(7)
+        ]
+        + [
+            Job(source="t", external_id="gone", title="Gone", deleted_at=base),
+            Job(source="t", external_id="bad", title="Bad", is_valid=False),
+        ]
+    )
+    await test_db_session.commit()
+    service = JobService(test_db_session)
+
+    seen, cursor = [], None
+    while True:
+        page, cursor = await service.list_jobs_page(limit=3, cursor=cursor)
+        seen.extend(page)
+        if cursor is None:
+            break
+
+    assert len(seen) == 7
+    keys = [(j.fetched_at, j.id) for j in seen]
+    assert keys == sorted(keys, reverse=True)
+    assert {j.title for j in seen}.isdisjoint({"Gone", "Bad"})
+
+
+def test_decode_cursor_rejects_garbage():
+    with pytest.raises(ValueError):
+        decode_cursor("not-a-cursor")
+
+
+def test_cursor_round_trip():
+    job = Job(id=42, fetched_at=datetime(2026, 3, 4, 5, 6, 7))
+    assert decode_cursor(encode_cursor(job)) == (job.fetched_at, 42)
+
+
+@pytest.mark.asyncio
+async def test_search_jobs_ranks_and_filters(test_db_session):
+    service = JobService(test_db_session)
+    await service.bulk_upsert(
+        [
+            Job(source="a", external_id="1", title="Python Engineer", company="Acme"),
+            Job(
+                source="a",
+                external_id="2",
+                title="Sales Lead",
+                tags={"raw": ["python"]},
+            ),
+            Job(source="b", external_id="3", title="Senior Python Developer"),
+            Job(source="a", external_id="4", title="Java Engineer"),
+        ]
+    )
+
+    titles = [job.title for job in await service.search_jobs("python")]
+    assert set(titles) == {"Python Engineer", "Sales Lead", "Senior Python Developer"}
+    # Title matches outrank skill-only matches
+    assert titles[-1] == "Sales Lead"
+
+    jobs = await service.search_jobs("engineers pyth", source="a")
+    assert [job.title for job in jobs] == ["Python Engineer"]
+
+    # Rewritten rows are re-indexed, not duplicated
+    await service.bulk_upsert([Job(source="a", external_id="4", title="Rust Engineer")])
+    assert [job.title for job in await service.search_jobs("rust")] == ["Rust Engineer"]
+    assert await service.search_jobs("java") == []
+
+
+@pytest.mark.asyncio
+async def test_search_jobs_rejects_empty_terms(test_db_session):
+    with pytest.raises(ValueError):
+        await JobService(test_db_session).search_jobs("+-*")
+
+
+@pytest.mark.asyncio
+async def test_search_jobs_ranks_before_limiting(test_db_session):
+    service = JobService(test_db_session)
+    # The best match is the oldest row, behind many weaker newer matches
+    await service.bulk_upsert(
+        [Job(source="a", external_id="best", title="Python Engineer")]
+        + [
+            Job(source="a", external_id=str(i), title=f"Lead {i}", company="Python Co")
+            for i in range(20)
+        ]
+    )
+
+    jobs = await service.search_jobs("python", limit=1)
+    assert [job.external_id for job in jobs] == ["best"]
+
+
+@pytest.mark.asyncio
+async def test_search_candidate_limit_ranks_newest_matches_only(
+    test_db_session, monkeypatch
+):
+    monkeypatch.setattr(settings, "SEARCH_CANDIDATE_LIMIT", 5)
+    service = JobService(test_db_session)
+    await service.bulk_upsert(
+        [Job(source="a", external_id="best", title="Python Engineer")]
+        + [
+            Job(source="a", external_id=str(i), title=f"Lead {i}", company="Python Co")
+            for i in range(20)
+        ]
+    )
+
+    jobs = await service.search_jobs("python", limit=50)
+    # The cap trades recall for latency: the older best match is not ranked
+    assert [job.external_id for job in jobs] == ["19", "18", "17", "16", "15"]
@@ -0,0 +1,138 @@
+import json
+import os
+from datetime import datetime, timedelta
+
+import pyarrow.dataset as ds
+import pyarrow.parquet as pq
+import pytest
+from sqlalchemy import update
+
+from src.db.models import ArchivedJob, Job
+from src.services.parquet_export import STATE_FILE, ParquetSnapshotExporter
+
+
+def _read(path):
+    return ds.dataset(path, format="parquet", partitioning="hive").to_table()
+
+
+@pytest.fixture
+async def seeded(test_db_session):
+    day = datetime(2026, 10, 1, 12, 0)
+    test_db_session.add_all(
+        [
+            Job(
+                source="tavily",
+                external_id=str(i),
+                title=f"Engineer {i}",
+                fetched_at=day + timedelta(days=i % 2),
+                tags={"raw": ["python", "remote"], "skills": ["python"]},
+            )
+            for i in range(4)
+        ]
+        + [
+            Job(source="rss", external_id="r", title="Analyst", fetched_at=day),
+            ArchivedJob(
+                id=100,
+                source="tavily",
+                external_id="old",
+                title="Old role",
+                fetched_at=day - timedelta(days=200),
+                archived_at=day,
+                tags={"weird": ["quantum"]},
+            ),
+        ]
+    )
+    await test_db_session.commit()
+    return test_db_session
+
+
+@pytest.mark.asyncio
+async def test_full_export_partitions_by_source_and_date(seeded, tmp_path):
+    exporter = ParquetSnapshotExporter(seeded, str(tmp_path), row_group_size=1)
+
+    counts = await exporter.export()
+
+    assert counts == {"jobs": 5, "archived_jobs": 1}
+    partitions = sorted(
+        os.path.relpath(root, tmp_path)
+        for root, _, files in os.walk(tmp_path / "jobs")
+        if files
+    )
+    assert partitions == [
+        "jobs/source=rss/fetch_date=2026-10-01",
+        "jobs/source=tavily/fetch_date=2026-10-01",
+        "jobs/source=tavily/fetch_date=2026-10-02",
+    ]
+    part = next((tmp_path / "jobs/source=tavily/fetch_date=2026-10-01").iterdir())
+    # Bounded row groups rather than one group per file
+    assert pq.ParquetFile(part).num_row_groups == 2
+
+    jobs = _read(tmp_path / "jobs").to_pylist()
+    tavily = [row for row in jobs if row["source"] == "tavily"]
+    assert {row["external_id"] for row in tavily} == {"0", "1", "2", "3"}
+    assert tavily[0]["tags"] == ["python", "remote"]
+    assert tavily[0]["skills"] == ["python"]
+    assert tavily[0]["weird"] == []
+
+    archived = _read(tmp_path / "archived_jobs").to_pylist()
+    assert [(row["id"], row["weird"]) for row in archived] == [(100, ["quantum"])]
+
+
+@pytest.mark.asyncio
+async def test_incremental_export_writes_only_changed_rows(seeded, tmp_path):
+    # Older than the watermark lag, so only rows changed below are re-exported
+    await seeded.execute(
+        update(Job).values(updated_at=datetime.utcnow() - timedelta(hours=1))
+    )
+    await seeded.commit()
+    exporter = ParquetSnapshotExporter(seeded, str(tmp_path))
+    await exporter.export()
+    state = json.loads((tmp_path / STATE_FILE).read_text())
+    assert set(state) == {"jobs", "archived_jobs"}
+
+    assert await exporter.export() == {"jobs": 0, "archived_jobs": 0}
+
+    await seeded.execute(
+        update(Job)
+        .where(Job.external_id == "2")
+        .values(
+            title="Staff Engineer", updated_at=datetime.utcnow() + timedelta(seconds=1)
+        )
+    )
+    await seeded.commit()
+
+    assert await exporter.export() == {"jobs": 1, "archived_jobs": 0}
+    files = sorted((tmp_path / "jobs/source=tavily/fetch_date=2026-10-01").iterdir())
+    assert len(files) == 2
+    assert pq.read_table(files[-1]).column("title").to_pylist() == ["Staff Engineer"]
+
+
+@pytest.mark.asyncio
+async def test_full_export_ignores_watermark(seeded, tmp_path):
+    exporter = ParquetSnapshotExporter(seeded, str(tmp_path))
+    await exporter.export()
+
+    assert await exporter.export(full=True) == {"jobs": 5, "archived_jobs": 1}
+
+
+@pytest.mark.asyncio
+async def test_incremental_export_picks_up_late_committed_rows(seeded, tmp_path):
+    exporter = ParquetSnapshotExporter(seeded, str(tmp_path), watermark_lag_seconds=60)
+    # Stamped before the first export starts but committed after it ran
+    stamped = datetime.utcnow() - timedelta(seconds=5)
+    await exporter.export()
+
+    seeded.add(
+        Job(
+            source="tavily",
+            external_id="late",
+            title="Late Engineer",
+            fetched_at=datetime(2026, 10, 1, 12, 0),
+            updated_at=stamped,
+        )
+    )
+    await seeded.commit()
+
+    await exporter.export()
+    jobs = _read(tmp_path / "jobs").to_pylist()
+    assert "late" in {row["external_id"] for row in jobs}
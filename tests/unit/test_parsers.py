@@ -4,6 +4,9 @@ from src.services.parsers import (
     parse_title_company,
     infer_location,
     compute_skills,
+    compute_innovations,
+    compute_weird_tags,
+    classify,
     build_external_id,
 )
 
@@ -50,3 +53,26 @@ def test_build_external_id():
     id3 = build_external_id("http://b.com", "Job 1")
     assert id1 == id2
     assert id1 != id3
+
+
+def test_classify_single_pass():
+    result = classify("Generative AI Prompt Engineer", ["python", "node.js"])
+    assert result.skills == ["Node.js", "Python"]
+    assert result.innovations == ["AI", "GenAI"]
+    assert result.weird == ["Prompt Engineering"]
+
+
+def test_classify_word_boundaries():
+    # Prefix keys only count when they end on a boundary of their own
+    assert classify("JavaScript Developer", []).skills == ["JavaScript"]
+    assert classify("Robotics Lead", []).innovations == ["Robotics"]
+    assert classify("Cybersecurity Analyst", []).skills == []
+    assert classify("Go / Golang Engineer", []).skills == ["Go"]
+
+
+def test_compute_helpers_match_classify():
+    title, tags = "Quantum Security Researcher", ["policy"]
+    result = classify(title, tags)
+    assert compute_skills(title, tags) == result.skills
+    assert compute_innovations(title, tags) == ["Cybersecurity", "Quantum"]
+    assert compute_weird_tags(title, tags) == ["Policy", "Quantum"]
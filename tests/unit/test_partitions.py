@@ -0,0 +1,78 @@
+import pytest
+from datetime import date, datetime
+from unittest.mock import AsyncMock, Mock
+
+from src.db.partitions import (
+    add_months,
+    create_partition_sql,
+    drop_partitions_before,
+    ensure_partitions,
+    month_start,
+    prune_default_partition,
+)
+
+
+def test_month_arithmetic():
+    assert month_start(datetime(2026, 10, 17, 12, 30)) == date(2026, 10, 1)
+    assert add_months(date(2026, 11, 1), 2) == date(2027, 1, 1)
+    assert add_months(date(2026, 1, 1), -1) == date(2025, 12, 1)
+
+
+def test_create_partition_sql():
+    sql = create_partition_sql("archived_jobs", date(2026, 12, 1))
+    assert sql == (
+        "CREATE TABLE IF NOT EXISTS archived_jobs_p202612 "
+        "PARTITION OF archived_jobs FOR VALUES "
+        "FROM ('2026-12-01') TO ('2027-01-01')"
+    )
+
+
+@pytest.mark.asyncio
+async def test_ensure_partitions_creates_current_and_next_months():
+    db = AsyncMock()
+
+    await ensure_partitions(db, "archived_jobs", datetime(2026, 12, 5), months_ahead=1)
+
+    statements = [str(call.args[0]) for call in db.execute.await_args_list]
+    assert [s.split()[5] for s in statements] == [
+        "archived_jobs_p202612",
+        "archived_jobs_p202701",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_drop_partitions_before_only_drops_whole_months():
+    db = AsyncMock()
+    listing = Mock()
+    listing.scalars.return_value.all.return_value = [
+        "archived_jobs_p202608",
+        "archived_jobs_p202609",
+        "archived_jobs_default",
+    ]
+    db.execute.side_effect = [listing] + [Mock()] * 4
+
+    dropped = await drop_partitions_before(db, "archived_jobs", datetime(2026, 9, 15))
+
+    # September is only half past the cutoff; the default partition is kept
+    assert dropped == ["archived_jobs_p202608"]
+    statements = [str(call.args[0]) for call in db.execute.await_args_list[1:]]
+    assert statements == [
+        "ALTER TABLE archived_jobs DETACH PARTITION archived_jobs_p202608",
+        "DROP TABLE archived_jobs_p202608",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_prune_default_partition_deletes_expired_rows():
+    db = AsyncMock()
+    db.execute.return_value.rowcount = 3
+    cutoff = datetime(2026, 9, 15)
+
+    deleted = await prune_default_partition(db, "archived_jobs", "archived_at", cutoff)
+
+    assert deleted == 3
+    statement, params = db.execute.await_args.args
+    assert str(statement) == (
+        "DELETE FROM archived_jobs_default WHERE archived_at < :cutoff"
+    )
+    assert params == {"cutoff": cutoff}
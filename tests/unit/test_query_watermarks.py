@@ -0,0 +1,89 @@
+import pytest
+from datetime import datetime, timedelta
+from sqlalchemy import select
+
+from src.core.config import settings
+from src.db.models import ScrapeQueryState
+from src.services.query_watermarks import QueryWatermarks
+
+NOW = datetime(2026, 10, 17, 12, 0)
+
+
+@pytest.fixture(autouse=True)
+def watermark_settings(monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPE_QUERY_MIN_RESULTS", 5)
+    monkeypatch.setattr(settings, "SCRAPE_QUERY_YIELD_ALPHA", 0.5)
+    monkeypatch.setattr(settings, "SCRAPE_QUERY_SKIP_AFTER_EMPTY_RUNS", 2)
+    monkeypatch.setattr(settings, "SCRAPE_QUERY_BACKOFF_HOURS", 12.0)
+    monkeypatch.setattr(settings, "SCRAPE_QUERY_MAX_BACKOFF_HOURS", 96.0)
+
+
+async def loaded(session, *queries):
+    watermarks = QueryWatermarks(session, "tavily")
+    await watermarks.load(queries)
+    return watermarks
+
+
+@pytest.mark.asyncio
+async def test_new_query_gets_full_budget_and_is_persisted(test_db_session):
+    watermarks = await loaded(test_db_session, "python jobs")
+
+    assert watermarks.limit_for("python jobs", 20) == 20
+    assert watermarks.record("python jobs", ["a", "b", "a"], now=NOW) == 2
+    await watermarks.save()
+
+    state = (await test_db_session.execute(select(ScrapeQueryState))).scalar_one()
+    assert (state.source, state.query, state.runs) == ("tavily", "python jobs", 1)
+    assert state.seen_external_ids == ["a", "b"]
+    assert state.yield_score == 1.0
+    assert state.last_new_at == NOW
+
+
+@pytest.mark.asyncio
+async def test_repeated_results_lower_yield_and_budget(test_db_session):
+    watermarks = await loaded(test_db_session, "q")
+    watermarks.record("q", [str(i) for i in range(10)], now=NOW)
+    # 1 of 10 unseen: score = 0.5 * 0.1 + 0.5 * 1.0
+    assert watermarks.record("q", [str(i) for i in range(1, 11)], now=NOW) == 1
+    assert watermarks.states["q"].yield_score == pytest.approx(0.55)
+    assert watermarks.limit_for("q", 20) == 11
+
+    watermarks.states["q"].yield_score = 0.01
+    assert watermarks.limit_for("q", 20) == settings.SCRAPE_QUERY_MIN_RESULTS
+
+
+@pytest.mark.asyncio
+async def test_empty_runs_skip_query_with_growing_backoff(test_db_session):
+    watermarks = await loaded(test_db_session, "q")
+    watermarks.record("q", ["a"], now=NOW)
+    watermarks.record("q", ["a"], now=NOW)
+    assert watermarks.limit_for("q", 20, now=NOW) > 0
+
+    watermarks.record("q", ["a"], now=NOW)
+    assert watermarks.states["q"].empty_runs == 2
+    assert watermarks.limit_for("q", 20, now=NOW + timedelta(hours=11)) == 0
+    # Backoff over: probe with the minimum budget
+    assert watermarks.limit_for("q", 20, now=NOW + timedelta(hours=12)) == 5
+
+    watermarks.record("q", [], now=NOW)
+    assert watermarks.limit_for("q", 20, now=NOW + timedelta(hours=23)) == 0
+    assert watermarks.limit_for("q", 20, now=NOW + timedelta(hours=24)) == 5
+    assert watermarks.skipped == 2
+
+    # Anything new resets the backoff
+    watermarks.record("q", ["b"], now=NOW)
+    assert watermarks.states["q"].empty_runs == 0
+    assert watermarks.limit_for("q", 20, now=NOW) > 0
+
+
+@pytest.mark.asyncio
+async def test_seen_ids_are_capped(test_db_session, monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPE_QUERY_SEEN_IDS", 3)
+    watermarks = await loaded(test_db_session, "q")
+    watermarks.record("q", ["a", "b"], now=NOW)
+    watermarks.record("q", ["c", "d"], now=NOW)
+    await watermarks.save()
+
+    reloaded = await loaded(test_db_session, "q")
+    assert reloaded.states["q"].seen_external_ids == ["b", "c", "d"]
+    assert reloaded.states["q"].runs == 2
@@ -1,6 +1,19 @@
+import dataclasses
+import os
+import threading
+import time
+from datetime import datetime, timedelta
+
+import fakeredis
 import pytest
 from unittest.mock import Mock, patch
-from src.services.resource_monitor import ResourceMonitor, ThrottleLevel, TaskType
+from redis.exceptions import RedisError
+from src.services.resource_monitor import (
+    ClusterResourceRegistry,
+    ResourceMonitor,
+    ThrottleLevel,
+    TaskType,
+)
 from src.core.config import settings
 
 
@@ -90,3 +103,192 @@ async def test_monitoring_callbacks(monitor, mock_psutil):
         monitor._running = False
 
     callback.assert_called_once()
+
+
+def test_status_snapshots_are_immutable_and_timestamped_per_sample(
+    monitor, mock_psutil
+):
+    first = monitor.sample()
+    second = monitor.sample()
+
+    with pytest.raises(dataclasses.FrozenInstanceError):
+        first.cpu_percent = 0.0
+    assert second.checked_at >= first.checked_at
+    assert first.checked_at > datetime.utcnow() - timedelta(seconds=5)
+
+
+def test_reads_are_served_from_cache_within_max_age(monitor, mock_psutil):
+    first = monitor.get_current_status()
+    mock_psutil.cpu_percent.return_value = 99.0
+
+    assert monitor.get_current_status() is first
+    assert monitor.can_run_task(TaskType.SCRAPING)
+    assert mock_psutil.cpu_percent.call_count == 1
+
+
+def _wait_for(predicate, timeout=5.0):
+    deadline = time.monotonic() + timeout
+    while not predicate():
+        assert time.monotonic() < deadline, "condition not met in time"
+        time.sleep(0.01)
+
+
+def test_stale_snapshot_is_refreshed_in_the_background(mock_psutil):
+    monitor = ResourceMonitor(max_age=0.0)
+    first = monitor.get_current_status()
+    time.sleep(0.001)
+
+    # The stale snapshot is served while the refresh runs elsewhere
+    assert monitor.get_current_status() is first
+    _wait_for(lambda: monitor.get_current_status() is not first)
+    assert mock_psutil.cpu_percent.call_count >= 2
+
+
+def test_stale_reads_never_block_on_sampling(mock_psutil):
+    monitor = ResourceMonitor(max_age=0.0)
+    first = monitor.get_current_status()
+    release = threading.Event()
+    sampled_in = []
+
+    def slow_cpu(interval=None):
+        sampled_in.append(threading.get_ident())
+        release.wait(5)
+        return 50.0
+
+    mock_psutil.cpu_percent.side_effect = slow_cpu
+    time.sleep(0.001)
+    try:
+        started = time.monotonic()
+        for _ in range(10):
+            assert monitor.get_current_status() is first
+        assert time.monotonic() - started < 0.5
+        _wait_for(lambda: sampled_in)
+    finally:
+        release.set()
+
+    # Concurrent stale reads share a single refresh
+    assert len(sampled_in) == 1
+    assert sampled_in[0] != threading.get_ident()
+
+
+def test_cpu_spike_is_smoothed(mock_psutil):
+    monitor = ResourceMonitor(cpu_alpha=0.3)
+    assert monitor.sample().cpu_percent == 50.0
+
+    mock_psutil.cpu_percent.return_value = 99.0
+    status = monitor.sample()
+    assert status.cpu_raw_percent == 99.0
+    assert status.cpu_percent == pytest.approx(64.7)
+    assert status.throttle_level == ThrottleLevel.NORMAL
+
+    # Sustained load still crosses the threshold after a few samples
+    for _ in range(5):
+        status = monitor.sample()
+    assert status.throttle_level == ThrottleLevel.HEAVY
+
+
+@pytest.mark.asyncio
+async def test_refresh_samples_off_the_event_loop(monitor, mock_psutil):
+    loop_thread = threading.get_ident()
+    sampled_in = []
+    mock_psutil.cpu_percent.side_effect = lambda interval=None: (
+        sampled_in.append(threading.get_ident()) or 50.0
+    )
+
+    status = await monitor.refresh()
+
+    assert sampled_in and sampled_in[0] != loop_thread
+    assert monitor.get_current_status() is status
+
+
+@pytest.fixture
+def fleet():
+    """Registries for separate processes sharing one fake Redis"""
+    server = fakeredis.FakeServer()
+    return lambda: ClusterResourceRegistry(fakeredis.FakeRedis(server=server))
+
+
+def _node_monitor(registry, node, mock_psutil, cpu):
+    monitor = ResourceMonitor(cluster=registry, node=node, max_age=0.0)
+    mock_psutil.cpu_percent.return_value = cpu
+    monitor.sample()
+    return monitor
+
+
+def test_cluster_view_aggregates_nodes(monkeypatch, fleet, mock_psutil):
+    monkeypatch.setattr(settings, "RESOURCE_CLUSTER_ENABLED", True)
+    _node_monitor(fleet(), "worker-b", mock_psutil, 90.0)
+    _node_monitor(fleet(), "worker-c", mock_psutil, 50.0)
+    monitor = _node_monitor(fleet(), "worker-a", mock_psutil, 50.0)
+
+    view = monitor.get_cluster_view()
+    assert set(view.nodes) == {"worker-a", "worker-b", "worker-c"}
+    assert view.nodes["worker-b"].throttle_level == ThrottleLevel.HEAVY
+    # One loaded node out of three is below quorum: it alone stops scraping
+    assert view.fleet_level == ThrottleLevel.NORMAL
+    assert view.level_for("worker-b") == ThrottleLevel.HEAVY
+    assert monitor.can_run_task(TaskType.SCRAPING)
+
+
+def test_fleet_load_throttles_healthy_node(monkeypatch, fleet, mock_psutil):
+    monkeypatch.setattr(settings, "RESOURCE_CLUSTER_ENABLED", True)
+    _node_monitor(fleet(), "worker-b", mock_psutil, 99.0)
+    monitor = _node_monitor(fleet(), "worker-a", mock_psutil, 50.0)
+
+    view = monitor.get_cluster_view()
+    assert view.fleet_level == ThrottleLevel.PAUSE
+    # Fleet pressure sheds low-priority work but never pauses a healthy node
+    assert view.effective_level == ThrottleLevel.HEAVY
+    assert not monitor.can_run_task(TaskType.SCRAPING)
+    assert monitor.can_run_task(TaskType.CLEANUP)
+    assert monitor.can_run_task(TaskType.API)
+
+
+def test_processes_on_one_node_share_its_entry(monkeypatch, fleet, mock_psutil):
+    monkeypatch.setattr(settings, "RESOURCE_CLUSTER_ENABLED", True)
+    registry = fleet()
+    status = _node_monitor(registry, "worker-a", mock_psutil, 50.0).sample()
+    with patch("src.services.resource_monitor.os.getpid", return_value=1):
+        view = registry.sync("worker-a", status)
+
+    assert view.nodes["worker-a"].processes == 2
+
+
+def test_view_tells_workers_from_api_processes(monkeypatch, fleet, mock_psutil):
+    monkeypatch.setattr(settings, "RESOURCE_CLUSTER_ENABLED", True)
+    _node_monitor(fleet(), "api-1", mock_psutil, 50.0)
+    monitor = ResourceMonitor(cluster=fleet(), node="worker-a", consumes_tasks=True)
+    monitor.sample()
+
+    nodes = monitor.get_cluster_view().to_dict()["nodes"]
+    assert nodes["worker-a"]["workers"] == 1
+    assert nodes["api-1"]["workers"] == 0
+
+
+def test_expired_processes_leave_the_index(monkeypatch, fleet, mock_psutil):
+    monkeypatch.setattr(settings, "RESOURCE_CLUSTER_ENABLED", True)
+    registry = fleet()
+    _node_monitor(registry, "worker-b", mock_psutil, 90.0)
+    monitor = _node_monitor(registry, "worker-a", mock_psutil, 50.0)
+    # worker-b stopped sampling: its key expired and its index score lapsed
+    registry.redis.delete(f"{registry.KEY_PREFIX}:worker-b:{os.getpid()}")
+    registry.redis.zadd(
+        registry.INDEX_KEY, {f"{registry.KEY_PREFIX}:worker-b:{os.getpid()}": 1}
+    )
+    registry.redis.scan_iter = Mock(side_effect=AssertionError("no SCAN"))
+
+    monitor.sample()
+
+    assert set(monitor.get_cluster_view().nodes) == {"worker-a"}
+    assert registry.redis.zcard(registry.INDEX_KEY) == 1
+
+
+def test_cluster_view_falls_back_to_local_without_redis(monkeypatch, mock_psutil):
+    monkeypatch.setattr(settings, "RESOURCE_CLUSTER_ENABLED", True)
+    broken = Mock()
+    broken.pipeline.return_value.execute.side_effect = RedisError("down")
+    monitor = ResourceMonitor(cluster=ClusterResourceRegistry(broken), node="worker-a")
+
+    view = monitor.get_cluster_view()
+    assert list(view.nodes) == ["worker-a"]
+    assert monitor.can_run_task(TaskType.SCRAPING)
@@ -0,0 +1,140 @@
+import asyncio
+import pytest
+from unittest.mock import AsyncMock, patch
+from redis.exceptions import ConnectionError as RedisConnectionError
+
+from src.core.config import settings
+from src.services.response_cache import (
+    VERSION_KEY,
+    CachedResponse,
+    ResponseCache,
+    cache_key,
+    invalidate_response_cache,
+)
+
+
+def make_loader(body=b"[]", delay=0.0):
+    calls = []
+
+    async def load():
+        calls.append(1)
+        await asyncio.sleep(delay)
+        return CachedResponse(body=body, headers={"X-Next-Cursor": "abc"})
+
+    load.calls = calls
+    return load
+
+
+def test_cache_key_normalizes_params():
+    a = cache_key(1, "jobs:list", {"limit": 50, "source": None, "skip": 0})
+    b = cache_key(1, "jobs:list", {"skip": 0, "source": None, "limit": 50})
+    assert a == b
+    assert a != cache_key(2, "jobs:list", {"skip": 0, "source": None, "limit": 50})
+    assert a != cache_key(1, "jobs:list", {"skip": 0, "source": "x", "limit": 50})
+
+
+def test_cached_response_roundtrip():
+    response = CachedResponse(body=b'{"a":\n1}', headers={"ETag": '"v1"'})
+    assert CachedResponse.loads(response.dumps()) == response
+
+
+@pytest.mark.asyncio
+async def test_hit_after_miss(fake_redis):
+    cache = ResponseCache(fake_redis)
+    load = make_loader()
+
+    first = await cache.get_or_load("jobs:list", {"limit": 50}, load)
+    second = await cache.get_or_load("jobs:list", {"limit": 50}, load)
+
+    assert first == second
+    assert second.headers == {"X-Next-Cursor": "abc"}
+    assert len(load.calls) == 1
+    ttl = await fake_redis.ttl(cache_key(0, "jobs:list", {"limit": 50}))
+    assert 0 < ttl <= settings.RESPONSE_CACHE_TTL_SECONDS
+
+
+@pytest.mark.asyncio
+async def test_invalidate_bumps_version(fake_redis):
+    cache = ResponseCache(fake_redis)
+    load = make_loader()
+    await cache.get_or_load("jobs:list", {}, load)
+
+    assert await cache.invalidate() == 1
+    await cache.get_or_load("jobs:list", {}, load)
+
+    assert len(load.calls) == 2
+    assert int(await fake_redis.get(VERSION_KEY)) == 1
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once(fake_redis):
+    cache = ResponseCache(fake_redis, poll_interval=0.01)
+    load = make_loader(delay=0.1)
+
+    results = await asyncio.gather(
+        *(cache.get_or_load("jobs:summary", {}, load) for _ in range(20))
+    )
+
+    assert len(load.calls) == 1
+    assert all(result.body == b"[]" for result in results)
+    assert not await fake_redis.keys("*:lock")
+
+
+@pytest.mark.asyncio
+async def test_waiters_fall_back_when_holder_fails(fake_redis):
+    cache = ResponseCache(fake_redis, poll_interval=0.01)
+    calls = []
+
+    async def failing():
+        calls.append(1)
+        await asyncio.sleep(0.05)
+        raise RuntimeError("db down")
+
+    holder = asyncio.create_task(cache.get_or_load("jobs:summary", {}, failing))
+    await asyncio.sleep(0.01)
+    waiter = await cache.get_or_load("jobs:summary", {}, make_loader(body=b"{}"))
+
+    assert waiter.body == b"{}"
+    with pytest.raises(RuntimeError):
+        await holder
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_redis_errors_fall_through_to_loader():
+    redis = AsyncMock()
+    redis.get.side_effect = RedisConnectionError("refused")
+    cache = ResponseCache(redis)
+    load = make_loader()
+
+    result = await cache.get_or_load("jobs:list", {}, load)
+
+    assert result.body == b"[]"
+    assert len(load.calls) == 1
+
+    redis.incr.side_effect = RedisConnectionError("refused")
+    assert await cache.invalidate() == 0
+
+
+@pytest.mark.asyncio
+async def test_disabled_cache_passes_through():
+    cache = ResponseCache(None)
+    load = make_loader()
+
+    await cache.get_or_load("jobs:list", {}, load)
+    await cache.get_or_load("jobs:list", {}, load)
+
+    assert len(load.calls) == 2
+    assert await cache.invalidate() == 0
+
+
+@pytest.mark.asyncio
+async def test_invalidate_response_cache_uses_redis_url(fake_redis, monkeypatch):
+    monkeypatch.setattr(settings, "RESPONSE_CACHE_ENABLED", True)
+    with patch("src.services.response_cache.aioredis.from_url") as from_url:
+        from_url.return_value = fake_redis
+        fake_redis.aclose = AsyncMock()
+        await invalidate_response_cache()
+
+    from_url.assert_called_once_with(settings.REDIS_URL)
+    assert int(await fake_redis.get(VERSION_KEY)) == 1
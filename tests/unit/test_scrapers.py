@@ -1,9 +1,18 @@
+import asyncio
+import sys
+import time
+import types
+import httpx
 import pytest
 from unittest.mock import Mock, AsyncMock, patch
 from src.scrapers.base import BaseScraper, ScraperConfig
-from src.scrapers.tavily import TavilyScraper
+from src.scrapers.tavily import TavilyScraper, create_scraper
 from src.scrapers.registry import ScraperRegistry
+from src.scrapers.rate_limit import TokenBucket
+from src.core.config import settings
 from src.db.models import Job
+from src.services.concurrency import concurrency_controller
+from src.services.resource_monitor import ThrottleLevel, resource_monitor
 
 
 @pytest.fixture
@@ -15,6 +24,7 @@ def mock_http():
 def mock_monitor():
     monitor = Mock()
     monitor.can_run_task.return_value = True
+    monitor.get_cluster_view.return_value.effective_level = ThrottleLevel.NORMAL
     return monitor
 
 
@@ -81,13 +91,96 @@ async def test_registry_run_all(mock_monitor):
     registry.register(scraper1)
     registry.register(scraper2)
 
-    results = await registry.run_all()
+    results = [result async for result in registry.run_all()]
 
-    assert len(results) == 1
+    assert results == [("s1", [1])]
     scraper1.fetch_jobs.assert_called()
     scraper2.fetch_jobs.assert_not_called()
 
 
+def _plugin(name, fetch_jobs):
+    class PluginScraper(BaseScraper):
+        async def fetch_jobs(self):
+            return await fetch_jobs()
+
+        def get_source_name(self):
+            return name
+
+    def factory(options):
+        monitor = Mock()
+        monitor.can_run_task.return_value = True
+        return PluginScraper(ScraperConfig(name=name, **options), Mock(), monitor)
+
+    return factory
+
+
+@pytest.mark.asyncio
+async def test_registry_run_all_streams_as_scrapers_finish():
+    registry = ScraperRegistry()
+    release_slow = asyncio.Event()
+
+    async def slow():
+        await release_slow.wait()
+        return ["slow job"]
+
+    async def fast():
+        return ["fast job"]
+
+    async def broken():
+        raise RuntimeError("boom")
+
+    registry.register_factory("slow", _plugin("slow", slow))
+    registry.register_factory("fast", _plugin("fast", fast))
+    registry.register_factory("broken", _plugin("broken", broken))
+
+    results = registry.run_all()
+    # The fast scraper is yielded while the slow one is still running
+    assert await results.__anext__() == ("fast", ["fast job"])
+    release_slow.set()
+    assert [result async for result in results] == [("slow", ["slow job"])]
+
+
+def test_registry_imports_plugin_on_first_use(monkeypatch):
+    monkeypatch.setattr(
+        settings, "SCRAPERS", {"fake": {"max_results": 7}, "off": {"enabled": False}}
+    )
+    registry = ScraperRegistry()
+    registry.register_factory("fake", "fake_plugin:create")
+    registry.register_factory("off", "missing_plugin:create")
+    module = types.ModuleType("fake_plugin")
+    module.create = _plugin("fake", AsyncMock(return_value=[]))
+
+    # Listing doesn't import: fake_plugin isn't importable yet
+    assert registry.names() == ["fake", "off"]
+    monkeypatch.setitem(sys.modules, "fake_plugin", module)
+    scraper = registry.get("fake")
+
+    assert scraper.config.max_results == 7
+    assert registry.get("fake") is scraper
+    # Disabled plugins are skipped without importing them
+    assert registry.get_all_enabled() == [scraper]
+
+
+def test_registry_load_failure_returns_none():
+    registry = ScraperRegistry()
+    registry.register_factory("missing", "no_such_module_xyz:create")
+
+    assert registry.get("missing") is None
+    assert registry.get("unknown") is None
+
+
+def test_registry_discovers_builtin_tavily(monkeypatch):
+    monkeypatch.setattr(settings, "SCRAPERS", {"tavily": {"max_results": 5}})
+    monkeypatch.setattr(settings, "TAVILY_API_KEY", "key")
+    registry = ScraperRegistry(discover=True)
+
+    assert "tavily" in registry.names()
+    scraper = registry.get("tavily")
+    assert isinstance(scraper, TavilyScraper)
+    assert scraper.config.max_results == 5
+    assert scraper.api_key == "key"
+
+
 def test_base_scraper_should_run():
     config = ScraperConfig(name="test", enabled=True)
     monitor = Mock()
@@ -113,6 +206,19 @@ def test_base_scraper_should_run():
     assert not scraper.should_run()
 
 
+def test_scrapers_share_the_process_wide_controller():
+    first = create_scraper({})
+    second = TavilyScraper(
+        ScraperConfig(name="other"), None, resource_monitor, api_key="k"
+    )
+
+    assert first.controller is concurrency_controller
+    assert second.controller is concurrency_controller
+    # A scraper on its own monitor keeps its own limits
+    isolated = TavilyScraper(ScraperConfig(name="x"), None, Mock(), api_key="k")
+    assert isolated.controller is not concurrency_controller
+
+
 @pytest.mark.asyncio
 async def test_tavily_filtering(tavily_scraper):
     response_mock = Mock()
@@ -142,3 +248,123 @@ async def test_tavily_api_key_missing(tavily_scraper):
     jobs = await tavily_scraper.fetch_jobs()
     assert len(jobs) == 0
     tavily_scraper.http.post.assert_not_called()
+
+
+def _stub_scraper(server, mock_monitor, concurrency, rpm=6000):
+    config = ScraperConfig(
+        name="tavily", max_results=10, rate_limit_rpm=rpm, max_concurrency=concurrency
+    )
+    scraper = TavilyScraper(config, httpx.AsyncClient(), mock_monitor, api_key="k")
+    scraper.base_url = f"{server.url}/search"
+    scraper.queries = [f"query {i}" for i in range(8)]
+    return scraper
+
+
+async def _timed_fetch(scraper):
+    started = time.monotonic()
+    try:
+        await scraper.fetch_jobs()
+    finally:
+        await scraper.http.aclose()
+    return time.monotonic() - started
+
+
+@pytest.mark.asyncio
+async def test_tavily_concurrency_reduces_wall_time(stub_http_server, mock_monitor):
+    stub_http_server.latency = 0.2
+
+    serial = await _timed_fetch(_stub_scraper(stub_http_server, mock_monitor, 1))
+    assert stub_http_server.max_in_flight == 1
+
+    stub_http_server.max_in_flight = 0
+    parallel = await _timed_fetch(_stub_scraper(stub_http_server, mock_monitor, 8))
+
+    assert len(stub_http_server.requests) == 16
+    assert stub_http_server.max_in_flight > 1
+    assert parallel < serial / 2
+
+
+@pytest.mark.asyncio
+async def test_tavily_in_flight_limit_shrinks_under_load(
+    stub_http_server, mock_monitor
+):
+    stub_http_server.latency = 0.05
+    mock_monitor.get_cluster_view.return_value.effective_level = ThrottleLevel.HEAVY
+
+    await _timed_fetch(_stub_scraper(stub_http_server, mock_monitor, 8))
+
+    # One HEAVY sample halves the limit of 8
+    assert len(stub_http_server.requests) == 8
+    assert stub_http_server.max_in_flight == 4
+
+
+@pytest.mark.asyncio
+async def test_tavily_rate_limit_ceiling(stub_http_server, mock_monitor):
+    # 120 rpm with a burst of 2: 8 queries need at least 3s of refill
+    scraper = _stub_scraper(stub_http_server, mock_monitor, concurrency=2, rpm=120)
+
+    elapsed = await _timed_fetch(scraper)
+
+    starts = [ts for ts, _, _ in stub_http_server.requests]
+    assert len(starts) == 8
+    assert elapsed >= 2.9
+    # Beyond the initial burst, no two requests start closer than 1/rate
+    gaps = [b - a for a, b in zip(starts[1:], starts[2:])]
+    assert min(gaps) >= 0.45
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_burst_then_refill():
+    bucket = TokenBucket(rate_per_minute=600, capacity=3)
+    started = time.monotonic()
+
+    for _ in range(5):
+        await bucket.acquire()
+
+    # 3 immediate tokens, then 2 more at 10/s
+    assert 0.15 <= time.monotonic() - started < 0.5
+
+
+@pytest.mark.asyncio
+async def test_token_bucket_refunds_cancelled_waits():
+    bucket = TokenBucket(rate_per_minute=60, capacity=1)
+    await bucket.acquire()
+
+    waiter = asyncio.create_task(bucket.acquire())
+    await asyncio.sleep(0.01)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+    # The cancelled reservation no longer delays the next caller
+    assert bucket._tokens >= 0
+
+
+@pytest.mark.asyncio
+async def test_tavily_watermarks_size_and_skip_queries(tavily_scraper):
+    response_mock = Mock()
+    response_mock.json.return_value = {
+        "results": [
+            {
+                "title": "Python Developer",
+                "content": "We are hiring a remote Python developer.",
+                "url": "http://company.com/job1",
+            }
+        ]
+    }
+    tavily_scraper.http.post.return_value = response_mock
+    tavily_scraper.queries = ["stale query", "fresh query"]
+    watermarks = Mock()
+    watermarks.load = AsyncMock()
+    watermarks.limit_for.side_effect = lambda query, max_results: (
+        0 if query == "stale query" else 3
+    )
+
+    jobs = [job async for job in tavily_scraper.stream_jobs(watermarks=watermarks)]
+
+    assert len(jobs) == 1
+    watermarks.load.assert_awaited_once_with(["stale query", "fresh query"])
+    tavily_scraper.http.post.assert_awaited_once()
+    payload = tavily_scraper.http.post.await_args.kwargs["json"]
+    assert (payload["query"], payload["max_results"]) == ("fresh query", 3)
+    watermarks.record.assert_called_once_with("fresh query", [jobs[0].external_id])
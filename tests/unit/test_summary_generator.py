@@ -1,44 +1,37 @@
 import pytest
-from unittest.mock import Mock, AsyncMock
 from datetime import datetime
 from src.services.summary_generator import SummaryGenerator
+from src.services.job_service import JobService
 from src.db.models import Job
 
 
-@pytest.fixture
-def mock_db():
-    session = AsyncMock()
-    return session
-
-
 @pytest.mark.asyncio
-async def test_generate_summary(mock_db):
-    generator = SummaryGenerator(mock_db)
+async def test_generate_summary(test_db_session):
+    generator = SummaryGenerator(test_db_session)
 
-    # Mock jobs
     jobs = [
         Job(
+            source="t",
+            external_id="1",
             title="Python Dev",
             location="Remote",
             is_remote=True,
-            tags={"skills": ["Python"]},
+            tags={"raw": ["python", "genai"]},
             fetched_at=datetime.utcnow(),
             company="A",
         ),
         Job(
+            source="t",
+            external_id="2",
             title="Java Dev",
             location="Toronto",
             is_remote=False,
-            tags={"skills": ["Java"]},
+            tags={"raw": ["java", "python"]},
             fetched_at=datetime.utcnow(),
             company="B",
         ),
     ]
-
-    # Mock db execution
-    result = Mock()
-    result.scalars.return_value.all.return_value = jobs
-    mock_db.execute.return_value = result
+    await JobService(test_db_session).bulk_upsert(jobs)
 
     summary = await generator.generate()
 
@@ -46,10 +39,11 @@ async def test_generate_summary(mock_db):
     assert summary["stats"]["remote_percentage"] == 50.0
     assert summary["stats"]["regions"]["Remote"] == 1
 
-    # Verify top skills
+    # Top skills come from labels stored at ingest time
+    assert summary["top_skills"][0] == {"name": "Python", "count": 2}
     skills = [s["name"] for s in summary["top_skills"]]
-    assert "Python" in skills
     assert "Java" in skills
+    assert summary["innovations"] == [{"name": "GenAI", "count": 1}]
 
     # Verify roles table
     assert len(summary["roles"]) == 2
@@ -57,16 +51,41 @@ async def test_generate_summary(mock_db):
 
 
 @pytest.mark.asyncio
-async def test_get_rare_jobs(mock_db):
-    generator = SummaryGenerator(mock_db)
+async def test_get_rare_jobs(test_db_session):
+    generator = SummaryGenerator(test_db_session)
 
     jobs = [
-        Job(title="Normal", tags={}),
-        Job(title="Weird", tags={"weird": ["Futurist"]}),
+        Job(source="t", external_id="1", title="Normal", tags={}),
+        Job(source="t", external_id="2", title="Weird", tags={"raw": ["futurist"]}),
     ]
+    await JobService(test_db_session).bulk_upsert(jobs)
 
-    rare = generator._get_rare_jobs(jobs)
+    rare = await generator._get_rare_jobs()
 
     assert len(rare) == 1
     assert rare[0]["title"] == "Weird"
     assert rare[0]["tags"] == ["Futurist"]
+
+
+@pytest.mark.asyncio
+async def test_summary_excludes_inactive_and_groups_regions(test_db_session):
+    generator = SummaryGenerator(test_db_session)
+    now = datetime.utcnow()
+    test_db_session.add_all(
+        [
+            Job(source="t", external_id="1", title="A", location="Toronto, ON"),
+            Job(source="t", external_id="2", title="B", location="Ottawa, Canada"),
+            Job(source="t", external_id="3", title="C", location=None),
+            Job(source="t", external_id="4", title="D", is_valid=False),
+            Job(source="t", external_id="5", title="E", deleted_at=now),
+        ]
+    )
+    await test_db_session.commit()
+
+    summary = await generator.generate()
+
+    assert summary["metadata"]["total_jobs"] == 3
+    assert summary["stats"]["remote_percentage"] == 0
+    # "canada" precedes "ottawa" in CANADA_HINTS, as in the Python loop
+    assert summary["stats"]["regions"] == {"Canada": 1, "Other": 1, "Toronto": 1}
+    assert [r["title"] for r in summary["roles"]] == ["C", "B", "A"]
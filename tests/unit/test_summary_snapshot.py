@@ -0,0 +1,142 @@
+import asyncio
+
+import pytest
+import pytest_asyncio
+from datetime import datetime, timedelta
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+from src.db.models import Base, Job, SummarySnapshot
+from src.services.job_service import JobService
+from src.services.summary_generator import SummaryGenerator
+from src.services.summary_snapshot import SummaryDelta, SummarySnapshotService
+
+
+def _job(ext_id, title, location="Toronto", is_remote=False, raw=None):
+    return Job(
+        source="t",
+        external_id=ext_id,
+        title=title,
+        location=location,
+        is_remote=is_remote,
+        tags={"raw": raw or []},
+    )
+
+
+def test_delta_apply_to_counters():
+    delta = SummaryDelta()
+    delta.add(True, "Remote", {"skills": ["Python"]})
+    delta.remove(False, "Toronto", {"skills": ["Java"]})
+
+    counters = delta.apply_to(
+        {"total": 3, "remote": 0, "regions": {"Toronto": 1}, "skills": {"Java": 1}}
+    )
+
+    assert counters["total"] == 3
+    assert counters["remote"] == 1
+    assert counters["regions"] == {"Remote": 1}
+    assert counters["skills"] == {"Python": 1}
+    assert bool(delta)
+    assert not SummaryDelta()
+
+
+@pytest.mark.asyncio
+async def test_incremental_refresh_matches_rebuild(test_db_session):
+    service = SummarySnapshotService(test_db_session)
+    jobs = JobService(test_db_session)
+    await jobs.bulk_upsert([_job("1", "Python Dev", raw=["python"])])
+    first = await service.get()
+    assert first.counters["total"] == 1
+    first_version = first.version
+
+    delta = SummaryDelta()
+    await jobs.bulk_upsert(
+        [
+            _job("1", "Python Dev", location="Remote", is_remote=True, raw=["aws"]),
+            _job("2", "GenAI Lead", raw=["genai"]),
+            _job("3", "Java Dev", raw=["java"]),
+        ],
+        delta=delta,
+    )
+    snapshot = await service.apply_delta(delta)
+
+    expected = await SummaryGenerator(test_db_session).collect_counters()
+    assert snapshot.counters == expected
+    assert snapshot.version == first_version + 1
+    assert snapshot.payload["metadata"]["total_jobs"] == 3
+    assert snapshot.payload["stats"]["remote_percentage"] == 33.3
+
+
+@pytest.mark.asyncio
+async def test_apply_delta_without_snapshot_is_noop(test_db_session):
+    delta = SummaryDelta()
+    delta.add(False, "Toronto", {})
+
+    assert await SummarySnapshotService(test_db_session).apply_delta(delta) is None
+
+
+@pytest.mark.asyncio
+async def test_stale_snapshot_is_served_without_rebuilding(test_db_session):
+    service = SummarySnapshotService(test_db_session)
+    snapshot = await service.get()
+    snapshot.built_at = datetime.utcnow() - timedelta(days=1)
+    await test_db_session.commit()
+
+    assert (await service.get()).version == 1
+    # The beat task / admin endpoint rebuild it in place
+    rebuilt = await service.rebuild()
+    assert rebuilt.version == 2
+    assert rebuilt.built_at > datetime.utcnow() - timedelta(minutes=1)
+
+
+@pytest_asyncio.fixture
+async def sessions(tmp_path):
+    """Independent sessions on one file-backed database"""
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'summary.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    yield factory
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_reads_share_one_row(sessions):
+    async with sessions() as a, sessions() as b:
+        first, second = await asyncio.gather(
+            SummarySnapshotService(a).get(), SummarySnapshotService(b).get()
+        )
+
+    assert first.id == second.id == 1
+    async with sessions() as check:
+        assert await check.scalar(select(func.count(SummarySnapshot.id))) == 1
+
+
+@pytest.mark.asyncio
+async def test_racing_deltas_are_both_applied(sessions, monkeypatch):
+    async with sessions() as setup:
+        await SummarySnapshotService(setup).get()
+
+    async with sessions() as a, sessions() as b:
+        first, second = SummarySnapshotService(a), SummarySnapshotService(b)
+        build = SummaryGenerator.build
+        raced = False
+
+        async def racing_build(self, counters):
+            nonlocal raced
+            # b reads the same version as a, then a commits first
+            if self.db is b and not raced:
+                raced = True
+                delta = SummaryDelta()
+                delta.add(False, "Toronto", {})
+                await first.apply_delta(delta)
+            return await build(self, counters)
+
+        monkeypatch.setattr(SummaryGenerator, "build", racing_build)
+        delta = SummaryDelta()
+        delta.add(True, "Remote", {})
+        snapshot = await second.apply_delta(delta)
+
+    assert raced
+    assert snapshot.version == 3
+    assert snapshot.counters["total"] == 2
+    assert snapshot.counters["regions"] == {"Toronto": 1, "Remote": 1}
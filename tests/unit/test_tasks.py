@@ -1,27 +1,38 @@
+import asyncio
+
 import pytest
-from unittest.mock import Mock, patch, AsyncMock
+from asgiref.sync import async_to_sync
+from unittest.mock import Mock, MagicMock, patch, AsyncMock
 from celery.exceptions import Retry
 from src.tasks.scraping import scrape_source, run_scrape
-from src.tasks.cleanup import run_cleanup, execute_cleanup
-from src.tasks.monitoring import check_resources
-from src.services.resource_monitor import ThrottleLevel, TaskType
+from src.tasks.cleanup import run_cleanup, execute_cleanup, execute_summary_rebuild
+from src.tasks.monitoring import check_resources, steer_low_queue_forever
+from src.tasks.export import export_parquet_snapshot, execute_export
+from src.services.resource_monitor import ThrottleLevel, TaskType, aggregate_statuses
+from src.services.job_service import UpsertResult
+from src.scrapers.base import ScraperConfig
+from src.scrapers.rate_limit import TokenBucket
+from src.scrapers.registry import ScraperRegistry
+from src.scrapers.tavily import TavilyScraper
+from src.core.config import settings
 
 # --- Wrapper Tests ---
 
 
-@patch("src.tasks.scraping.async_to_sync")
+@patch("src.tasks.scraping.run_async")
 @patch("src.tasks.scraping.run_scrape")
-def test_scrape_source_wrapper(mock_run_scrape, mock_async_to_sync):
-    mock_async_to_sync.return_value = lambda x: {"count": 10}
+def test_scrape_source_wrapper(mock_run_scrape, mock_run_async):
+    mock_run_async.return_value = {"count": 10}
 
     result = scrape_source("tavily")
     assert result == {"count": 10}
+    mock_run_async.assert_called_once_with(mock_run_scrape, "tavily")
 
 
-@patch("src.tasks.cleanup.async_to_sync")
+@patch("src.tasks.cleanup.run_async")
 @patch("src.tasks.cleanup.execute_cleanup")
-def test_run_cleanup_wrapper(mock_execute, mock_async_to_sync):
-    mock_async_to_sync.return_value = lambda: {"archived": 5}
+def test_run_cleanup_wrapper(mock_execute, mock_run_async):
+    mock_run_async.return_value = {"archived": 5}
 
     result = run_cleanup()
     assert result == {"archived": 5}
@@ -35,25 +46,153 @@ def test_run_cleanup_wrapper(mock_execute, mock_async_to_sync):
 @patch("src.tasks.scraping.resource_monitor")
 @patch("src.tasks.scraping.AsyncSessionLocal")
 @patch("src.tasks.scraping.JobService")
+@patch("src.tasks.scraping.ScrapeIngestor")
+@patch("src.tasks.scraping.QueryWatermarks")
 async def test_run_scrape_success(
-    mock_service_cls, mock_session, mock_monitor, mock_registry
+    mock_watermarks_cls,
+    mock_ingestor_cls,
+    mock_service_cls,
+    mock_session,
+    mock_monitor,
+    mock_registry,
 ):
     mock_monitor.can_run_task.return_value = True
+    mock_watermarks = AsyncMock(requests=4)
+    mock_watermarks_cls.return_value = mock_watermarks
 
-    scraper = AsyncMock()
-    scraper.fetch_jobs.return_value = [Mock(source="tavily")]
+    scraper = Mock()
     mock_registry.get.return_value = scraper
 
+    mock_ingestor = AsyncMock()
+    mock_ingestor.run.return_value = UpsertResult(inserted=1, unchanged=2)
+    mock_ingestor_cls.return_value = mock_ingestor
     mock_service = AsyncMock()
-    mock_service.upsert_batch.return_value = 1
     mock_service_cls.return_value = mock_service
+    ingest_session, wm_session = MagicMock(), MagicMock()
+    mock_session.side_effect = [ingest_session, wm_session]
 
     result = await run_scrape("tavily")
 
-    assert result["count"] == 1
+    assert result["count"] == 3
+    assert result["new"] == 1
+    assert result["unchanged"] == 2
+    assert result["requests"] == 4
     mock_registry.get.assert_called_with("tavily")
-    scraper.fetch_jobs.assert_awaited_once()
-    mock_service.upsert_batch.assert_awaited_once()
+    scraper.stream_jobs.assert_called_once_with(watermarks=mock_watermarks)
+    mock_ingestor.run.assert_awaited_once_with(scraper.stream_jobs.return_value)
+    mock_watermarks.save.assert_awaited_once()
+    # Batch commits on the ingest session never touch watermark state
+    ingest = ingest_session.__aenter__.return_value
+    mock_ingestor_cls.assert_called_once_with(ingest, "tavily")
+    mock_watermarks_cls.assert_called_once_with(
+        wm_session.__aenter__.return_value, "tavily"
+    )
+    mock_service.record_run.assert_awaited_once()
+    assert mock_service.record_run.await_args.kwargs["requests"] == 4
+
+
+@pytest.mark.asyncio
+@patch("src.tasks.scraping.scraper_registry")
+@patch("src.tasks.scraping.resource_monitor")
+@patch("src.tasks.scraping.AsyncSessionLocal")
+@patch("src.tasks.scraping.JobService")
+@patch("src.tasks.scraping.ScrapeIngestor")
+@patch("src.tasks.scraping.QueryWatermarks")
+async def test_run_scrape_failed_stream_keeps_watermarks_unsaved(
+    mock_watermarks_cls,
+    mock_ingestor_cls,
+    mock_service_cls,
+    mock_session,
+    mock_monitor,
+    mock_registry,
+):
+    mock_monitor.can_run_task.return_value = True
+    mock_watermarks_cls.return_value = AsyncMock(requests=3)
+    # Earlier batches were committed, then the scraper died mid-query
+    mock_ingestor_cls.return_value.run = AsyncMock(side_effect=RuntimeError("boom"))
+    ingest_session, wm_session = MagicMock(), MagicMock()
+    mock_session.side_effect = [ingest_session, wm_session]
+
+    with pytest.raises(RuntimeError):
+        await run_scrape("tavily")
+
+    mock_watermarks_cls.return_value.save.assert_not_awaited()
+    wm_session.__aenter__.return_value.commit.assert_not_called()
+    mock_service_cls.return_value.record_run.assert_not_called()
+
+
+@pytest.mark.asyncio
+@patch("src.tasks.scraping.scraper_registry")
+@patch("src.tasks.scraping.resource_monitor")
+@patch("src.tasks.scraping.AsyncSessionLocal")
+@patch("src.tasks.scraping.JobService")
+@patch("src.tasks.scraping.ScrapeIngestor")
+@patch("src.tasks.scraping.QueryWatermarks")
+async def test_run_scrape_nothing_fetched(
+    mock_watermarks_cls,
+    mock_ingestor_cls,
+    mock_service_cls,
+    mock_session,
+    mock_monitor,
+    mock_registry,
+):
+    mock_monitor.can_run_task.return_value = True
+    mock_watermarks_cls.return_value = AsyncMock(requests=0)
+    mock_ingestor_cls.return_value.run = AsyncMock(return_value=UpsertResult())
+
+    result = await run_scrape("tavily")
+
+    assert result == {"count": 0, "source": "tavily", "requests": 0}
+    # Empty runs still back their queries off
+    mock_watermarks_cls.return_value.save.assert_awaited_once()
+    mock_service_cls.return_value.record_run.assert_not_called()
+
+
+@patch("src.tasks.scraping.resource_monitor")
+@patch("src.tasks.scraping.AsyncSessionLocal")
+@patch("src.tasks.scraping.JobService")
+@patch("src.tasks.scraping.ScrapeIngestor")
+def test_run_scrape_reuses_cached_scraper_across_loops(
+    mock_ingestor_cls, mock_service_cls, mock_session, mock_monitor, monkeypatch
+):
+    mock_monitor.can_run_task.return_value = True
+    mock_monitor.get_cluster_view.return_value.effective_level = ThrottleLevel.NORMAL
+    monkeypatch.setattr(settings, "SCRAPE_QUERY_WATERMARKS_ENABLED", False)
+
+    async def ingest(jobs):
+        return UpsertResult(inserted=len([job async for job in jobs]))
+
+    mock_ingestor_cls.return_value.run.side_effect = ingest
+    mock_service_cls.return_value = AsyncMock()
+    http = AsyncMock()
+    http.post.return_value = Mock(
+        json=Mock(
+            return_value={
+                "results": [
+                    {
+                        "title": "Python Developer",
+                        "content": "Hiring a Python developer in Toronto.",
+                        "url": "http://company.com/job1",
+                    }
+                ]
+            }
+        )
+    )
+    scraper = TavilyScraper(
+        ScraperConfig(name="tavily"), http, mock_monitor, api_key="k"
+    )
+    # One token at a time, so concurrent queries contend for the bucket
+    scraper.rate_limiter = TokenBucket(rate_per_minute=6000, capacity=1)
+    registry = ScraperRegistry()
+    registry.register(scraper)
+
+    # Without the persistent worker loop every run gets a fresh event loop
+    with patch("src.tasks.scraping.scraper_registry", registry):
+        first = async_to_sync(run_scrape)("tavily")
+        second = async_to_sync(run_scrape)("tavily")
+
+    assert first["count"] == second["count"] == 1
+    assert http.post.await_count == 2 * len(scraper.queries)
 
 
 @pytest.mark.asyncio
@@ -69,17 +208,21 @@ async def test_run_scrape_throttled(mock_monitor):
 @patch("src.tasks.cleanup.resource_monitor")
 @patch("src.tasks.cleanup.AsyncSessionLocal")
 @patch("src.tasks.cleanup.FreshnessManager")
-async def test_execute_cleanup_success(mock_manager_cls, mock_session, mock_monitor):
+@patch("src.tasks.cleanup.invalidate_response_cache")
+async def test_execute_cleanup_success(
+    mock_invalidate, mock_manager_cls, mock_session, mock_monitor
+):
     mock_monitor.can_run_task.return_value = True
 
     mock_manager = AsyncMock()
-    mock_manager.run_cleanup_cycle.return_value = {"validated": 10}
+    mock_manager.run_cleanup_cycle.return_value = {"validated": 10, "archived": 0}
     mock_manager_cls.return_value = mock_manager
 
     result = await execute_cleanup()
 
-    assert result == {"validated": 10}
+    assert result == {"validated": 10, "archived": 0}
     mock_manager.run_cleanup_cycle.assert_awaited_once()
+    mock_invalidate.assert_awaited_once()
 
 
 @pytest.mark.asyncio
@@ -91,52 +234,195 @@ async def test_execute_cleanup_throttled(mock_monitor):
         await execute_cleanup()
 
 
+@pytest.mark.asyncio
+@patch("src.tasks.cleanup.resource_monitor")
+@patch("src.tasks.cleanup.AsyncSessionLocal")
+@patch("src.tasks.cleanup.SummarySnapshotService")
+@patch("src.tasks.cleanup.invalidate_response_cache")
+async def test_execute_summary_rebuild(
+    mock_invalidate, mock_service_cls, mock_session, mock_monitor
+):
+    mock_monitor.can_run_task.return_value = True
+    snapshot = Mock(version=4, counters={"total": 12})
+    mock_service_cls.return_value.rebuild = AsyncMock(return_value=snapshot)
+
+    result = await execute_summary_rebuild()
+
+    assert result == {"version": 4, "total_jobs": 12}
+    mock_invalidate.assert_awaited_once()
+
+
+@patch("src.tasks.export.run_async")
+@patch("src.tasks.export.execute_export")
+def test_export_parquet_snapshot_wrapper(mock_execute, mock_run_async):
+    mock_run_async.return_value = {"jobs": 3, "archived_jobs": 0}
+
+    result = export_parquet_snapshot()
+    assert result == {"jobs": 3, "archived_jobs": 0}
+
+
+@pytest.mark.asyncio
+@patch("src.tasks.export.resource_monitor")
+@patch("src.tasks.export.AsyncSessionLocal")
+@patch("src.tasks.export.ParquetSnapshotExporter")
+async def test_execute_export_success(mock_exporter_cls, mock_session, mock_monitor):
+    mock_monitor.can_run_task.return_value = True
+    mock_exporter = AsyncMock()
+    mock_exporter.export.return_value = {"jobs": 3, "archived_jobs": 1}
+    mock_exporter_cls.return_value = mock_exporter
+
+    result = await execute_export(full=True)
+
+    assert result == {"jobs": 3, "archived_jobs": 1}
+    mock_exporter.export.assert_awaited_once_with(full=True)
+    mock_monitor.can_run_task.assert_called_with(TaskType.CLEANUP)
+
+
+@pytest.mark.asyncio
+@patch("src.tasks.export.resource_monitor")
+async def test_execute_export_throttled(mock_monitor):
+    mock_monitor.can_run_task.return_value = False
+
+    with pytest.raises(Exception, match="Resource limits exceeded"):
+        await execute_export()
+
+
 # --- Monitoring Tests ---
 
 
+def _cluster_view(**nodes):
+    """Cluster view with one (throttle_level, disk_free_percent) per node"""
+    return aggregate_statuses(
+        "worker-a",
+        [
+            (
+                name,
+                {
+                    "throttle_level": level,
+                    "cpu_percent": 50.0,
+                    "disk_free_percent": disk,
+                },
+            )
+            for name, (level, disk) in nodes.items()
+        ],
+    )
+
+
 @patch("src.tasks.monitoring.resource_monitor")
 @patch("src.tasks.monitoring.emergency_disk_cleanup")
 @patch("src.tasks.monitoring.celery_app")
 def test_check_resources_emergency(mock_celery, mock_cleanup, mock_monitor):
     status = Mock()
-    status.disk_free_percent = 5.0
+    status.disk_free_percent = 50.0
     status.cpu_percent = 50.0
     status.throttle_level = 0
     status.to_dict.return_value = {}
     mock_monitor.get_current_status.return_value = status
+    # Another node is the one running out of disk
+    mock_monitor.get_cluster_view.return_value = _cluster_view(
+        **{"worker-a": (0, 50.0), "worker-b": (0, 5.0)}
+    )
 
     check_resources()
 
     mock_cleanup.apply_async.assert_called_with(queue="critical")
 
 
+@pytest.fixture
+def worker_a(monkeypatch):
+    """Run check_resources as if delivered to worker-a"""
+    monkeypatch.setattr("src.tasks.monitoring._low_queue_paused", None)
+    check_resources.push_request(hostname="celery@worker-a")
+    yield
+    check_resources.pop_request()
+
+
 @patch("src.tasks.monitoring.resource_monitor")
 @patch("src.tasks.monitoring.celery_app")
-def test_check_resources_throttle(mock_celery, mock_monitor):
+def test_check_resources_throttle(mock_celery, mock_monitor, worker_a):
     status = Mock()
     status.disk_free_percent = 50.0
     status.cpu_percent = 50.0
     status.throttle_level = 2  # HEAVY
     status.to_dict.return_value = {"throttle": 2}
     mock_monitor.get_current_status.return_value = status
+    mock_monitor.get_cluster_view.return_value = _cluster_view(
+        **{"worker-a": (2, 50.0), "worker-b": (0, 50.0), "worker-c": (0, 50.0)}
+    )
 
     result = check_resources()
 
-    assert result == {"throttle": 2}
-    mock_celery.control.cancel_consumer.assert_called_with("low")
+    assert result["throttle"] == 2
+    assert result["cluster"]["nodes"]["worker-a"]["throttle_level"] == 2
+    # The worker running the task steers itself and nobody else
+    mock_celery.control.cancel_consumer.assert_called_once_with(
+        "low", destination=["celery@worker-a"]
+    )
+    mock_celery.control.add_consumer.assert_not_called()
 
 
 @patch("src.tasks.monitoring.resource_monitor")
 @patch("src.tasks.monitoring.celery_app")
-def test_check_resources_normal(mock_celery, mock_monitor):
+def test_check_resources_leaves_other_nodes_alone(mock_celery, mock_monitor, worker_a):
+    status = Mock()
+    status.disk_free_percent = 50.0
+    status.cpu_percent = 50.0
+    status.throttle_level = 0
+    status.to_dict.return_value = {"throttle": 0}
+    mock_monitor.get_current_status.return_value = status
+    # worker-b is loaded, but only worker-b's own timer pauses worker-b
+    mock_monitor.get_cluster_view.return_value = _cluster_view(
+        **{"worker-a": (0, 50.0), "worker-b": (2, 50.0), "api-1": (0, 50.0)}
+    )
+
+    check_resources()
+
+    mock_celery.control.cancel_consumer.assert_not_called()
+    mock_celery.control.add_consumer.assert_called_once_with(
+        "low", destination=["celery@worker-a"]
+    )
+
+
+@patch("src.tasks.monitoring.resource_monitor")
+@patch("src.tasks.monitoring.celery_app")
+def test_check_resources_normal(mock_celery, mock_monitor, worker_a):
     status = Mock()
     status.disk_free_percent = 50.0
     status.cpu_percent = 50.0
     status.throttle_level = 0  # NORMAL
     status.to_dict.return_value = {"throttle": 0}
     mock_monitor.get_current_status.return_value = status
+    mock_monitor.get_cluster_view.return_value = _cluster_view(
+        **{"worker-a": (0, 50.0)}
+    )
 
     result = check_resources()
+    check_resources()
+
+    assert result["throttle"] == 0
+    # Unchanged decisions are not re-broadcast
+    mock_celery.control.add_consumer.assert_called_once_with(
+        "low", destination=["celery@worker-a"]
+    )
 
-    assert result == {"throttle": 0}
-    mock_celery.control.add_consumer.assert_called_with("low")
+
+@pytest.mark.asyncio
+@patch("src.tasks.monitoring.resource_monitor")
+@patch("src.tasks.monitoring.celery_app")
+async def test_steering_timer_acts_on_own_worker_only(
+    mock_celery, mock_monitor, monkeypatch
+):
+    monkeypatch.setattr("src.tasks.monitoring._low_queue_paused", None)
+    # Half the fleet is loaded, so this healthy worker sheds low-priority work
+    mock_monitor.get_cluster_view.return_value = _cluster_view(
+        **{"worker-a": (0, 50.0), "worker-b": (2, 50.0)}
+    )
+
+    task = asyncio.create_task(steer_low_queue_forever("celery@worker-a", 0.01))
+    await asyncio.sleep(0.1)
+    task.cancel()
+
+    mock_celery.control.cancel_consumer.assert_called_once_with(
+        "low", destination=["celery@worker-a"]
+    )
+    mock_celery.control.add_consumer.assert_not_called()
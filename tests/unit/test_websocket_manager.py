@@ -0,0 +1,138 @@
+import asyncio
+import json
+import pytest
+from unittest.mock import Mock
+
+from src.api.websockets.updates import RESYNC_MESSAGE, ConnectionManager
+
+
+class FakeWebSocket:
+    """Records sent payloads; ``delay`` simulates a slow reader"""
+
+    def __init__(self, delay=0.0, fail=False):
+        self.delay = delay
+        self.fail = fail
+        self.sent = []
+        self.accepted = False
+        self.closed_with = None
+        self.client = Mock(host="10.0.0.1", port=5000)
+
+    async def accept(self):
+        self.accepted = True
+
+    async def send_text(self, payload):
+        if self.fail:
+            raise RuntimeError("connection reset")
+        await asyncio.sleep(self.delay)
+        self.sent.append(payload)
+
+    async def close(self, code=1000):
+        self.closed_with = code
+
+
+async def _until(predicate):
+    while not predicate():
+        await asyncio.sleep(0.005)
+
+
+async def drain(sockets, count, timeout=1.0):
+    await asyncio.wait_for(
+        _until(lambda: all(len(ws.sent) >= count for ws in sockets)), timeout
+    )
+
+
+@pytest.mark.asyncio
+async def test_broadcast_encodes_once_and_sends_to_all():
+    manager = ConnectionManager()
+    sockets = [FakeWebSocket() for _ in range(3)]
+    for ws in sockets:
+        await manager.connect(ws)
+
+    queued = await manager.broadcast({"type": "jobs_changed", "removed": [1]})
+    await drain(sockets, 1)
+
+    assert queued == 3
+    assert all(ws.accepted for ws in sockets)
+    assert all(json.loads(ws.sent[0])["removed"] == [1] for ws in sockets)
+
+
+@pytest.mark.asyncio
+async def test_broadcast_does_not_wait_for_slow_clients():
+    manager = ConnectionManager(send_timeout=5.0)
+    fast, slow = FakeWebSocket(), FakeWebSocket(delay=0.2)
+    for ws in (fast, slow):
+        await manager.connect(ws)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    for i in range(3):
+        await manager.broadcast_text(str(i))
+    assert loop.time() - started < 0.05
+
+    await drain([fast], 3)
+    assert slow.sent == []
+    lag = {c["lag_seconds"] > 0 for c in manager.stats()}
+    assert lag == {True, False}
+
+    await drain([slow], 3)
+    # Each client gets messages in order
+    assert fast.sent == slow.sent == ["0", "1", "2"]
+
+
+@pytest.mark.asyncio
+async def test_full_queue_coalesces_into_resync():
+    manager = ConnectionManager(send_timeout=5.0, max_queue=3)
+    slow = FakeWebSocket(delay=0.05)
+    await manager.connect(slow)
+
+    for i in range(10):
+        await manager.broadcast_text(str(i))
+    [stats] = manager.stats()
+    assert stats["dropped"] > 0
+    assert stats["queued"] <= 3
+    assert stats["client"] == "10.0.0.1:5000"
+
+    await asyncio.wait_for(_until(lambda: slow.sent[-1:] == ["9"]), 2)
+    assert RESYNC_MESSAGE in slow.sent
+    # Newest messages survive; the backlog before the resync is gone
+    after = slow.sent[slow.sent.index(RESYNC_MESSAGE) + 1 :]
+    assert after == [str(i) for i in range(10 - len(after), 10)]
+    assert len(slow.sent) < 10
+
+
+@pytest.mark.asyncio
+async def test_stalled_and_broken_clients_are_dropped_and_closed():
+    manager = ConnectionManager(send_timeout=0.05)
+    fast, stalled = FakeWebSocket(), FakeWebSocket(delay=10)
+    broken = FakeWebSocket(fail=True)
+    for ws in (fast, stalled, broken):
+        await manager.connect(ws)
+
+    await manager.broadcast_text("{}")
+    await asyncio.wait_for(_until(lambda: len(manager.connections) == 1), 1)
+
+    assert set(manager.active_connections) == {fast}
+    assert stalled.closed_with == 1013 and broken.closed_with == 1013
+    assert fast.sent == ["{}"] and stalled.sent == []
+
+
+@pytest.mark.asyncio
+async def test_disconnect_stops_writer_and_send():
+    manager = ConnectionManager()
+    ws = FakeWebSocket()
+    connection = await manager.connect(ws)
+
+    manager.disconnect(ws)
+    manager.disconnect(ws)
+    await asyncio.sleep(0)
+
+    assert connection.writer.cancelled()
+    assert manager.send(ws, "{}") is False
+    assert await manager.broadcast({"type": "ping"}) == 0
+
+
+@pytest.mark.asyncio
+async def test_admin_websockets_reports_lag(client):
+    response = await client.get("/api/v1/admin/websockets")
+    assert response.status_code == 200
+    assert response.json() == {"connections": 0, "max_lag_seconds": 0.0, "clients": []}
@@ -0,0 +1,122 @@
+import asyncio
+import threading
+
+import pytest
+from celery.exceptions import SoftTimeLimitExceeded
+
+from src.core.http import get_http_client
+from src.core.runtime import WorkerRuntime, run_async, worker_runtime
+from workers.celery_app import _uses_worker_processes
+
+
+@pytest.fixture
+def runtime():
+    runtime = WorkerRuntime()
+    runtime.start()
+    yield runtime
+    runtime.stop()
+
+
+async def current_loop():
+    return asyncio.get_running_loop()
+
+
+async def client():
+    return get_http_client()
+
+
+def test_tasks_share_one_loop_and_http_client(runtime):
+    assert runtime.run(current_loop) is runtime.run(current_loop)
+    first, second = runtime.run(client), runtime.run(client)
+    assert first is second
+    assert not first.is_closed
+
+
+def test_run_propagates_errors(runtime):
+    async def fail(message):
+        raise ValueError(message)
+
+    with pytest.raises(ValueError, match="boom"):
+        runtime.run(fail, "boom")
+    # The loop survives a failing task
+    assert runtime.run(current_loop).is_running()
+
+
+def test_interrupted_wait_cancels_coroutine(runtime, monkeypatch):
+    cancelled = threading.Event()
+
+    async def slow():
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    # Celery raises the soft time limit in the thread waiting on the result
+    def interrupted(self, timeout=None):
+        raise SoftTimeLimitExceeded()
+
+    monkeypatch.setattr("concurrent.futures.Future.result", interrupted)
+    with pytest.raises(SoftTimeLimitExceeded):
+        runtime.run(slow)
+    assert cancelled.wait(5)
+
+
+def test_spawn_runs_in_background_until_stopped():
+    runtime = WorkerRuntime()
+    runtime.start()
+    started, cancelled = threading.Event(), threading.Event()
+
+    async def forever():
+        started.set()
+        try:
+            await asyncio.sleep(60)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    future = runtime.spawn(forever)
+    assert started.wait(5)
+    assert not future.done()
+    runtime.stop()
+
+    assert cancelled.wait(5)
+    assert future.cancelled()
+
+
+def test_stop_closes_http_client():
+    runtime = WorkerRuntime()
+    runtime.start()
+    http = runtime.run(client)
+    runtime.stop()
+
+    assert http.is_closed
+    assert not runtime.running
+    with pytest.raises(RuntimeError):
+        runtime.run(current_loop)
+
+
+def test_run_async_without_runtime_uses_fresh_loop():
+    assert not worker_runtime.running
+    first, second = run_async(current_loop), run_async(current_loop)
+    assert first is not second
+
+
+def test_run_async_uses_started_runtime():
+    worker_runtime.start()
+    try:
+        loop = worker_runtime.run(current_loop)
+        assert run_async(current_loop) is loop
+    finally:
+        worker_runtime.stop()
+
+
+def test_only_prefork_defers_runtime_to_child_processes():
+    class Worker:
+        def __init__(self, pool_cls):
+            self.pool_cls = pool_cls
+
+    assert _uses_worker_processes(Worker("prefork"))
+    assert _uses_worker_processes(Worker("celery.concurrency.prefork:TaskPool"))
+    assert not _uses_worker_processes(Worker("solo"))
+    assert not _uses_worker_processes(Worker("threads"))
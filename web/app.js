@@ -8,6 +8,8 @@ class JobIntelligenceApp {
     this.innovationsData = null;
     this.rareJobsData = null;
     this.searchQuery = '';
+    this.searchTimer = null;
+    this.wsResync = false;
     this.isLoading = true;
 
     this.translations = {
@@ -80,15 +82,19 @@ class JobIntelligenceApp {
         
         this.ws.onopen = () => {
             console.log('WebSocket connected');
+            // Events sent while we were disconnected are lost; resync once
+            if (this.wsResync) this.refreshSummary();
+            this.wsResync = true;
         };
         
         this.ws.onmessage = (event) => {
             try {
                 const data = JSON.parse(event.data);
-                if (data.type === 'jobs_updated') {
-                    this.showNotification(`New jobs from ${data.source}: ${data.count}`);
-                    this.fetchRoles(); 
-                    this.fetchSummary();
+                if (data.type === 'jobs_changed') {
+                    this.applyJobChanges(data);
+                } else if (data.type === 'resync') {
+                    // We fell behind and the server dropped queued changes
+                    this.refreshSummary();
                 }
             } catch (e) {
                 console.error('WS message error', e);
@@ -104,6 +110,55 @@ class JobIntelligenceApp {
     }
   }
 
+  applyJobChanges(event) {
+    // Patch the roles table in place from a compact change event
+    if (!this.rolesData) return;
+    const removed = new Set(event.removed);
+    const updated = new Map(event.updated.map(job => [job.id, job]));
+
+    this.rolesData = this.rolesData
+      .filter(role => !removed.has(role.id))
+      .map(role => (updated.has(role.id) ? this.toRole(updated.get(role.id)) : role));
+    // Same 50-row window the summary's roles table serves
+    this.rolesData = [...event.new.map(job => this.toRole(job)), ...this.rolesData].slice(0, 50);
+
+    this.summaryData.totalPostings = Math.max(
+      0, this.summaryData.totalPostings + event.new.length - event.removed.length
+    );
+    this.renderMetrics();
+    if (!this.searchQuery) {
+      this.filteredRoles = [...this.rolesData];
+      this.renderRolesTable();
+    }
+    if (event.new.length) {
+      this.showNotification(`New jobs from ${event.source}: ${event.new.length}`);
+    }
+  }
+
+  toRole(job) {
+    return {
+      id: job.id,
+      role: job.title,
+      company: job.company,
+      location: job.location,
+      salary: job.salary_text || 'N/A',
+      trend: 'stable',
+      skills: [],
+      source: job.source,
+      url: job.url
+    };
+  }
+
+  async refreshSummary() {
+    try {
+      await this.fetchSummary();
+      if (!this.searchQuery) this.filteredRoles = [...this.rolesData];
+      this.render();
+    } catch (e) {
+      console.warn('Summary refresh failed', e);
+    }
+  }
+
   showNotification(message) {
     const note = document.createElement('div');
     note.className = 'notification-toast';
@@ -185,7 +240,8 @@ class JobIntelligenceApp {
 
   async fetchSummary() {
     // Call the new API endpoint
-    const response = await fetch('/api/v1/jobs/summary');
+    // Revalidate against the snapshot ETag; unchanged summaries come back as 304
+    const response = await fetch('/api/v1/jobs/summary', { cache: 'no-cache' });
     if (!response.ok) throw new Error('Failed to fetch summary data');
     
     const data = await response.json();
@@ -209,6 +265,7 @@ class JobIntelligenceApp {
     // API Role: { title, company, location, posted, url, salary }
     // App Role: { role, company, location, salary, trend, skills, source, url }
     this.rolesData = data.roles.map(r => ({
+        id: r.id,
         role: r.title,
         company: r.company,
         location: r.location,
@@ -623,14 +680,31 @@ class JobIntelligenceApp {
   }
 
   filterRoles() {
+    // Search server-side against the full-text index, debounced per keystroke
+    clearTimeout(this.searchTimer);
     if (!this.searchQuery) {
       this.filteredRoles = [...this.rolesData];
-    } else {
-      this.filteredRoles = this.rolesData.filter(role => {
-        const searchable = `${role.role} ${role.company} ${role.location} ${(role.skills || []).join(' ')}`.toLowerCase();
-        return searchable.includes(this.searchQuery);
-      });
+      this.renderRolesTable();
+      return;
     }
+    this.searchTimer = setTimeout(() => this.searchRoles(this.searchQuery), 200);
+  }
+
+  async searchRoles(query) {
+    const response = await fetch(`/api/v1/jobs/search?q=${encodeURIComponent(query)}&limit=50`);
+    // Drop responses for queries the user has already typed past
+    if (query !== this.searchQuery) return;
+    const jobs = response.ok ? await response.json() : [];
+    this.filteredRoles = jobs.map(job => ({
+      role: job.title,
+      company: job.company,
+      location: job.location,
+      salary: job.salary_text,
+      trend: 'stable',
+      skills: (job.tags && job.tags.skills) || [],
+      source: job.source,
+      url: job.url
+    }));
     this.renderRolesTable();
   }
 
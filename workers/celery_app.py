@@ -1,7 +1,8 @@
 from celery import Celery
+from celery.signals import worker_init, worker_process_init, worker_process_shutdown
+from celery.signals import worker_shutdown
 from celery.schedules import crontab
-from datetime import timedelta
-import os
+from typing import Optional
 
 from src.core.config import settings
 
@@ -29,7 +30,9 @@ celery_app.conf.update(
         "src.tasks.monitoring.*": {"queue": "critical"},
         "src.tasks.scraping.*": {"queue": "default"},
         "src.tasks.cleanup.run_cleanup": {"queue": "low"},
+        "src.tasks.cleanup.rebuild_summary_snapshot": {"queue": "low"},
         "src.tasks.cleanup.emergency_disk_cleanup": {"queue": "critical"},
+        "src.tasks.export.*": {"queue": "low"},
     },
     beat_schedule={
         "scrape-tavily-every-6-hours": {
@@ -41,6 +44,14 @@ celery_app.conf.update(
             "task": "src.tasks.cleanup.run_cleanup",
             "schedule": crontab(hour=3, minute=0),
         },
+        "rebuild-summary-snapshot": {
+            "task": "src.tasks.cleanup.rebuild_summary_snapshot",
+            "schedule": float(settings.SUMMARY_SNAPSHOT_MAX_AGE_SECONDS),
+        },
+        "export-parquet-daily": {
+            "task": "src.tasks.export.export_parquet_snapshot",
+            "schedule": crontab(hour=4, minute=0),
+        },
         "check-resources-every-5-min": {
             "task": "src.tasks.monitoring.check_resources",
             "schedule": 300.0,  # 5 minutes
@@ -48,7 +59,69 @@ celery_app.conf.update(
     },
 )
 
+
+def _uses_worker_processes(worker) -> bool:
+    return "prefork" in str(getattr(worker, "pool_cls", "prefork")).lower()
+
+
+# This worker's node name (celery@<host> by default), set in worker_init
+# and inherited by forked pool processes
+_worker_name: Optional[str] = None
+
+
+def _start_runtime() -> None:
+    from src.core.runtime import worker_runtime
+    from src.services.resource_monitor import resource_monitor
+    from src.tasks.monitoring import steer_low_queue_forever
+
+    # The solo pool sends both worker_init and worker_process_init
+    if worker_runtime.running:
+        return
+    worker_runtime.start()
+    # Keep the resource snapshot fresh so task-side reads never sample
+    worker_runtime.spawn(resource_monitor.start_monitoring)
+    if _worker_name:
+        worker_runtime.spawn(steer_low_queue_forever, _worker_name)
+
+
+@worker_process_init.connect
+def start_process_runtime(**kwargs):
+    if settings.WORKER_PERSISTENT_LOOP:
+        _start_runtime()
+
+
+@worker_init.connect
+def start_worker_runtime(sender=None, **kwargs):
+    global _worker_name
+    from src.services.resource_monitor import resource_monitor
+
+    _worker_name = getattr(sender, "hostname", None)
+    resource_monitor.consumes_tasks = True
+    # solo/threads pools run tasks in this process, which never sees
+    # worker_process_init; prefork must not start a thread before forking
+    if settings.WORKER_PERSISTENT_LOOP and not _uses_worker_processes(sender):
+        _start_runtime()
+
+
+@worker_process_shutdown.connect
+@worker_shutdown.connect
+def stop_worker_runtime(**kwargs):
+    from src.core.http import shutdown_http_clients
+    from src.core.runtime import worker_runtime
+    from src.services.resource_monitor import resource_monitor
+
+    resource_monitor.stop_monitoring()
+    worker_runtime.stop()
+    # Clients left on loops created outside the runtime
+    shutdown_http_clients()
+
+
 # Auto-discover tasks
 celery_app.autodiscover_tasks(
-    ["src.tasks.scraping", "src.tasks.cleanup", "src.tasks.monitoring"]
+    [
+        "src.tasks.scraping",
+        "src.tasks.cleanup",
+        "src.tasks.monitoring",
+        "src.tasks.export",
+    ]
 )